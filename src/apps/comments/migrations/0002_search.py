@@ -0,0 +1,44 @@
+# Generated by Django 5.1.3 on 2026-10-18 11:49
+
+import apps.core.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comments", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CommentSearch",
+            fields=[
+                (
+                    "comment",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        db_constraint=False,
+                        help_text="댓글",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="search",
+                        serialize=False,
+                        to="comments.comment",
+                    ),
+                ),
+                ("tokens", apps.core.search.SearchTokensField(help_text="검색 토큰")),
+                ("rank", models.FloatField(help_text="검색 순위")),
+            ],
+            options={
+                "db_table": "comment_search",
+                "managed": False,
+            },
+        ),
+        # 한글은 tokenize() 에서 바이그램으로 분리해 저장 (unicode61 토크나이저)
+        migrations.RunSQL(
+            sql="CREATE VIRTUAL TABLE comment_search USING fts5(tokens)",
+            reverse_sql="DROP TABLE comment_search",
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.3 on 2026-10-18 11:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comments", "0002_search"),
+        ("feeds", "0004_keyset_pagination_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                condition=models.Q(("is_displayed", True), ("parent__isnull", True)),
+                fields=["feed", "-created_at"],
+                name="comment_feed_created_idx",
+            ),
+        ),
+    ]
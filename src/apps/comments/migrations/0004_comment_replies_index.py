@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-18 12:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comments", "0003_keyset_pagination_indexes"),
+        ("feeds", "0005_feed_hot_score"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["parent", "is_displayed", "created_at"],
+                name="comment_parent_created_idx",
+            ),
+        ),
+    ]
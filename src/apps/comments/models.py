@@ -1,3 +1,4 @@
+from apps.core.search import SearchTokensField
 from apps.users.models import User
 from django.db import models
 
@@ -39,6 +40,39 @@ class Comment(models.Model):
         db_table = "comments"
         verbose_name = "댓글"
         verbose_name_plural = "댓글들"
+        indexes = [
+            # 피드별 댓글 목록 (동일 일시는 rowid(id) 순)
+            models.Index(
+                fields=["feed", "-created_at"],
+                condition=models.Q(is_displayed=True, parent__isnull=True),
+                name="comment_feed_created_idx",
+            ),
+            # 부모 댓글별 답글 목록
+            models.Index(
+                fields=["parent", "is_displayed", "created_at"],
+                name="comment_parent_created_idx",
+            ),
+        ]
+
+
+class CommentSearch(models.Model):
+    """댓글 검색 인덱스 (FTS5 가상 테이블)"""
+
+    comment = models.OneToOneField(
+        Comment,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="rowid",
+        db_constraint=False,
+        related_name="search",
+        help_text="댓글",
+    )
+    tokens = SearchTokensField(help_text="검색 토큰")
+    rank = models.FloatField(help_text="검색 순위")
+
+    class Meta:
+        managed = False
+        db_table = "comment_search"
 
 
 class CommentReport(models.Model):
@@ -0,0 +1,23 @@
+from django.db.models import F, FloatField, Value
+
+from apps.core.search import SearchIndex, to_match_query
+
+comment_index = SearchIndex("comment_search")
+
+
+def index_comments(comments):
+    """표시 중인 댓글은 인덱스에 반영, 숨김 댓글은 인덱스에서 제거"""
+    comment_index.update(
+        (comment.id, comment.content) for comment in comments if comment.is_displayed
+    )
+    comment_index.delete(comment.id for comment in comments if not comment.is_displayed)
+
+
+def search_comments(queryset, text):
+    """검색어와 일치하는 댓글을 search_rank(bm25, 낮을수록 관련도 높음)와 함께 반환"""
+    match = to_match_query(text)
+    if not match:
+        return queryset.none().annotate(search_rank=Value(0.0, FloatField()))
+    return queryset.filter(search__tokens__match=match).annotate(
+        search_rank=F("search__rank")
+    )
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.comments.search import comment_index, index_comments
+
+from .models import Comment
+
+
+@receiver(post_save, sender=Comment)
+def index_comment(sender, instance, **kwargs):
+    """댓글 검색 인덱스 반영 시그널"""
+    index_comments([instance])
+
+
+@receiver(post_delete, sender=Comment)
+def unindex_comment(sender, instance, **kwargs):
+    """댓글 검색 인덱스 삭제 시그널"""
+    comment_index.delete([instance.id])
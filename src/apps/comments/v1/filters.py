@@ -0,0 +1,15 @@
+from django_filters import rest_framework as filters
+
+from apps.comments.models import Comment
+from apps.comments.search import search_comments
+
+
+class CommentFilter(filters.FilterSet):
+    q = filters.CharFilter(method="filter_q")
+
+    def filter_q(self, queryset, name, value):
+        return search_comments(queryset, value)
+
+    class Meta:
+        model = Comment
+        fields = []
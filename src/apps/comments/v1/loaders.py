@@ -0,0 +1,69 @@
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from apps.comments.models import Comment, CommentLike, CommentReport
+from apps.feeds.models import Feed
+
+# 댓글 목록에서 부모 댓글마다 미리 보여주는 답글 수 (전체는 답글 목록 API)
+REPLY_PREVIEW_SIZE = 3
+
+
+def load_comment_viewer_state(comments, user):
+    """로그인 사용자의 댓글 좋아요, 신고 여부를 관계별 한 번의 쿼리로 조회"""
+    if not user.is_authenticated:
+        return comments
+    ids = [comment.id for comment in comments]
+    liked = set(
+        CommentLike.objects.filter(user=user, comment_id__in=ids).values_list(
+            "comment_id", flat=True
+        )
+    )
+    reported = set(
+        CommentReport.objects.filter(user=user, comment_id__in=ids).values_list(
+            "comment_id", flat=True
+        )
+    )
+    for comment in comments:
+        comment.is_like = comment.id in liked
+        comment.is_reported = comment.id in reported
+    return comments
+
+
+def load_feeds(comments, identity_map):
+    """댓글 목록의 피드를 요청 단위 저장소에서 조회해 연결 (피드별 최대 한 번)"""
+    for comment in comments:
+        comment.feed = identity_map.get(Feed, comment.feed_id)
+    return comments
+
+
+def load_replies(comments, limit=REPLY_PREVIEW_SIZE, with_profile=True):
+    """부모 댓글별 앞쪽 답글 limit 개를 한 번의 쿼리로 조회해 `_replies` 에 저장"""
+    parents = {comment.id: comment for comment in comments}
+    for comment in comments:
+        comment._replies = []
+    if not parents:
+        return []
+    replies = Comment.objects.filter(parent_id__in=parents, is_displayed=True)
+    if with_profile:
+        replies = replies.select_related("user__profile")
+    replies = (
+        replies.annotate(
+            rank=Window(
+                RowNumber(),
+                partition_by=F("parent_id"),
+                order_by=[F("created_at").asc(), F("id").asc()],
+            )
+        )
+        .filter(rank__lte=limit)
+        .order_by("parent_id", "rank")
+    )
+    loaded = []
+    for reply in replies:
+        parent = parents[reply.parent_id]
+        # 부모 댓글과 같은 피드, 부모 인스턴스를 공유해 지연 조회 방지
+        reply.parent = parent
+        if Comment.feed.is_cached(parent):
+            reply.feed = parent.feed
+        parent._replies.append(reply)
+        loaded.append(reply)
+    return loaded
@@ -1,8 +1,21 @@
-from rest_framework.pagination import CursorPagination
+from apps.core.paginations import KeysetCursorPagination
 
 
-class CommentCursorPagination(CursorPagination):
+class CommentCursorPagination(KeysetCursorPagination):
     """댓글 페이지네이션"""
 
-    ordering = "-created_at"
+    ordering = ("-created_at", "-id")
     page_size = 10
+
+    def get_ordering(self, request, queryset, view):
+        # 검색 시 관련도 순 정렬
+        if request.query_params.get("q"):
+            return ("search_rank", "id")
+        return super().get_ordering(request, queryset, view)
+
+
+class ReplyCursorPagination(KeysetCursorPagination):
+    """답글 페이지네이션 (작성 순)"""
+
+    ordering = ("created_at", "id")
+    page_size = 20
@@ -0,0 +1,163 @@
+from functools import cache
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from apps.comments.models import Comment, CommentLike, CommentReport
+from apps.comments.v1.loaders import REPLY_PREVIEW_SIZE
+from apps.comments.v1.serializers import CommentSerializer
+from apps.core.fieldsets import parse_fieldset
+from apps.core.projections import (
+    BOOL,
+    DATETIME,
+    INT,
+    STR,
+    column,
+    compile_projection,
+    nested,
+    nested_lookups,
+)
+from apps.feeds.models import Feed
+from apps.users.v1.projections import PROFILE_FIELDS
+
+# 출력 키: (values() 컬럼, 표현식) - CommentSerializer 와 같은 변환
+COMMENT_COLUMNS = {
+    "id": (["id"], column("id")),
+    "parent": (["parent_id"], column("parent_id")),
+    "user_profile": (
+        nested_lookups("user__profile", PROFILE_FIELDS),
+        nested("user__profile", PROFILE_FIELDS),
+    ),
+    "feed_content": ([], '_str(x["feed_content"])'),
+    "content": (["content"], column("content", STR)),
+    "likes_count": (["likes_count"], column("likes_count", INT)),
+    "reply_count": (["reply_count"], column("reply_count", INT)),
+    "reported_count": (["reported_count"], column("reported_count", INT)),
+    "is_like": ([], 'x.get("is_like", False)'),
+    "is_reported": ([], 'x.get("is_reported", False)'),
+    "is_displayed": (["is_displayed"], column("is_displayed", BOOL)),
+    "created_at": (["created_at"], column("created_at", DATETIME)),
+    "updated_at": (["updated_at"], column("updated_at", DATETIME)),
+    "replies": ([], 'x["replies"]'),
+}
+# 페이지네이션 위치 계산, 일괄 조회에 항상 필요한 컬럼
+KEY_COLUMNS = ["id", "feed_id", "created_at"]
+
+
+@cache
+def comment_field_names():
+    """CommentSerializer 의 출력 필드 (순서 유지)"""
+    return tuple(
+        name
+        for name, field in CommentSerializer().fields.items()
+        if not field.write_only
+    )
+
+
+def requested_comment_fields(request, with_replies=False):
+    """요청의 ?fields=, ?exclude= 를 반영한 출력 필드"""
+    fields, exclude = parse_fieldset(request)
+    names = comment_field_names() + (("replies",) if with_replies else ())
+    return tuple(
+        name
+        for name in names
+        if (fields is None or name in fields) and name not in exclude
+    )
+
+
+@cache
+def comment_projection(names):
+    return compile_projection(
+        "comment_row", [(name, COMMENT_COLUMNS[name][1]) for name in names]
+    )
+
+
+def comment_lookups(names, queryset=None):
+    lookups = dict.fromkeys(KEY_COLUMNS)
+    for name in names:
+        lookups.update(dict.fromkeys(COMMENT_COLUMNS[name][0]))
+    if queryset is not None and "search_rank" in queryset.query.annotations:
+        lookups["search_rank"] = None
+    return list(lookups)
+
+
+def project_comments(queryset, names):
+    """응답에 필요한 컬럼만 values() 로 조회하는 쿼리셋"""
+    return queryset.values(*comment_lookups(names, queryset))
+
+
+def plan_viewer_state_rows(ids, user):
+    """로그인 사용자의 댓글별 좋아요, 신고 여부 {id: {"is_like", "is_reported"}}"""
+    if not user.is_authenticated or not ids:
+        return {}
+    liked = yield CommentLike.objects.filter(user=user, comment_id__in=ids).values_list(
+        "comment_id", flat=True
+    )
+    reported = yield CommentReport.objects.filter(
+        user=user, comment_id__in=ids
+    ).values_list("comment_id", flat=True)
+    liked, reported = set(liked), set(reported)
+    return {pk: {"is_like": pk in liked, "is_reported": pk in reported} for pk in ids}
+
+
+def plan_reply_rows(parent_ids, names, limit=REPLY_PREVIEW_SIZE):
+    """부모 댓글별 앞쪽 답글 limit 개의 values() 행 {부모 id: [행]}"""
+    replies = {pk: [] for pk in parent_ids}
+    if not parent_ids:
+        return replies
+    rows = yield (
+        Comment.objects.filter(parent_id__in=parent_ids, is_displayed=True)
+        .annotate(
+            rank=Window(
+                RowNumber(),
+                partition_by=F("parent_id"),
+                order_by=[F("created_at").asc(), F("id").asc()],
+            )
+        )
+        .filter(rank__lte=limit)
+        .order_by("parent_id", "rank")
+        .values(*dict.fromkeys([*comment_lookups(names), "parent_id"]))
+    )
+    for row in rows:
+        replies[row["parent_id"]].append(row)
+    return replies
+
+
+def plan_feed_contents(feed_ids):
+    """피드별 내용 {uuid: content}"""
+    if not feed_ids:
+        return {}
+    rows = yield Feed.objects.filter(pk__in=feed_ids).values_list("uuid", "content")
+    return dict(rows)
+
+
+def render_comments(rows, user, names):
+    """values() 행을 CommentListSerializer 와 같은 dict 목록으로 변환하는 조회 계획"""
+    rows = list(rows)
+    with_replies = "replies" in names
+    reply_names = tuple(name for name in names if name != "replies")
+    replies = {}
+    if with_replies:
+        replies = yield from plan_reply_rows([row["id"] for row in rows], reply_names)
+    all_rows = rows + [reply for group in replies.values() for reply in group]
+
+    extras = {row["id"]: {} for row in all_rows}
+    if "feed_content" in names:
+        contents = yield from plan_feed_contents(
+            list({row["feed_id"] for row in all_rows})
+        )
+        for row in all_rows:
+            extras[row["id"]]["feed_content"] = contents[row["feed_id"]]
+    if "is_like" in names or "is_reported" in names:
+        states = yield from plan_viewer_state_rows(list(extras), user)
+        for pk, state in states.items():
+            extras[pk].update(state)
+
+    if with_replies:
+        reply_row = comment_projection(reply_names)
+        for row in rows:
+            extras[row["id"]]["replies"] = [
+                reply_row(reply, extras[reply["id"]]) for reply in replies[row["id"]]
+            ]
+    comment_row = comment_projection(names)
+    return [comment_row(row, extras[row["id"]]) for row in rows]
@@ -1,16 +1,27 @@
 from html import escape
 
-from django.db import transaction
-from django.db.models import Exists, OuterRef
+from django.db import models
 from rest_framework import serializers, exceptions
 
 from apps.comments.models import Comment, CommentLike, CommentReport
 from apps.comments.v1.fields import CurrentComment
+from apps.comments.v1.loaders import (
+    REPLY_PREVIEW_SIZE,
+    load_comment_viewer_state,
+    load_feeds,
+    load_replies,
+)
+from apps.core import counters
+from apps.core.fieldsets import SparseFieldsetMixin
+from apps.core.identity import IdentityMap, get_identity_map
+from apps.core.writes import atomic_write
+from apps.feeds.models import Feed
 from apps.feeds.v1.fields import CurrentFeed
+from apps.users.models import ProhibitedWord
 from apps.users.v1.serializers import UserProfileSerializer
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """댓글 시리얼라이저"""
 
     feed_content = serializers.CharField(
@@ -27,30 +38,32 @@ class CommentSerializer(serializers.ModelSerializer):
     )
 
     def validate_content(self, attr):
+        # 금지어 필터링
+        if ProhibitedWord.find_word(attr):
+            raise exceptions.ValidationError("내용에 금지어가 포함되어 있습니다.")
         return escape(attr, quote=True)
 
     def validate_feed(self, attr):
-        if attr and self.instance and self.instance.feed != attr:
+        # FK 값으로 비교해 기존 피드를 다시 조회하지 않음
+        if attr and self.instance and self.instance.feed_id != attr.pk:
             raise exceptions.ValidationError("피드는 수정할 수 없습니다.")
         return attr
 
     def validate_parent(self, attr):
-        if attr and self.instance and self.instance.parent != attr:
+        if attr and self.instance and self.instance.parent_id != attr.pk:
             raise exceptions.ValidationError("부모 댓글은 수정할 수 없습니다.")
         return attr
 
-    @transaction.atomic
+    @atomic_write
     def create(self, validated_data):
         # 댓글 생성
         instance = super().create(validated_data)
-        # 댓글 수 증가
-        if instance.parent is None:
-            instance.feed.comments_count = instance.feed.comments_count + 1
-            instance.feed.save()
-        # 부모 댓글의 답글 수 증가
-        if instance.parent:
-            instance.parent.reply_count = instance.parent.reply_count + 1
-            instance.parent.save()
+        if instance.parent_id is None:
+            # 피드의 댓글 수 증가
+            counters.increment(Feed, instance.feed_id, "comments_count")
+        else:
+            # 부모 댓글의 답글 수 증가
+            counters.increment(Comment, instance.parent_id, "reply_count")
         return instance
 
     class Meta:
@@ -84,26 +97,67 @@ class CommentSerializer(serializers.ModelSerializer):
         ]
 
 
+class ReplyPageSerializer(serializers.ListSerializer):
+    """답글 페이지 시리얼라이저"""
+
+    def load_children(self, comments):
+        """함께 조회할 하위 댓글 (좋아요/신고 여부 조회 대상)"""
+        return []
+
+    def to_representation(self, data):
+        comments = list(data.all() if isinstance(data, models.Manager) else data)
+        # 페이지 단위로 피드, 하위 댓글, 좋아요/신고 여부 일괄 조회 (요청한 필드만)
+        request = self.context.get("request")
+        if self.child.is_field_requested("feed_content"):
+            identity_map = get_identity_map(request) if request else IdentityMap()
+            load_feeds(comments, identity_map)
+        children = self.load_children(comments)
+        if request and (
+            self.child.is_field_requested("is_like")
+            or self.child.is_field_requested("is_reported")
+        ):
+            load_comment_viewer_state(comments + children, request.user)
+        return super().to_representation(comments)
+
+
+class CommentPageSerializer(ReplyPageSerializer):
+    """댓글 페이지 시리얼라이저"""
+
+    def load_children(self, comments):
+        if not self.child.is_field_requested("replies"):
+            return []
+        return load_replies(
+            comments, with_profile=self.child.is_field_requested("user_profile")
+        )
+
+
+class ReplySerializer(CommentSerializer):
+    """답글 시리얼라이저"""
+
+    class Meta(CommentSerializer.Meta):
+        list_serializer_class = ReplyPageSerializer
+
+
 class CommentListSerializer(CommentSerializer):
-    """댓글 리스트 시리얼라이저"""
+    """댓글 리스트 시리얼라이저 (답글은 미리보기만 포함)"""
 
     def to_representation(self, instance):
         ret = super().to_representation(instance)
-        if self.context.get("request").user.is_authenticated:
-            annotated_replies = instance.replies.all().annotate(
-                is_like=Exists(
-                    CommentLike.objects.filter(
-                        comment=OuterRef("pk"), user=self.context["request"].user
-                    )
-                )
-            )
-        else:
-            annotated_replies = instance.replies.all()
+        if not self.is_field_requested("replies"):
+            return ret
+        replies = getattr(instance, "_replies", None)
+        if replies is None:
+            replies = instance.replies.filter(is_displayed=True).order_by(
+                "created_at", "id"
+            )[:REPLY_PREVIEW_SIZE]
         ret["replies"] = CommentSerializer(
-            annotated_replies, many=True, context=self.context
+            replies, many=True, context=self.context
         ).data
         return ret
 
+    class Meta(CommentSerializer.Meta):
+        list_serializer_class = CommentPageSerializer
+
 
 class CommentLikeSerializer(serializers.ModelSerializer):
     """댓글 좋아요 시리얼라이저"""
@@ -121,23 +175,20 @@ class CommentLikeSerializer(serializers.ModelSerializer):
         ).first()
         return data
 
-    @transaction.atomic
+    @atomic_write
     def create(self, validated_data):
         # 댓글 좋아요
         instance = super().create(validated_data)
         # 좋아요 수 증가
-        instance.comment.likes_count = instance.comment.likes_count + 1
-        instance.comment.save()
+        counters.increment(Comment, instance.comment_id, "likes_count")
         return instance
 
-    @transaction.atomic
+    @atomic_write
     def update(self, instance, validated_data):
         # 댓글 좋아요 취소
         instance.delete()
         # 좋아요 수 감소
-        comment = validated_data.get("comment")
-        comment.likes_count = comment.likes_count - 1 if comment.likes_count > 0 else 0
-        comment.save()
+        counters.decrement(Comment, instance.comment_id, "likes_count")
         return {"is_like": False}
 
     class Meta:
@@ -155,12 +206,11 @@ class CommentReportSerializer(serializers.ModelSerializer):
     comment = serializers.HiddenField(default=CurrentComment())
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
-    @transaction.atomic
+    @atomic_write
     def create(self, validated_data):
         instance = super().create(validated_data)
         # 신고 수 증가
-        instance.comment.reported_count += 1
-        instance.comment.save()
+        counters.increment(Comment, instance.comment_id, "reported_count")
         return instance
 
     class Meta:
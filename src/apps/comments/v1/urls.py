@@ -1,6 +1,11 @@
 from django.urls import path
 
-from .views import CommentViewSet, CommentReportViewSet, CommentLikeViewSet
+from .views import (
+    CommentViewSet,
+    CommentReportViewSet,
+    CommentLikeViewSet,
+    ReplyViewSet,
+)
 
 urlpatterns = [
     path(
@@ -24,6 +29,11 @@ urlpatterns = [
         ),
         name="comment",
     ),
+    path(
+        "feeds/<str:feed_uuid>/comments/<str:comment_id>/replies/",
+        ReplyViewSet.as_view({"get": "list"}),
+        name="comment-replies",
+    ),
     path(
         "feeds/<str:feed_uuid>/comments/<str:comment_id>/like/",
         CommentLikeViewSet.as_view({"post": "create"}),
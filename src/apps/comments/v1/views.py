@@ -1,21 +1,42 @@
-from django.db import transaction
-from django.db.models import Exists, OuterRef
+from asgiref.sync import sync_to_async
+from django.http import Http404
 from rest_framework import viewsets, mixins
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
-from rest_framework.throttling import ScopedRateThrottle
 
 from apps.comments.models import Comment, CommentLike, CommentReport
-from apps.comments.v1.paginations import CommentCursorPagination
+from apps.comments.v1.filters import CommentFilter
+from apps.comments.v1.paginations import (
+    CommentCursorPagination,
+    ReplyCursorPagination,
+)
+from apps.comments.v1.projections import (
+    project_comments,
+    render_comments,
+    requested_comment_fields,
+)
 from apps.comments.v1.serializers import (
     CommentSerializer,
     CommentLikeSerializer,
     CommentReportSerializer,
     CommentListSerializer,
+    ReplySerializer,
 )
+from apps.core import counters
+from apps.core.asyncviews import AsyncReadMixin
+from apps.core.fieldsets import field_requested
+from apps.core.identity import IdentityMapMixin
+from apps.core.projections import FastReadPathMixin
+from apps.core.routers import ReplicaReadMixin
+from apps.core.throttling import ScopedTokenBucketThrottle
+from apps.core.writes import atomic_write
 from apps.feeds.models import Feed
 
 
 class CommentViewSet(
+    AsyncReadMixin,
+    ReplicaReadMixin,
+    IdentityMapMixin,
+    FastReadPathMixin,
     viewsets.GenericViewSet,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
@@ -27,43 +48,30 @@ class CommentViewSet(
     queryset = Comment.objects.filter(is_displayed=True)
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    filterset_class = CommentFilter
     throttle_scope = "comment:create"
     pagination_class = CommentCursorPagination
+    identity_map_relations = ("user",)
 
     def get_current_feed(self):
-        return Feed.objects.get(uuid=self.kwargs["feed_uuid"])
+        return self.identity_map.get(Feed, self.kwargs["feed_uuid"])
 
     def get_throttles(self):
         if self.action == "create":
-            return [ScopedRateThrottle()]
+            return [ScopedTokenBucketThrottle()]
         return super().get_throttles()
 
     def get_queryset(self):
         feed_uuid = self.kwargs.get("feed_uuid")
         queryset = super().get_queryset().filter(feed__uuid=feed_uuid)
         if self.action == "list":
-            queryset = (
-                queryset.select_related("user__profile")
-                .prefetch_related("replies")
-                .filter(parent=None)
-            )
+            # 피드, 답글은 CommentPageSerializer 에서 페이지 단위로 일괄 조회
+            queryset = queryset.filter(parent=None)
+            if field_requested(self.request, "user_profile"):
+                queryset = queryset.select_related("user__profile")
         elif self.action in ["update", "partial_update", "destroy"]:
             # 직접 작성한 피드만 수정, 삭제 가능
             queryset = queryset.filter(user=self.request.user)
-        if self.action in "list" and self.request.user.is_authenticated:
-            # 로그인 사용자의 경우 좋아요 여부
-            queryset = queryset.prefetch_related("likes").annotate(
-                is_like=Exists(
-                    CommentLike.objects.filter(
-                        comment=OuterRef("pk"), user=self.request.user
-                    )
-                ),
-                is_reported=Exists(
-                    CommentReport.objects.filter(
-                        comment=OuterRef("pk"), user=self.request.user
-                    )
-                ),
-            )
         return queryset
 
     def get_serializer_class(self):
@@ -71,51 +79,105 @@ class CommentViewSet(
             return CommentListSerializer
         return CommentSerializer
 
+    def get_read_fields(self):
+        return requested_comment_fields(self.request, with_replies=True)
+
+    def project_rows(self, queryset, names):
+        return project_comments(queryset, names)
+
+    def render_rows(self, rows, names):
+        return render_comments(rows, self.request.user, names)
+
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
 
     def list(self, request, *args, **kwargs):
+        if self.use_fast_read_path():
+            return self.fast_list(request, *args, **kwargs)
         return super().list(request, *args, **kwargs)
 
+    async def alist(self, request, *args, **kwargs):
+        if self.use_fast_read_path():
+            return await self.afast_list(request, *args, **kwargs)
+        return await sync_to_async(super().list)(request, *args, **kwargs)
+
     def update(self, request, *args, **kwargs):
         return super().update(request, *args, **kwargs)
 
     def partial_update(self, request, *args, **kwargs):
         return super().partial_update(request, *args, **kwargs)
 
-    @transaction.atomic
+    @atomic_write
     def perform_destroy(self, instance):
-        # 피드의 댓글 수 감소
-        if instance.parent is None:
-            instance.feed.comments_count -= 1 if instance.feed.comments_count > 0 else 0
-            instance.feed.save()
-        # 부모 댓글의 답글 수 감소
-        if instance.parent:
-            instance.parent.reply_count -= 1 if instance.parent.reply_count > 0 else 0
-            instance.parent.save()
+        if instance.parent_id is None:
+            # 피드의 댓글 수 감소
+            counters.decrement(Feed, instance.feed_id, "comments_count")
+        else:
+            # 부모 댓글의 답글 수 감소
+            counters.decrement(Comment, instance.parent_id, "reply_count")
         return super().perform_destroy(instance)
 
     def destroy(self, request, *args, **kwargs):
         return super().destroy(request, *args, **kwargs)
 
 
-class CommentLikeViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
+class ReplyViewSet(
+    ReplicaReadMixin,
+    IdentityMapMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+):
+    """답글 뷰셋"""
+
+    queryset = Comment.objects.filter(is_displayed=True)
+    serializer_class = ReplySerializer
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = ReplyCursorPagination
+
+    def get_current_comment(self):
+        feed = self.identity_map.get(Feed, self.kwargs["feed_uuid"])
+        comment = self.identity_map.get(Comment, self.kwargs["comment_id"])
+        # 해당 피드의 표시 중인 부모 댓글만 허용
+        if (
+            comment.feed_id != feed.pk
+            or comment.parent_id is not None
+            or not comment.is_displayed
+        ):
+            raise Http404("댓글을 찾을 수 없습니다.")
+        return comment
+
+    def get_queryset(self):
+        parent = self.get_current_comment()
+        queryset = super().get_queryset().filter(parent=parent)
+        if field_requested(self.request, "user_profile"):
+            queryset = queryset.select_related("user__profile")
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+class CommentLikeViewSet(
+    IdentityMapMixin, viewsets.GenericViewSet, mixins.CreateModelMixin
+):
     """댓글 좋아요 뷰셋"""
 
     queryset = CommentLike.objects.all()
     serializer_class = CommentLikeSerializer
     permission_classes = [IsAuthenticated]
     throttle_scope = "comment_like:all"
-    throttle_classes = [ScopedRateThrottle]
+    throttle_classes = [ScopedTokenBucketThrottle]
 
     def get_current_comment(self):
-        return Comment.objects.get(pk=self.kwargs["comment_id"])
+        return self.identity_map.get(Comment, self.kwargs["comment_id"])
 
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
 
 
-class CommentReportViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
+class CommentReportViewSet(
+    IdentityMapMixin, viewsets.GenericViewSet, mixins.CreateModelMixin
+):
     """댓글 신고 뷰셋"""
 
     queryset = CommentReport.objects.all()
@@ -123,7 +185,7 @@ class CommentReportViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
     permission_classes = [IsAuthenticated]
 
     def get_current_comment(self):
-        return Comment.objects.get(pk=self.kwargs["comment_id"])
+        return self.identity_map.get(Comment, self.kwargs["comment_id"])
 
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
@@ -0,0 +1,117 @@
+from functools import update_wrapper
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from apps.core.renderers import FastJSONRenderer
+
+
+class AsyncReadMixin:
+    """GET 요청을 async 메서드(a<액션>)로 처리하는 뷰셋 믹스인
+
+    settings.ASYNC_READ_VIEWS 가 켜져 있으면 as_view() 가 async 뷰를 반환합니다.
+    GET 은 이벤트 루프에서 async ORM, async 캐시로 처리해 요청마다 스레드를 점유하지 않고,
+    그 외 메서드는 기존 동기 뷰를 스레드에서 실행합니다.
+    인증, 권한 확인이나 async 메서드에서 발생한 404, 검증 오류 등은 handle_exception() 으로
+    바로 오류 응답을 만듭니다. JSON 이 아닌 렌더러(Browsable API 등)로 협상된 요청이나
+    async 메서드가 None 을 반환한 경우에만 동기 뷰가 같은 요청을 처리합니다.
+    """
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        read_action = (actions or {}).get("get")
+        if not settings.ASYNC_READ_VIEWS or not hasattr(cls, f"a{read_action}"):
+            return view
+        sync_view = sync_to_async(view)
+
+        async def async_view(request, *args, **kwargs):
+            if request.method == "GET":
+                response = await cls.adispatch_read(
+                    request, read_action, actions, initkwargs, args, kwargs
+                )
+                if response is not None:
+                    return response
+            return await sync_view(request, *args, **kwargs)
+
+        # cls, initkwargs, actions, csrf_exempt 등 DRF 뷰 속성 유지
+        return update_wrapper(async_view, view)
+
+    def check_throttles(self, request):
+        # async 경로에서는 initial() 뒤에 acheck_throttles() 로 확인
+        if not getattr(self, "_athrottles", False):
+            super().check_throttles(request)
+
+    async def acheck_throttles(self, request):
+        """check_throttles 의 async 버전 (aallow_request 가 없는 제한은 스레드에서 확인)"""
+        durations = []
+        for throttle in self.get_throttles():
+            if hasattr(throttle, "aallow_request"):
+                allowed = await throttle.aallow_request(request, self)
+            else:
+                allowed = await sync_to_async(throttle.allow_request)(request, self)
+            if not allowed:
+                durations.append(throttle.wait())
+        if durations:
+            self.throttled(
+                request, max((d for d in durations if d is not None), default=None)
+            )
+
+    def _renders_json(self):
+        # 콘텐츠 협상 전에 실패했으면 accepted_renderer 가 없음
+        renderer = getattr(self.request, "accepted_renderer", None)
+        return isinstance(renderer, JSONRenderer)
+
+    @classmethod
+    async def adispatch_read(cls, request, action, actions, initkwargs, args, kwargs):
+        request.user = await request.auser()
+        self = cls(**initkwargs)
+        self.action_map = {"head": action, **actions}
+        for method, method_action in self.action_map.items():
+            setattr(self, method, getattr(self, method_action))
+        self.action = action
+        self.args = args
+        self.kwargs = kwargs
+        self.headers = self.default_response_headers
+        self.request = Request(
+            request,
+            parsers=self.get_parsers(),
+            authenticators=self.get_authenticators(),
+        )
+        # 세션 인증은 request.auser() 로 마쳤으므로 결과만 기록
+        # (권한 오류를 동기 뷰와 같이 401/403 으로 구분하도록)
+        self.request.user = request.user
+        self.request.auth = None
+        self.request._authenticator = (
+            self.request.authenticators[0] if request.user.is_authenticated else None
+        )
+        try:
+            # 콘텐츠 협상, 권한 확인 (인증은 위에서 완료되어 DB 조회 없음)
+            self._athrottles = True
+            self.initial(self.request)
+            # 요청 제한 저장소 쓰기는 이벤트 루프를 막지 않도록 따로 확인
+            await self.acheck_throttles(self.request)
+            if not self._renders_json():
+                # Browsable API 등은 동기 뷰에서 렌더링
+                return None
+            response = await getattr(self, f"a{action}")(self.request, *args, **kwargs)
+        except (APIException, Http404) as exc:
+            if not self._renders_json():
+                return None
+            # 오류 응답도 스레드 전환이나 요청 재실행 없이 바로 생성
+            response = self.handle_exception(exc)
+        if response is None:
+            return None
+
+        self.request.accepted_renderer = FastJSONRenderer()
+        response = self.finalize_response(self.request, response, *args, **kwargs)
+        response.render()
+        # 렌더링이 끝난 일반 응답으로 반환 (핸들러가 render() 를 스레드에서 다시 호출하지 않도록)
+        rendered = HttpResponse(response.content, status=response.status_code)
+        for header, value in response.items():
+            rendered[header] = value
+        return rendered
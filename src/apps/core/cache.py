@@ -0,0 +1,477 @@
+import pickle
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+# 워커 간 공유 저장소(L2)에만 두는 내부 키
+_GENERATION_KEY = "tiered:generation:{}"
+_STATS_KEY = "tiered:stats:{}:{}"
+_STATS_NAMESPACES_KEY = "tiered:stats:namespaces"
+_STATS_KINDS = ("l1", "l2", "miss")
+
+
+def namespace(key):
+    """키의 앞 두 구간 (예: feed:generation, feed_category:list)"""
+    return ":".join(str(key).split(":", 2)[:2])
+
+
+class _LocalStore:
+    """프로세스의 L1 항목, 세대 값, 통계 (같은 설정의 캐시 인스턴스가 모두 공유)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.l1 = OrderedDict()
+        self.generations = {}
+        self.stats = Counter()
+        self.stats_flushed_at = time.monotonic()
+
+
+# Django 의 caches 는 스레드, async 작업마다 인스턴스를 새로 만들기 때문에
+# 인스턴스에 L1 을 두면 요청마다 빈 L1 로 시작함 -> 프로세스 단위로 보관
+_local_stores = {}
+_local_stores_lock = threading.Lock()
+
+
+def _local_store(key):
+    with _local_stores_lock:
+        return _local_stores.setdefault(key, _LocalStore())
+
+
+class TieredCache(BaseCache):
+    """프로세스 메모리(L1) + 공유 저장소(L2) 2단 캐시
+
+    L1 은 프로세스 안의 모든 인스턴스(스레드, async 작업)가 공유합니다.
+    L1 항목은 저장 당시 네임스페이스의 세대 값과 함께 보관합니다.
+    값을 바꾸는 쓰기(set, delete)는 L2 의 네임스페이스 세대 값을 올리고,
+    각 워커는 SYNC_INTERVAL 초마다 세대 값을 확인해 이전 세대의 L1 항목을 버립니다.
+    add 는 없는 키에만 쓰므로 세대 값을 올리지 않습니다.
+    incr 는 해당 키의 L1 만 갱신합니다. 대신 정수 값은 L1 에 SYNC_INTERVAL 초까지만
+    두므로 다른 워커의 incr 도 그 안에 반영됩니다.
+    (세대 키, 카운터처럼 자주 올리는 값 때문에 네임스페이스 전체가 무효화되지 않도록)
+
+    OPTIONS:
+    - L2: 공유 캐시 별칭 (기본값: shared)
+    - L1_MAX_ENTRIES: 워커별 L1 최대 항목 수
+    - L1_TIMEOUT: L1 최대 유지 시간 (초)
+    - SYNC_INTERVAL: 세대 값 확인 및 통계 반영 주기 (초)
+    """
+
+    def __init__(self, location, params):
+        options = params.get("OPTIONS", {})
+        super().__init__(params)
+        self._l2_alias = options.get("L2", "shared")
+        self._l1_max_entries = options.get("L1_MAX_ENTRIES", 1_000)
+        self._l1_timeout = options.get("L1_TIMEOUT", 60)
+        self._sync_interval = options.get("SYNC_INTERVAL", 1)
+        self._local = _local_store(
+            (location, self._l2_alias, self.key_prefix, self.version)
+        )
+
+    @property
+    def shared(self):
+        """L2 캐시 (읽고 고쳐 쓰는 경우 최신 값 조회용)"""
+        return caches[self._l2_alias]
+
+    # 세대 값
+
+    def _generation(self, ns):
+        now = time.monotonic()
+        cached = self._local.generations.get(ns)
+        if cached and now - cached[1] < self._sync_interval:
+            return cached[0]
+        generation = self.shared.get(_GENERATION_KEY.format(ns))
+        if generation is None:
+            # 공유 저장소에서 밀려나도 이전 세대와 겹치지 않도록 현재 시각으로 시작
+            self.shared.add(_GENERATION_KEY.format(ns), time.time_ns(), timeout=None)
+            generation = self.shared.get(_GENERATION_KEY.format(ns))
+        with self._local.lock:
+            self._local.generations[ns] = (generation, now)
+        self._flush_stats(now)
+        return generation
+
+    def _invalidate(self, ns):
+        key = _GENERATION_KEY.format(ns)
+        try:
+            generation = self.shared.incr(key)
+        except ValueError:
+            generation = time.time_ns()
+            self.shared.set(key, generation, timeout=None)
+        with self._local.lock:
+            self._local.generations[ns] = (generation, time.monotonic())
+        return generation
+
+    # L1
+
+    def _l1_get(self, l1_key, generation):
+        local = self._local
+        with local.lock:
+            item = local.l1.get(l1_key)
+            if item is None:
+                return None
+            expires_at, item_generation, value = item
+            if item_generation != generation or expires_at <= time.monotonic():
+                del local.l1[l1_key]
+                return None
+            local.l1.move_to_end(l1_key)
+        # 호출한 쪽에서 값을 바꿔도 L1 이 오염되지 않도록 pickle 로 보관
+        return (pickle.loads(value),)
+
+    def _l1_set(self, l1_key, value, timeout, generation):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        timeout = (
+            self._l1_timeout if timeout is None else min(timeout, self._l1_timeout)
+        )
+        if type(value) is int:
+            timeout = min(timeout, self._sync_interval)
+        if timeout <= 0:
+            return self._l1_delete(l1_key)
+        item = (
+            time.monotonic() + timeout,
+            generation,
+            pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+        )
+        local = self._local
+        with local.lock:
+            local.l1[l1_key] = item
+            local.l1.move_to_end(l1_key)
+            while len(local.l1) > self._l1_max_entries:
+                local.l1.popitem(last=False)
+
+    def _l1_delete(self, l1_key):
+        with self._local.lock:
+            self._local.l1.pop(l1_key, None)
+
+    # 통계
+
+    def _record(self, ns, kind):
+        with self._local.lock:
+            self._local.stats[ns, kind] += 1
+
+    def _flush_stats(self, now, force=False):
+        local = self._local
+        if not force and now - local.stats_flushed_at < self._sync_interval * 10:
+            return
+        with local.lock:
+            stats, local.stats = local.stats, Counter()
+            local.stats_flushed_at = now
+        if not stats:
+            return
+        registry = self.shared.get(_STATS_NAMESPACES_KEY, set())
+        namespaces = {ns for ns, kind in stats}
+        if not namespaces <= registry:
+            self.shared.set(_STATS_NAMESPACES_KEY, registry | namespaces, timeout=None)
+        for (ns, kind), count in stats.items():
+            key = _STATS_KEY.format(ns, kind)
+            try:
+                self.shared.incr(key, count)
+            except ValueError:
+                if not self.shared.add(key, count, timeout=None):
+                    self.shared.incr(key, count)
+
+    def get_stats(self):
+        """네임스페이스별 L1/L2 적중 수와 적중률 (모든 워커 합계, 반영 주기만큼 지연)"""
+        self._flush_stats(time.monotonic(), force=True)
+        namespaces = self.shared.get(_STATS_NAMESPACES_KEY, set())
+        stats = {}
+        for ns in sorted(namespaces):
+            counts = self.shared.get_many(
+                [_STATS_KEY.format(ns, kind) for kind in _STATS_KINDS]
+            )
+            row = {
+                kind: counts.get(_STATS_KEY.format(ns, kind), 0)
+                for kind in _STATS_KINDS
+            }
+            total = sum(row.values())
+            row["hit_rate"] = (row["l1"] + row["l2"]) / total if total else 0.0
+            stats[ns] = row
+        return stats
+
+    # BaseCache
+
+    def get(self, key, default=None, version=None):
+        ns = namespace(key)
+        l1_key = self.make_and_validate_key(key, version=version)
+        generation = self._generation(ns)
+        found = self._l1_get(l1_key, generation)
+        if found is not None:
+            self._record(ns, "l1")
+            return found[0]
+        sentinel = object()
+        value = self.shared.get(key, sentinel, version=version)
+        if value is sentinel:
+            self._record(ns, "miss")
+            return default
+        self._record(ns, "l2")
+        self._l1_set(l1_key, value, None, generation)
+        return value
+
+    async def aget(self, key, default=None, version=None):
+        # 세대 값 확인 주기 안의 L1 적중은 이벤트 루프에서 바로 반환 (스레드 전환 없음)
+        ns = namespace(key)
+        cached = self._local.generations.get(ns)
+        if cached and time.monotonic() - cached[1] < self._sync_interval:
+            l1_key = self.make_and_validate_key(key, version=version)
+            found = self._l1_get(l1_key, cached[0])
+            if found is not None:
+                self._record(ns, "l1")
+                return found[0]
+        return await sync_to_async(self.get)(key, default, version)
+
+    async def aget_many(self, keys, version=None):
+        found, missing = {}, []
+        now = time.monotonic()
+        for key in keys:
+            ns = namespace(key)
+            cached = self._local.generations.get(ns)
+            if cached and now - cached[1] < self._sync_interval:
+                l1_key = self.make_and_validate_key(key, version=version)
+                hit = self._l1_get(l1_key, cached[0])
+                if hit is not None:
+                    self._record(ns, "l1")
+                    found[key] = hit[0]
+                    continue
+            missing.append(key)
+        if missing:
+            found.update(await sync_to_async(self.get_many)(missing, version))
+        return found
+
+    def get_many(self, keys, version=None):
+        found, missing = {}, {}
+        for key in keys:
+            ns = namespace(key)
+            l1_key = self.make_and_validate_key(key, version=version)
+            generation = self._generation(ns)
+            hit = self._l1_get(l1_key, generation)
+            if hit is not None:
+                self._record(ns, "l1")
+                found[key] = hit[0]
+            else:
+                missing[key] = (ns, l1_key, generation)
+        if not missing:
+            return found
+        # L1 에 없는 키는 L2 에서 한 번에 조회
+        values = self.shared.get_many(list(missing), version=version)
+        for key, (ns, l1_key, generation) in missing.items():
+            if key not in values:
+                self._record(ns, "miss")
+                continue
+            self._record(ns, "l2")
+            self._l1_set(l1_key, values[key], None, generation)
+            found[key] = values[key]
+        return found
+
+    def has_key(self, key, version=None):
+        return self.get(key, self, version=version) is not self
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout=timeout, version=version)
+        generation = self._invalidate(namespace(key))
+        l1_key = self.make_and_validate_key(key, version=version)
+        self._l1_set(l1_key, value, timeout, generation)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        if not self.shared.add(key, value, timeout=timeout, version=version):
+            return False
+        l1_key = self.make_and_validate_key(key, version=version)
+        generation = self._generation(namespace(key))
+        self._l1_set(l1_key, value, timeout, generation)
+        return True
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout=timeout, version=version)
+
+    def delete(self, key, version=None):
+        deleted = self.shared.delete(key, version=version)
+        self._invalidate(namespace(key))
+        self._l1_delete(self.make_and_validate_key(key, version=version))
+        return deleted
+
+    def incr(self, key, delta=1, version=None):
+        value = self.shared.incr(key, delta, version=version)
+        # 네임스페이스는 그대로 두고 이 키의 L1 만 갱신 (다른 워커는 SYNC_INTERVAL 안에 반영)
+        l1_key = self.make_and_validate_key(key, version=version)
+        self._l1_set(l1_key, value, None, self._generation(namespace(key)))
+        return value
+
+    def clear(self):
+        self.shared.clear()
+        with self._local.lock:
+            self._local.l1.clear()
+            self._local.generations.clear()
+
+
+class SQLiteCache(BaseCache):
+    """SQLite 파일 기반 공유 캐시 (같은 서버의 모든 워커가 공유, TieredCache 의 L2)
+
+    add, incr 를 SQL 한 문장으로 처리해 여러 워커가 동시에 호출해도 원자적입니다.
+    (파일 캐시의 add 는 확인 후 쓰기, incr 는 조회 후 쓰기라 동시에 호출하면 갱신이 유실됨)
+    정수 값은 INTEGER 로, 그 외 값은 pickle 로 저장합니다.
+    만료된 항목과 MAX_ENTRIES 를 넘는 항목은 CULL_INTERVAL 번 쓸 때마다 정리합니다.
+
+    OPTIONS:
+    - MAX_ENTRIES, CULL_FREQUENCY: Django 캐시와 동일
+    - CULL_INTERVAL: 정리 주기 (워커별 쓰기 횟수)
+    - BUSY_TIMEOUT: 다른 워커의 쓰기 잠금을 기다리는 시간 (초)
+    """
+
+    def __init__(self, location, params):
+        options = params.get("OPTIONS", {})
+        super().__init__(params)
+        self.location = str(location)
+        self._cull_interval = options.get("CULL_INTERVAL", 100)
+        self._busy_timeout = options.get("BUSY_TIMEOUT", 5)
+        self._local = threading.local()
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.location, timeout=self._busy_timeout, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            # 캐시는 유실되어도 되므로 커밋마다 fsync 하지 않음
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL"
+                ") WITHOUT ROWID"
+            )
+            self._local.connection = connection
+            self._local.writes = 0
+        return connection
+
+    def _encode(self, value):
+        # incr 를 SQL 로 처리하도록 정수는 그대로 저장 (bool 은 pickle)
+        if type(value) is int:
+            return value
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def _decode(self, value):
+        return value if isinstance(value, int) else pickle.loads(value)
+
+    def _write(self, sql, params):
+        connection = self._connection()
+        # RETURNING 행을 모두 읽어 문장을 끝내야 커밋 (쓰기 잠금 해제)
+        rows = connection.execute(sql, params).fetchall()
+        self._local.writes += 1
+        if self._local.writes >= self._cull_interval:
+            self._local.writes = 0
+            self._cull(connection)
+        return rows[0] if rows else None
+
+    def _cull(self, connection):
+        connection.execute(
+            "DELETE FROM cache_entries WHERE expires <= ?", (time.time(),)
+        )
+        count = connection.execute("SELECT count(*) FROM cache_entries").fetchone()[0]
+        if count <= self._max_entries:
+            return
+        if not self._cull_frequency:
+            connection.execute("DELETE FROM cache_entries")
+            return
+        # 만료 시각이 가장 이른 항목부터 삭제 (만료 없는 항목은 마지막)
+        connection.execute(
+            "DELETE FROM cache_entries WHERE key IN ("
+            "SELECT key FROM cache_entries ORDER BY expires IS NULL, expires LIMIT ?"
+            ")",
+            (count // self._cull_frequency,),
+        )
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value FROM cache_entries "
+                "WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return default if row is None else self._decode(row[0])
+
+    def get_many(self, keys, version=None):
+        keys = {self.make_and_validate_key(key, version=version): key for key in keys}
+        if not keys:
+            return {}
+        rows = (
+            self._connection()
+            .execute(
+                "SELECT key, value FROM cache_entries "
+                f"WHERE key IN ({', '.join('?' * len(keys))}) "
+                "AND (expires IS NULL OR expires > ?)",
+                (*keys, time.time()),
+            )
+            .fetchall()
+        )
+        return {keys[key]: self._decode(value) for key, value in rows}
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._write(
+            "INSERT INTO cache_entries (key, value, expires) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET "
+            "value = excluded.value, expires = excluded.expires",
+            (key, self._encode(value), self.get_backend_timeout(timeout)),
+        )
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        # 없거나 만료된 키에만 쓰기 (확인과 쓰기를 한 문장으로)
+        row = self._write(
+            "INSERT INTO cache_entries (key, value, expires) "
+            "VALUES (:key, :value, :expires) "
+            "ON CONFLICT (key) DO UPDATE SET "
+            "value = excluded.value, expires = excluded.expires "
+            "WHERE cache_entries.expires <= :now "
+            "RETURNING 1",
+            {
+                "key": key,
+                "value": self._encode(value),
+                "expires": self.get_backend_timeout(timeout),
+                "now": time.time(),
+            },
+        )
+        return row is not None
+
+    def incr(self, key, delta=1, version=None):
+        validated_key = self.make_and_validate_key(key, version=version)
+        row = self._write(
+            "UPDATE cache_entries SET value = value + ? "
+            "WHERE key = ? AND typeof(value) = 'integer' "
+            "AND (expires IS NULL OR expires > ?) "
+            "RETURNING value",
+            (delta, validated_key, time.time()),
+        )
+        if row is None:
+            raise ValueError("Key '%s' not found" % key)
+        return row[0]
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self._write(
+            "UPDATE cache_entries SET expires = ? "
+            "WHERE key = ? AND (expires IS NULL OR expires > ?) "
+            "RETURNING 1",
+            (self.get_backend_timeout(timeout), key, time.time()),
+        )
+        return row is not None
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        row = self._write("DELETE FROM cache_entries WHERE key = ? RETURNING 1", (key,))
+        return row is not None
+
+    def clear(self):
+        self._connection().execute("DELETE FROM cache_entries")
+
+
+def shared_cache():
+    """읽고 고쳐 쓰는 값(타임라인 등)을 조회할 캐시 (2단 캐시면 L2)"""
+    return getattr(cache, "shared", cache)
@@ -0,0 +1,128 @@
+import atexit
+import logging
+import threading
+from collections import Counter, defaultdict
+from functools import cache
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+def apply_deltas(model, pk, deltas):
+    """카운트 필드들을 한 번의 UPDATE 로 증감 (0 미만으로 내려가지 않음)"""
+    updates = {
+        field: Greatest(F(field) + delta, 0) for field, delta in deltas.items() if delta
+    }
+    if not updates:
+        return 0
+    return model.objects.filter(pk=pk).update(**updates, updated_at=timezone.now())
+
+
+class MemoryBuffer:
+    """프로세스 메모리 기반 카운터 버퍼"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._deltas = defaultdict(Counter)
+
+    def add(self, key, field, delta):
+        with self._lock:
+            self._deltas[key][field] += delta
+
+    def drain(self):
+        with self._lock:
+            deltas, self._deltas = self._deltas, defaultdict(Counter)
+        return deltas
+
+
+class AtomicCounter:
+    """요청 트랜잭션 안에서 바로 F() 증감을 실행하는 카운터"""
+
+    def increment(self, model, pk, field, delta=1):
+        apply_deltas(model, pk, {field: delta})
+
+    def flush(self):
+        return 0
+
+
+class BufferedCounter:
+    """증감 값을 버퍼에 모아 백그라운드에서 일괄 반영하는 카운터"""
+
+    def __init__(self, buffer="apps.core.counters.MemoryBuffer", flush_interval=1.0):
+        self.buffer = import_string(buffer)()
+        self.flush_interval = flush_interval
+        self._flusher = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def increment(self, model, pk, field, delta=1):
+        # 커밋된 변경만 버퍼에 기록
+        key = (model._meta.label, pk)
+        transaction.on_commit(lambda: self._add(key, field, delta))
+
+    def _add(self, key, field, delta):
+        self.buffer.add(key, field, delta)
+        self._start_flusher()
+
+    def _start_flusher(self):
+        if self._flusher:
+            return
+        with self._lock:
+            if self._flusher:
+                return
+            self._flusher = threading.Thread(
+                target=self._run, name="counter-flusher", daemon=True
+            )
+            self._flusher.start()
+            atexit.register(self.stop)
+
+    def _run(self):
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("카운터 반영 실패")
+
+    def flush(self):
+        deltas = self.buffer.drain()
+        if not deltas:
+            return 0
+        try:
+            with transaction.atomic():
+                for (label, pk), fields in deltas.items():
+                    apply_deltas(apps.get_model(label), pk, fields)
+        except Exception:
+            # 반영하지 못한 증감 값은 다음 주기에 재시도
+            for key, fields in deltas.items():
+                for field, delta in fields.items():
+                    self.buffer.add(key, field, delta)
+            raise
+        return len(deltas)
+
+    def stop(self):
+        self._stopped.set()
+        if self._flusher:
+            self._flusher.join()
+        self.flush()
+
+
+@cache
+def get_counter():
+    config = getattr(settings, "COUNTERS", {})
+    backend = import_string(config.get("BACKEND", "apps.core.counters.AtomicCounter"))
+    return backend(**config.get("OPTIONS", {}))
+
+
+def increment(model, pk, field, delta=1):
+    get_counter().increment(model, pk, field, delta)
+
+
+def decrement(model, pk, field, delta=1):
+    get_counter().increment(model, pk, field, -delta)
@@ -0,0 +1,62 @@
+from rest_framework import serializers
+
+FIELDS_PARAM = "fields"
+EXCLUDE_PARAM = "exclude"
+
+
+def _split(value):
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def parse_fieldset(request):
+    """?fields=, ?exclude= 파라미터 → (포함할 필드 집합 또는 None, 제외할 필드 집합)"""
+    params = getattr(request, "query_params", None) or {}
+    fields = params.get(FIELDS_PARAM)
+    exclude = params.get(EXCLUDE_PARAM)
+    return (_split(fields) if fields else None), (_split(exclude) if exclude else set())
+
+
+def field_requested(request, name):
+    """응답에 필드가 포함되는지 (쿼리셋의 select_related, annotate 생략 판단용)"""
+    fields, exclude = parse_fieldset(request)
+    return (fields is None or name in fields) and name not in exclude
+
+
+class SparseFieldsetMixin:
+    """fields, exclude 로 응답 필드를 줄이는 시리얼라이저 믹스인
+
+    생성자 인자로 지정하거나, 최상위 시리얼라이저(목록의 항목 포함)는
+    요청의 ?fields=a,b / ?exclude=c 를 사용합니다. 입력 검증에는 영향을 주지 않습니다.
+    """
+
+    def __init__(self, *args, fields=None, exclude=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._fieldset = None
+        if fields is not None or exclude is not None:
+            self._fieldset = (
+                set(fields) if fields is not None else None,
+                set(exclude or ()),
+            )
+
+    def get_fieldset(self):
+        if self._fieldset is None:
+            root = self.root
+            is_top_level = root is self or (
+                self.parent is root and isinstance(root, serializers.ListSerializer)
+            )
+            request = self.context.get("request")
+            if is_top_level and request is not None:
+                self._fieldset = parse_fieldset(request)
+            else:
+                self._fieldset = (None, set())
+        return self._fieldset
+
+    def is_field_requested(self, name):
+        fields, exclude = self.get_fieldset()
+        return (fields is None or name in fields) and name not in exclude
+
+    @property
+    def _readable_fields(self):
+        for field in super()._readable_fields:
+            if self.is_field_requested(field.field_name):
+                yield field
@@ -0,0 +1,76 @@
+from django.core.exceptions import ValidationError
+from django.http import Http404
+
+
+class IdentityMap:
+    """요청 단위 객체 저장소
+
+    같은 요청 안에서 (모델, PK) 가 같은 객체는 한 번만 조회하고,
+    뷰, 시리얼라이저 필드, 시리얼라이저가 같은 인스턴스를 공유합니다.
+    """
+
+    def __init__(self):
+        self._objects = {}
+
+    @staticmethod
+    def _key(model, pk):
+        model = model._meta.concrete_model
+        try:
+            return model, model._meta.pk.to_python(pk)
+        except (TypeError, ValueError, ValidationError):
+            raise Http404(f"{model._meta.verbose_name} 을(를) 찾을 수 없습니다.")
+
+    def add(self, instance):
+        self._objects[self._key(instance, instance.pk)] = instance
+        return instance
+
+    def get(self, model, pk, queryset=None):
+        """저장된 객체를 반환하고, 없으면 조회 (존재하지 않으면 404)"""
+        key = self._key(model, pk)
+        if key not in self._objects:
+            if queryset is None:
+                queryset = model._default_manager.all()
+            try:
+                self._objects[key] = queryset.get(pk=key[1])
+            except queryset.model.DoesNotExist:
+                raise Http404(f"{model._meta.verbose_name} 을(를) 찾을 수 없습니다.")
+        return self._objects[key]
+
+    def attach(self, instance, *field_names):
+        """인스턴스의 FK 를 저장소의 객체로 연결 (필요하면 조회)"""
+        for name in field_names:
+            field = instance._meta.get_field(name)
+            pk = getattr(instance, field.attname)
+            if pk is not None:
+                setattr(instance, name, self.get(field.related_model, pk))
+        return instance
+
+
+def get_identity_map(request):
+    """요청의 객체 저장소 (DRF Request 와 HttpRequest 가 공유)"""
+    http_request = getattr(request, "_request", request)
+    identity_map = getattr(http_request, "_identity_map", None)
+    if identity_map is None:
+        identity_map = http_request._identity_map = IdentityMap()
+        # 로그인 사용자는 이미 조회된 인스턴스 사용 (프로필도 함께 캐시됨)
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            identity_map.add(user)
+    return identity_map
+
+
+class IdentityMapMixin:
+    """요청 단위 객체 저장소를 사용하는 뷰 믹스인
+
+    identity_map_relations 에 지정한 FK 는 get_object 시 저장소의 객체로 연결됩니다.
+    """
+
+    identity_map_relations = ()
+
+    @property
+    def identity_map(self):
+        return get_identity_map(self.request)
+
+    def get_object(self):
+        instance = self.identity_map.add(super().get_object())
+        return self.identity_map.attach(instance, *self.identity_map_relations)
@@ -0,0 +1,283 @@
+import asyncio
+import io
+import os
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.utils import timezone
+
+from apps.comments.models import Comment
+from apps.feeds.models import Feed, FeedCategory
+from apps.users.models import User, UserProfile
+
+# 측정 방식: (이름, ASYNC_READ_VIEWS)
+MODES = {
+    "wsgi": False,  # WSGI + 동기 뷰 (요청마다 워커 스레드)
+    "asgi-sync": False,  # ASGI + 동기 뷰 (sync_to_async 로 스레드 전환)
+    "asgi": True,  # ASGI + async 읽기 뷰
+}
+
+
+class ThreadSampler(threading.Thread):
+    """측정 중 최대 스레드 수 기록"""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.peak = threading.active_count()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(0.005):
+            self.peak = max(self.peak, threading.active_count())
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return self.peak
+
+
+class Command(BaseCommand):
+    """읽기 API 부하 벤치마크 (WSGI 동기 뷰, ASGI 동기 뷰, ASGI async 뷰)
+
+    방식마다 설정을 바꿔 별도 프로세스에서 실행하고, 동시 요청 수별로
+    처리량, 지연 시간, 최대 스레드 수, 처리 중인 요청당 메모리(tracemalloc)를 출력합니다.
+    스레드 스택은 tracemalloc 에 잡히지 않으므로 스레드 수를 함께 확인하세요.
+    시딩한 데이터는 종료 시 삭제됩니다.
+    """
+
+    help = "읽기 API 의 동시 처리량과 요청당 메모리를 WSGI/ASGI 방식별로 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=400)
+        parser.add_argument(
+            "--concurrency", type=int, action="append", help="기본값: 1, 16, 64"
+        )
+        parser.add_argument("--feeds", type=int, default=100)
+        parser.add_argument(
+            "--mode", action="append", choices=list(MODES), help="기본값: 전체"
+        )
+        parser.add_argument(
+            "--anonymous", action="store_true", help="비로그인 요청 (응답 캐시 사용)"
+        )
+        # 방식별 하위 프로세스용
+        parser.add_argument("--child", action="store_true", help="(내부용)")
+        parser.add_argument("--feed", help="(내부용)")
+        parser.add_argument("--cookie", default="", help="(내부용)")
+
+    def handle(self, *args, **options):
+        options["concurrency"] = options["concurrency"] or [1, 16, 64]
+        if options["child"]:
+            return self._run_child(options)
+
+        category, users, feed = self._seed(options["feeds"])
+        cookie = ""
+        if not options["anonymous"]:
+            client = Client()
+            client.force_login(users[0])
+            session = client.cookies[settings.SESSION_COOKIE_NAME].value
+            cookie = f"{settings.SESSION_COOKIE_NAME}={session}"
+        try:
+            for mode in options["mode"] or list(MODES):
+                self.stdout.write(f"[{mode}]")
+                self.stdout.flush()
+                command = [
+                    sys.executable,
+                    sys.argv[0],
+                    "bench_async_reads",
+                    "--child",
+                    f"--mode={mode}",
+                    f"--feed={feed.pk}",
+                    f"--cookie={cookie}",
+                    f"--requests={options['requests']}",
+                ] + [f"--concurrency={c}" for c in options["concurrency"]]
+                env = dict(os.environ, ASYNC_READ_VIEWS=str(MODES[mode]), DEBUG="False")
+                subprocess.run(command, env=env, check=True)
+        finally:
+            User.objects.filter(pk__in=[user.pk for user in users]).delete()
+            category.delete()
+
+    def _seed(self, feeds):
+        suffix = uuid.uuid4().hex[:8]
+        category = FeedCategory.objects.create(
+            key=f"bench-{suffix}", name="bench", emoji="🦀", color=""
+        )
+        users = User.objects.bulk_create(
+            User(email=f"bench-{suffix}-{i}@bench.local") for i in range(10)
+        )
+        UserProfile.objects.bulk_create(
+            UserProfile(user=user, nickname=f"bench-{suffix}-{i}")
+            for i, user in enumerate(users)
+        )
+        now = timezone.now()
+        feed_objects = Feed.objects.bulk_create(
+            Feed(
+                uuid=uuid.uuid4(),
+                user=users[i % len(users)],
+                category=category,
+                content=f"벤치마크 피드 {i}",
+                published_at=now - timezone.timedelta(minutes=i),
+            )
+            for i in range(feeds)
+        )
+        Comment.objects.bulk_create(
+            Comment(user=users[j % len(users)], feed=feed, content=f"댓글 {j}")
+            for feed in feed_objects
+            for j in range(5)
+        )
+        return category, users, feed_objects[0]
+
+    # 하위 프로세스
+
+    def _run_child(self, options):
+        feed = options["feed"]
+        paths = [
+            ("/api/v1/feeds/", ""),
+            ("/api/v1/feeds/", "fields=uuid,content"),
+            (f"/api/v1/feeds/{feed}/", ""),
+            (f"/api/v1/feeds/{feed}/comments/", ""),
+            ("/api/v1/feeds/categories/", ""),
+        ]
+        if options["cookie"]:
+            paths.append(("/api/v1/users/me/count/", ""))
+        host = next((h for h in settings.ALLOWED_HOSTS if "*" not in h), "localhost")
+        if options["mode"] == "wsgi":
+            runner = WSGIRunner(host, options["cookie"])
+        else:
+            runner = ASGIRunner(host, options["cookie"])
+        runner.run(paths[:1], 1)  # 워밍업
+        for concurrency in options["concurrency"]:
+            requests = max(options["requests"], concurrency)
+            targets = [paths[i % len(paths)] for i in range(requests)]
+
+            sampler = ThreadSampler()
+            sampler.start()
+            started = time.perf_counter()
+            latencies, errors = runner.run(targets, concurrency)
+            elapsed = time.perf_counter() - started
+            threads = sampler.stop()
+
+            # 동시 요청 한 묶음을 처리하는 동안 늘어난 메모리 최댓값
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            runner.run(targets[:concurrency], concurrency)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            latencies.sort()
+            self.stdout.write(
+                f"  동시 {concurrency:>3}: {requests / elapsed:8.1f} req/s  "
+                f"p50 {latencies[len(latencies) // 2] * 1000:7.1f}ms  "
+                f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:7.1f}ms  "
+                f"스레드 {threads:>3}  "
+                f"요청당 {(peak - baseline) / concurrency / 1024:7.1f}KiB  "
+                f"오류 {errors}"
+            )
+
+
+class WSGIRunner:
+    """WSGI 핸들러를 스레드 풀에서 호출 (gthread 워커와 같은 방식)"""
+
+    def __init__(self, host, cookie):
+        from django.core.wsgi import get_wsgi_application
+
+        self.application = get_wsgi_application()
+        self.host = host
+        self.cookie = cookie
+
+    def request(self, path, query):
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "SCRIPT_NAME": "",
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "SERVER_NAME": self.host,
+            "SERVER_PORT": "80",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "HTTP_HOST": self.host,
+            "HTTP_COOKIE": self.cookie,
+            "wsgi.input": io.BytesIO(),
+            "wsgi.errors": sys.stderr,
+            "wsgi.url_scheme": "http",
+        }
+        status = []
+        started = time.perf_counter()
+        response = self.application(
+            environ, lambda s, headers, exc_info=None: status.append(s)
+        )
+        b"".join(response)
+        response.close()
+        return time.perf_counter() - started, status[0].startswith("200")
+
+    def run(self, targets, concurrency):
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(lambda t: self.request(*t), targets))
+        return [r[0] for r in results], sum(not r[1] for r in results)
+
+
+class ASGIRunner:
+    """ASGI 핸들러를 이벤트 루프에서 동시에 호출"""
+
+    def __init__(self, host, cookie):
+        from django.core.asgi import get_asgi_application
+
+        self.application = get_asgi_application()
+        self.host = host
+        self.cookie = cookie
+
+    async def request(self, path, query):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [
+                (b"host", self.host.encode()),
+                (b"cookie", self.cookie.encode()),
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": (self.host, 80),
+        }
+        done = asyncio.Event()
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+        status = []
+
+        async def receive():
+            if messages:
+                return messages.pop()
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                status.append(message["status"])
+
+        started = time.perf_counter()
+        await self.application(scope, receive, send)
+        done.set()
+        return time.perf_counter() - started, status[0] == 200
+
+    async def _run(self, targets, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited(target):
+            async with semaphore:
+                return await self.request(*target)
+
+        return await asyncio.gather(*(limited(target) for target in targets))
+
+    def run(self, targets, concurrency):
+        results = asyncio.run(self._run(targets, concurrency))
+        return [r[0] for r in results], sum(not r[1] for r in results)
@@ -0,0 +1,156 @@
+import os
+import random
+import tempfile
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.feeds.models import Feed, FeedCategory, FeedLike
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    """SQLite 설정 프로필별 동시 읽기/쓰기 벤치마크
+
+    settings.SQLITE_PROFILES 의 프로필마다 기본 DB 를 임시 파일로 복사해 (스키마 포함)
+    쓰기 스레드(좋아요: 조회 후 추가, 카운트 증가)와 읽기 스레드(피드 목록)를
+    동시에 실행하고, 처리량, p99 지연 시간, "database is locked" 오류 수를 출력합니다.
+    요청이 끝날 때마다 연결을 정리해 CONN_MAX_AGE 의 효과도 함께 측정합니다.
+    기본 DB 는 변경하지 않습니다. (migrate 가 필요)
+    """
+
+    help = "SQLite 설정 프로필별 동시 읽기/쓰기 처리량과 잠금 오류를 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--writers", type=int, default=8)
+        parser.add_argument("--readers", type=int, default=8)
+        parser.add_argument("--seconds", type=float, default=5)
+        parser.add_argument(
+            "--profile", action="append", choices=list(settings.SQLITE_PROFILES)
+        )
+
+    def handle(self, *args, **options):
+        if connections[DEFAULT_DB_ALIAS].vendor != "sqlite":
+            raise CommandError("SQLite DB 에서만 실행할 수 있습니다.")
+        with tempfile.TemporaryDirectory() as directory:
+            for profile in options["profile"] or list(settings.SQLITE_PROFILES):
+                alias = f"bench_{profile}"
+                self._create_database(alias, os.path.join(directory, alias), profile)
+                try:
+                    users, feeds = self._seed(alias)
+                    self._run(alias, profile, users, feeds, options)
+                finally:
+                    connections[alias].close()
+
+    def _create_database(self, alias, path, profile):
+        connections.settings[alias] = connections.configure_settings(
+            {
+                DEFAULT_DB_ALIAS: settings.DATABASES[DEFAULT_DB_ALIAS],
+                alias: {
+                    "ENGINE": "django.db.backends.sqlite3",
+                    "NAME": path,
+                    **settings.SQLITE_PROFILES[profile],
+                },
+            }
+        )[alias]
+        # 기본 DB 를 복사해 스키마 생성 (연결 시 프로필의 PRAGMA 적용)
+        source = connections[DEFAULT_DB_ALIAS]
+        source.ensure_connection()
+        target = connections[alias]
+        target.ensure_connection()
+        source.connection.backup(target.connection)
+        target.close()
+
+    def _seed(self, alias):
+        suffix = uuid.uuid4().hex[:8]
+        category = FeedCategory.objects.using(alias).create(
+            key=f"bench-{suffix}", name="bench", emoji="🦀", color=""
+        )
+        users = User.objects.using(alias).bulk_create(
+            User(email=f"bench-{suffix}-{i}@bench.local") for i in range(100)
+        )
+        now = timezone.now()
+        feeds = Feed.objects.using(alias).bulk_create(
+            Feed(
+                uuid=uuid.uuid4(),
+                user=users[i % len(users)],
+                category=category,
+                content=f"벤치마크 피드 {i}",
+                published_at=now - timezone.timedelta(minutes=i),
+            )
+            for i in range(200)
+        )
+        connections[alias].close()
+        return [user.pk for user in users], [feed.pk for feed in feeds]
+
+    def _like(self, alias, users, feeds):
+        user_id, feed_id = random.choice(users), random.choice(feeds)
+        with transaction.atomic(using=alias):
+            # 조회 후 쓰기 (DEFERRED 트랜잭션은 여기서 읽기 잠금을 쓰기 잠금으로 전환)
+            likes = FeedLike.objects.using(alias).filter(feed_id=feed_id)
+            if likes.filter(user_id=user_id).exists():
+                return
+            FeedLike.objects.using(alias).bulk_create(
+                [FeedLike(user_id=user_id, feed_id=feed_id)]
+            )
+            Feed.objects.using(alias).filter(pk=feed_id).update(
+                likes_count=F("likes_count") + 1
+            )
+
+    def _list(self, alias, users, feeds):
+        list(
+            Feed.objects.using(alias)
+            .filter(is_displayed=True)
+            .order_by("-published_at")
+            .values("uuid", "content", "likes_count", "user__email")[:20]
+        )
+
+    def _worker(self, request, alias, users, feeds, deadline, results):
+        latencies, errors = [], 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                request(alias, users, feeds)
+            except OperationalError:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - started)
+            # 요청 종료 시 처리 (CONN_MAX_AGE 가 0 이면 연결 종료)
+            connections[alias].close_if_unusable_or_obsolete()
+        connections[alias].close()
+        results.append((latencies, errors))
+
+    def _run(self, alias, profile, users, feeds, options):
+        results = {self._like: [], self._list: []}
+        deadline = time.perf_counter() + options["seconds"]
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(request, alias, users, feeds, deadline, results[request]),
+            )
+            for request, count in (
+                (self._like, options["writers"]),
+                (self._list, options["readers"]),
+            )
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.stdout.write(f"[{profile}]")
+        for name, request in (("쓰기", self._like), ("읽기", self._list)):
+            latencies = sorted(l for result in results[request] for l in result[0])
+            errors = sum(result[1] for result in results[request])
+            p99 = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0
+            self.stdout.write(
+                f"  {name}: {len(latencies) / options['seconds']:8.1f} req/s  "
+                f"p99 {p99:7.1f}ms  잠금 오류 {errors}"
+            )
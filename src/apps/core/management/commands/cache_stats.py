@@ -0,0 +1,25 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """2단 캐시의 네임스페이스별 적중률 출력"""
+
+    help = "캐시 네임스페이스별 L1/L2 적중 수와 적중률을 출력합니다."
+
+    def handle(self, *args, **options):
+        if not hasattr(cache, "get_stats"):
+            raise CommandError("기본 캐시가 TieredCache 가 아닙니다.")
+        stats = cache.get_stats()
+        if not stats:
+            self.stdout.write("집계된 통계가 없습니다.")
+            return
+        width = max(len(ns) for ns in stats)
+        self.stdout.write(
+            f"{'namespace':<{width}}  {'l1':>8}  {'l2':>8}  {'miss':>8}  hit_rate"
+        )
+        for ns, row in stats.items():
+            self.stdout.write(
+                f"{ns:<{width}}  {row['l1']:>8}  {row['l2']:>8}  {row['miss']:>8}"
+                f"  {row['hit_rate']:.1%}"
+            )
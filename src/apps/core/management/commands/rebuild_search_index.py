@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.comments.models import Comment
+from apps.comments.search import comment_index, index_comments
+from apps.feeds.models import Feed
+from apps.feeds.search import feed_index, index_feeds
+
+
+class Command(BaseCommand):
+    """피드, 댓글 검색 인덱스(FTS5) 전체 재생성"""
+
+    help = "피드, 댓글 검색 인덱스를 다시 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2_000)
+
+    def handle(self, *args, **options):
+        targets = [
+            (feed_index, index_feeds, Feed.objects.filter(is_displayed=True)),
+            (comment_index, index_comments, Comment.objects.filter(is_displayed=True)),
+        ]
+        for index, index_rows, queryset in targets:
+            with transaction.atomic():
+                index.clear()
+                count = 0
+                chunk = []
+                for row in queryset.only("pk", "content", "is_displayed").iterator(
+                    chunk_size=options["chunk_size"]
+                ):
+                    chunk.append(row)
+                    if len(chunk) >= options["chunk_size"]:
+                        index_rows(chunk)
+                        count += len(chunk)
+                        chunk = []
+                index_rows(chunk)
+                count += len(chunk)
+            self.stdout.write(f"{index.table}: {count}건 색인")
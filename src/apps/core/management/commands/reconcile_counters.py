@@ -0,0 +1,157 @@
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from apps.comments.models import Comment, CommentLike, CommentReport
+from apps.feeds.models import Feed, FeedLike, FeedReport
+from apps.users.models import User, UserStats
+
+# 모델별 카운트 필드: (집계 대상 모델, 외래 키, 추가 조건)
+COUNTER_FIELDS = {
+    Feed: {
+        "likes_count": (FeedLike, "feed", Q()),
+        "comments_count": (Comment, "feed", Q(parent__isnull=True)),
+        "reported_count": (FeedReport, "feed", Q()),
+    },
+    Comment: {
+        "likes_count": (CommentLike, "comment", Q()),
+        "reply_count": (Comment, "parent", Q()),
+        "reported_count": (CommentReport, "comment", Q()),
+    },
+    UserStats: {
+        "feeds_count": (Feed, "user", Q()),
+        "comments_count": (Comment, "user", Q()),
+        "likes_count": (FeedLike, "user", Q()),
+        # 받은 반응 수 (자신의 글에 남긴 반응 제외)
+        "feed_likes_received": (FeedLike, "feed__user", ~Q(user=F("feed__user"))),
+        "comment_likes_received": (
+            CommentLike,
+            "comment__user",
+            ~Q(user=F("comment__user")),
+        ),
+        "comments_received": (Comment, "feed__user", ~Q(user=F("feed__user"))),
+    },
+}
+
+
+def count_subquery(model, fk, condition):
+    """외래 키별 행 수를 구하는 상관 서브쿼리"""
+    queryset = (
+        model.objects.filter(condition, **{fk: OuterRef("pk")})
+        .order_by()
+        .values(fk)
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    return Coalesce(Subquery(queryset), 0)
+
+
+class Command(BaseCommand):
+    """피드, 댓글, 사용자 통계의 카운트 필드를 실제 집계 값으로 재계산
+
+    기본 키 범위 단위로 나누어 집계 SQL 로 불일치 행을 찾고 UPDATE 합니다.
+    모델 인스턴스를 메모리에 올리지 않습니다.
+    """
+
+    help = "좋아요, 댓글, 답글, 신고 수와 사용자 통계를 실제 값으로 재계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=5_000)
+        parser.add_argument(
+            "--dry-run", action="store_true", help="변경 없이 불일치 내역만 출력"
+        )
+        parser.add_argument(
+            "--since",
+            help="updated_at 이 해당 일시 이후인 행만 재계산 (예: 2024-12-01)",
+        )
+
+    def handle(self, *args, **options):
+        since = self._parse_since(options["since"]) if options["since"] else None
+        if not options["dry_run"]:
+            self._create_missing_user_stats()
+        for model, fields in COUNTER_FIELDS.items():
+            queryset = model.objects.all()
+            if since:
+                queryset = queryset.filter(updated_at__gte=since)
+            checked, mismatched = 0, 0
+            for chunk in self._chunks(queryset, options["chunk_size"]):
+                with transaction.atomic():
+                    checked_rows, mismatched_rows = self._reconcile(
+                        chunk, fields, options["dry_run"]
+                    )
+                checked += checked_rows
+                mismatched += mismatched_rows
+            self.stdout.write(
+                f"{model._meta.db_table}: {checked}건 확인, {mismatched}건 "
+                + ("불일치" if options["dry_run"] else "수정")
+            )
+
+    def _create_missing_user_stats(self):
+        """통계 행이 없는 사용자의 행 생성 (값은 이후 재계산)"""
+        missing = User.objects.filter(stats__isnull=True).values_list("pk", flat=True)
+        created = UserStats.objects.bulk_create(
+            [UserStats(user_id=pk) for pk in missing.iterator()],
+            batch_size=1_000,
+            ignore_conflicts=True,
+        )
+        if created:
+            self.stdout.write(f"user_stats: {len(created)}건 생성")
+
+    def _parse_since(self, value):
+        since = parse_datetime(value)
+        if since is None:
+            date = parse_date(value)
+            if date is None:
+                raise CommandError(f"잘못된 일시 형식입니다: {value}")
+            since = datetime.combine(date, time.min)
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
+
+    def _chunks(self, queryset, chunk_size):
+        """기본 키 범위로 나눈 쿼리셋 (경계 값만 조회)"""
+        queryset = queryset.order_by("pk")
+        lower = None
+        while True:
+            remaining = queryset if lower is None else queryset.filter(pk__gt=lower)
+            upper = remaining.values_list("pk", flat=True)[chunk_size - 1 : chunk_size]
+            upper = upper[0] if upper else None
+            if upper is None:
+                yield remaining
+                return
+            yield remaining.filter(pk__lte=upper)
+            lower = upper
+
+    def _reconcile(self, chunk, fields, dry_run):
+        actuals = {
+            f"actual_{field}": count_subquery(*spec) for field, spec in fields.items()
+        }
+        mismatch = Q()
+        for field in fields:
+            mismatch |= ~Q(**{field: F(f"actual_{field}")})
+        rows = (
+            chunk.annotate(**actuals)
+            .filter(mismatch)
+            .values_list("pk", *fields, *actuals)
+        )
+        if dry_run:
+            count = 0
+            for pk, *values in rows.iterator():
+                current, actual = values[: len(fields)], values[len(fields) :]
+                diff = ", ".join(
+                    f"{field} {c} → {a}"
+                    for field, c, a in zip(fields, current, actual)
+                    if c != a
+                )
+                self.stdout.write(f"  {pk}: {diff}")
+                count += 1
+            return chunk.count(), count
+        updated = chunk.model.objects.filter(pk__in=Subquery(rows.values("pk"))).update(
+            **{field: count_subquery(*spec) for field, spec in fields.items()}
+        )
+        return chunk.count(), updated
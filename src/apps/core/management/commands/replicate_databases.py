@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from apps.core.routers import replica_aliases
+
+
+class Command(BaseCommand):
+    """로컬 개발용 복제: 기본 DB(SQLite) 를 복제본 파일로 복사
+
+    SQLite 온라인 백업으로 기본 DB 의 일관된 스냅샷을 각 복제본에 덮어씁니다.
+    --interval 을 주면 그 간격으로 반복해 복제 지연이 있는 복제본을 흉내냅니다.
+    운영 DB 는 DB 자체의 복제를 사용하세요.
+    """
+
+    help = "기본 SQLite DB 를 DATABASE_REPLICAS 의 복제본 파일로 복사합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval", type=float, default=0, help="반복 간격(초), 0 이면 한 번"
+        )
+
+    def handle(self, *args, **options):
+        replicas = replica_aliases()
+        if not replicas:
+            raise CommandError("DATABASE_REPLICAS 에 복제본이 설정되지 않았습니다.")
+        for alias in [DEFAULT_DB_ALIAS, *replicas]:
+            if connections[alias].vendor != "sqlite":
+                raise CommandError(f"{alias}: SQLite DB 만 복사할 수 있습니다.")
+        while True:
+            started = time.perf_counter()
+            self.replicate(replicas)
+            self.stdout.write(
+                f"복제 완료: {', '.join(replicas)} "
+                f"({(time.perf_counter() - started) * 1000:.1f}ms)"
+            )
+            if not options["interval"]:
+                return
+            time.sleep(options["interval"])
+
+    def replicate(self, replicas):
+        source = connections[DEFAULT_DB_ALIAS]
+        source.ensure_connection()
+        for alias in replicas:
+            target = connections[alias]
+            target.ensure_connection()
+            source.connection.backup(target.connection)
@@ -0,0 +1,60 @@
+from collections import deque
+
+
+class AhoCorasick:
+    """다중 문자열 검색 오토마톤
+
+    여러 단어를 한 번에 컴파일해 두고, 텍스트 길이에 비례하는 시간에
+    포함된 단어를 찾습니다. (단어 수와 무관)
+    """
+
+    def __init__(self, words):
+        # 노드별 전이, 실패 링크, 해당 노드에서 끝나는 단어 (실패 링크를 따라 상속)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [None]
+        for word in words:
+            if word:
+                self._insert(word)
+        self._build()
+
+    def _insert(self, word):
+        node = 0
+        for char in word:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+            node = next_node
+        self._output[node] = word
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                if self._output[child] is None:
+                    self._output[child] = self._output[self._fail[child]]
+
+    def __len__(self):
+        return len(self._goto)
+
+    def search(self, text):
+        """텍스트에 포함된 첫 번째 단어 (없으면 None)"""
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node] is not None:
+                return output[node]
+        return None
@@ -0,0 +1,130 @@
+from base64 import b64decode, b64encode
+from datetime import datetime
+from urllib import parse
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+from apps.core.plans import arun_queries, run_queries
+
+
+class KeysetCursorPagination(CursorPagination):
+    """복합 키 커서 페이지네이션
+
+    ordering 의 모든 필드 값을 커서에 담아 (a, b) 이후 행을 범위 조건으로 조회합니다.
+    마지막 필드는 고유해야 하며, 오프셋을 사용하지 않으므로 어느 페이지든
+    인덱스 범위 스캔 한 번으로 조회됩니다.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return run_queries(self.plan_page(queryset, request, view))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        return await arun_queries(self.plan_page(queryset, request, view))
+
+    def plan_page(self, queryset, request, view=None):
+        """페이지 조회 계획 (apps.core.plans)"""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor.reverse if self.cursor else False
+        position = self.cursor.position if self.cursor else None
+
+        ordering = self._reverse_ordering() if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._seek_condition(ordering, position))
+
+        results = yield queryset[: self.page_size + 1]
+        self.page = results[: self.page_size]
+        has_more = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_previous, self.has_next = has_more, position is not None
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        position = self._get_position_from_instance(self.page[-1], self.ordering)
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        position = self._get_position_from_instance(self.page[0], self.ordering)
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            querystring = b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+            position = tokens.get("p")
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if position is not None and len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(offset=0, reverse=reverse, position=position)
+
+    def encode_cursor(self, cursor):
+        tokens = {}
+        if cursor.reverse:
+            tokens["r"] = "1"
+        if cursor.position is not None:
+            tokens["p"] = cursor.position
+        querystring = parse.urlencode(tokens, doseq=True)
+        encoded = b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _get_position_from_instance(self, instance, ordering):
+        position = []
+        for field in ordering:
+            name = field.lstrip("-")
+            # values() 로 조회한 행(dict) 도 지원
+            value = (
+                instance[name]
+                if isinstance(instance, dict)
+                else getattr(instance, name)
+            )
+            position.append(
+                value.isoformat() if isinstance(value, datetime) else str(value)
+            )
+        return position
+
+    def _reverse_ordering(self):
+        return tuple(
+            field[1:] if field.startswith("-") else f"-{field}"
+            for field in self.ordering
+        )
+
+    def _seek_condition(self, ordering, position):
+        """(a, b, c) 가 커서 위치 이후인 행 조건
+
+        a <= x AND (a < x OR (a = x AND (b < y OR (b = y AND c < z))))
+        첫 필드의 범위 조건을 따로 두어 인덱스 범위 스캔이 가능하도록 합니다.
+        """
+        fields = [field.lstrip("-") for field in ordering]
+        operators = ["lt" if field.startswith("-") else "gt" for field in ordering]
+        condition = None
+        for field, operator, value in reversed(list(zip(fields, operators, position))):
+            after = Q(**{f"{field}__{operator}": value})
+            condition = (
+                after
+                if condition is None
+                else after | (Q(**{field: value}) & condition)
+            )
+        first_bound = "lte" if operators[0] == "lt" else "gte"
+        return Q(**{f"{fields[0]}__{first_bound}": position[0]}) & condition
@@ -0,0 +1,22 @@
+def run_queries(plan):
+    """조회 계획을 동기 ORM 으로 실행
+
+    조회 계획은 쿼리셋을 yield 하고 그 결과 목록을 돌려받는 제너레이터이며,
+    반환 값이 최종 결과입니다. 같은 계획을 async 뷰에서는 arun_queries 로 실행합니다.
+    """
+    try:
+        queryset = next(plan)
+        while True:
+            queryset = plan.send(list(queryset))
+    except StopIteration as stop:
+        return stop.value
+
+
+async def arun_queries(plan):
+    """조회 계획을 async ORM 으로 실행"""
+    try:
+        queryset = next(plan)
+        while True:
+            queryset = plan.send([row async for row in queryset])
+    except StopIteration as stop:
+        return stop.value
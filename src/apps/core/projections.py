@@ -0,0 +1,159 @@
+from django.conf import settings
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.relations import PKOnlyObject, PrimaryKeyRelatedField
+from rest_framework.response import Response
+
+from apps.core.plans import arun_queries, run_queries
+from apps.core.renderers import FastJSONRenderer
+
+_datetime_field = serializers.DateTimeField()
+
+
+def _str(value):
+    return None if value is None else str(value)
+
+
+def _int(value):
+    return None if value is None else int(value)
+
+
+def _bool(value):
+    return None if value is None else bool(value)
+
+
+def _datetime(value):
+    # 시간대 변환, Z 표기 등 DRF 와 같은 형식
+    return None if value is None else _datetime_field.to_representation(value)
+
+
+# 컬럼 변환 함수 (ModelSerializer 필드의 to_representation 과 같은 결과)
+STR = "_str"
+INT = "_int"
+BOOL = "_bool"
+DATETIME = "_datetime"
+RAW = ""
+
+_HELPERS = {"_str": _str, "_int": _int, "_bool": _bool, "_datetime": _datetime}
+
+
+def column(lookup, converter=RAW):
+    """values() 컬럼 값을 변환하는 표현식"""
+    return f"{converter}(r[{lookup!r}])"
+
+
+def nested(lookup_prefix, fields, null_lookup=None):
+    """관계 객체(select_related 대상)를 dict 로 만드는 표현식 (없으면 None)
+
+    fields: [(출력 키, 컬럼 이름, 변환 함수)]
+    """
+    null_lookup = null_lookup or f"{lookup_prefix}__id"
+    body = ", ".join(
+        f"{key!r}: {column(f'{lookup_prefix}__{name}', converter)}"
+        for key, name, converter in fields
+    )
+    return f"(None if r[{null_lookup!r}] is None else {{{body}}})"
+
+
+def nested_lookups(lookup_prefix, fields):
+    return [f"{lookup_prefix}__{name}" for _, name, _ in fields]
+
+
+def compile_projection(name, expressions):
+    """[(출력 키, 표현식)] 목록을 row(r, x) -> dict 함수로 컴파일
+
+    r 은 values() 행, x 는 행별 추가 값(좋아요 여부, 하위 목록 등) 입니다.
+    필드마다 시리얼라이저 필드 객체를 거치지 않고 dict 리터럴 하나로 변환합니다.
+    """
+    body = ", ".join(f"{key!r}: {expression}" for key, expression in expressions)
+    source = f"def {name}(r, x):\n    return {{{body}}}\n"
+    namespace = dict(_HELPERS)
+    exec(compile(source, f"<projection:{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def _lookup(field):
+    # 시리얼라이저 필드의 source (user.email) → values() 조회 이름 (user__email)
+    return "__".join(field.source_attrs)
+
+
+def _represent(field, value):
+    if value is None:
+        return None
+    if isinstance(field, PrimaryKeyRelatedField):
+        # values() 는 관계 객체 대신 기본 키를 반환 (시리얼라이저와 같은 PKOnlyObject)
+        value = PKOnlyObject(value)
+    return field.to_representation(value)
+
+
+class FastReadPathMixin:
+    """목록 조회 시 시리얼라이저 대신 values() 행을 바로 변환하는 뷰셋 믹스인
+
+    settings.FAST_READ_PATH 가 켜져 있으면 list 응답을 project_rows(쿼리셋 → values())
+    와 render_rows(행 목록 → dict 목록) 로 만들고 FastJSONRenderer 로 렌더링합니다.
+    응답 내용은 시리얼라이저 경로와 같습니다. 기본 구현은 모델 필드만 있는 시리얼라이저용이며,
+    관계, 메서드 필드가 있으면 세 메서드를 재정의합니다.
+    """
+
+    # 빠른 경로로 처리하는 액션 (list 외에는 fast_<액션> 을 구현)
+    fast_read_actions = ("list",)
+
+    def use_fast_read_path(self):
+        return settings.FAST_READ_PATH and self.action in self.fast_read_actions
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if not self.use_fast_read_path():
+            return renderers
+        return [
+            FastJSONRenderer() if type(renderer) is JSONRenderer else renderer
+            for renderer in renderers
+        ]
+
+    def get_read_fields(self):
+        """응답 필드 이름 (?fields=, ?exclude= 반영)
+
+        기본값은 시리얼라이저의 읽기 필드입니다. (SparseFieldsetMixin 이면 선택한 필드만)
+        """
+        fields = self.get_serializer().fields
+        return [name for name, field in fields.items() if not field.write_only]
+
+    def project_rows(self, queryset, names):
+        """쿼리셋 → 필요한 컬럼만 조회하는 values() 쿼리셋
+
+        기본값은 필드의 source 컬럼을 조회합니다. (관계, 메서드 필드가 있으면 재정의)
+        """
+        fields = self.get_serializer().fields
+        return queryset.values(*dict.fromkeys(_lookup(fields[name]) for name in names))
+
+    def render_rows(self, rows, names):
+        """values() 행 목록 → 응답 dict 목록 (조회 계획, apps.core.plans)
+
+        기본값은 시리얼라이저 필드의 to_representation 으로 변환합니다. (추가 조회 없음)
+        """
+        fields = self.get_serializer().fields
+        columns = [(name, fields[name], _lookup(fields[name])) for name in names]
+        yield from ()
+        return [
+            {name: _represent(field, row[lookup]) for name, field, lookup in columns}
+            for row in rows
+        ]
+
+    def fast_list(self, request, *args, **kwargs):
+        names = self.get_read_fields()
+        queryset = self.project_rows(self.filter_queryset(self.get_queryset()), names)
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(run_queries(self.render_rows(list(queryset), names)))
+        return self.get_paginated_response(run_queries(self.render_rows(page, names)))
+
+    async def afast_list(self, request, *args, **kwargs):
+        names = self.get_read_fields()
+        queryset = self.project_rows(self.filter_queryset(self.get_queryset()), names)
+        if self.paginator is None:
+            rows = [row async for row in queryset]
+            return Response(await arun_queries(self.render_rows(rows, names)))
+        page = await self.paginator.apaginate_queryset(queryset, request, view=self)
+        return self.get_paginated_response(
+            await arun_queries(self.render_rows(page, names))
+        )
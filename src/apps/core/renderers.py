@@ -0,0 +1,38 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """orjson 을 사용하는 JSONRenderer (출력 바이트는 JSONRenderer 와 동일)
+
+    float 는 포맷이 다를 수 있어 문자열, 정수, bool, None 으로만 이루어진
+    응답(빠른 읽기 경로의 목록 등)에만 사용합니다.
+    orjson 이 없거나, 들여쓰기를 요청했거나, 처리할 수 없는 값이 있으면
+    JSONRenderer 로 렌더링합니다.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # JSONRenderer 와 같이 U+2028, U+2029 는 이스케이프
+        return ret.replace("\u2028".encode(), b"\\u2028").replace(
+            "\u2029".encode(), b"\\u2029"
+        )
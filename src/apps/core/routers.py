@@ -0,0 +1,167 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# 쓰기 후 복제본 대신 기본 DB 에서 읽을 기한 (Unix 시각)
+PIN_COOKIE = "db_primary_until"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# 현재 요청의 조회를 복제본으로 보낼지 여부와 요청에서 사용할 복제본
+# (ReplicaRoutingMiddleware 가 요청마다 초기화)
+_use_replica = ContextVar("use_replica", default=False)
+_replica = ContextVar("db_replica", default=None)
+_pinned = ContextVar("db_pinned", default=False)
+
+
+def replica_aliases():
+    return [alias for alias in settings.DATABASES if alias != DEFAULT_DB_ALIAS]
+
+
+def choose_replica():
+    """복제본 하나를 선택 (요청 안의 조회가 모두 같은 복제본의 같은 시점을 읽도록)"""
+    replicas = replica_aliases()
+    return random.choice(replicas) if replicas else None
+
+
+def read_from_replica():
+    """현재 요청의 남은 조회를 복제본에서 읽기 (쓰기 직후 고정된 사용자는 제외)"""
+    _use_replica.set(True)
+
+
+@contextmanager
+def use_replica():
+    """블록 안의 조회를 복제본에서 읽기"""
+    tokens = [(_use_replica, _use_replica.set(True))]
+    if _replica.get() is None:
+        # 요청 밖(관리 명령 등) 에서는 블록마다 복제본 선택
+        tokens.append((_replica, _replica.set(choose_replica())))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """블록 안의 조회를 기본 DB 에서 읽기
+
+    만료 없이 저장하는 데이터(타임라인, RSS 등) 는 복제 지연으로 이전 내용이
+    계속 남지 않도록 기본 DB 에서 읽어야 합니다.
+    """
+    token = _use_replica.set(False)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+class ReplicaRouter:
+    """읽기/쓰기 DB 라우터
+
+    쓰기와 기본 조회는 기본 DB(default) 로 보내고, read_from_replica(),
+    use_replica() 로 표시한 조회(목록, 상세, 사이트맵) 만 요청마다 고른 복제본으로 보냅니다.
+    복제본이 없거나, 트랜잭션 안이거나, 최근에 쓰기를 한 사용자의 요청이면 기본 DB 를 사용합니다.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _use_replica.get() or _pinned.get():
+            return DEFAULT_DB_ALIAS
+        replica = _replica.get()
+        if replica is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return replica
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 기본 DB 와 같은 데이터
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본의 스키마는 복제로 반영
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaRoutingMiddleware:
+    """요청 단위 DB 라우팅 상태 관리
+
+    쓰기 요청이 성공하면 DATABASE_REPLICA_PIN_SECONDS 동안 쿠키로 고정해,
+    같은 사용자의 조회는 복제 지연과 관계없이 자신의 쓰기 결과를 읽도록 기본 DB 를 사용합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tokens = self.process_request(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            self.reset(tokens)
+        return self.process_response(request, response)
+
+    async def __acall__(self, request):
+        tokens = self.process_request(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.reset(tokens)
+        return self.process_response(request, response)
+
+    def process_request(self, request):
+        try:
+            pinned_until = float(request.COOKIES.get(PIN_COOKIE, 0))
+        except ValueError:
+            pinned_until = 0
+        pinned = request.method not in SAFE_METHODS or pinned_until > time.time()
+        return (
+            _use_replica.set(False),
+            _replica.set(None if pinned else choose_replica()),
+            _pinned.set(pinned),
+        )
+
+    def reset(self, tokens):
+        _use_replica.reset(tokens[0])
+        _replica.reset(tokens[1])
+        _pinned.reset(tokens[2])
+
+    def process_response(self, request, response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            seconds = settings.DATABASE_REPLICA_PIN_SECONDS
+            response.set_cookie(
+                PIN_COOKIE,
+                f"{time.time() + seconds:.3f}",
+                max_age=seconds,
+                httponly=True,
+                samesite="Lax",
+                secure=request.is_secure(),
+            )
+        return response
+
+
+class ReplicaReadMixin:
+    """replica_actions 의 조회를 복제본에서 읽는 뷰셋 믹스인
+
+    인증, 권한 확인은 기본 DB 에서 마친 뒤 액션의 조회만 복제본으로 보냅니다.
+    """
+
+    replica_actions = ("list", "retrieve")
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.action in self.replica_actions:
+            read_from_replica()
@@ -0,0 +1,93 @@
+import re
+from html import unescape
+
+from django.db import connection, models
+
+# 한글, 한자, 가나 등 공백으로 단어를 구분하기 어려운 문자
+CJK_PATTERN = re.compile(r"[ᄀ-ᇿ぀-ヿ㄰-㆏一-鿿가-힯]")
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def _word_tokens(word):
+    """한글이 포함된 단어는 문자 바이그램, 그 외에는 소문자 단어 그대로"""
+    word = word.lower()
+    if not CJK_PATTERN.search(word) or len(word) < 2:
+        return [word]
+    return [word[i : i + 2] for i in range(len(word) - 1)]
+
+
+def tokenize(text):
+    """FTS5(unicode61) 에 저장할 공백 구분 토큰 문자열"""
+    return " ".join(
+        token
+        for word in WORD_PATTERN.findall(unescape(text or ""))
+        for token in _word_tokens(word)
+    )
+
+
+def to_match_query(text):
+    """검색어를 FTS5 MATCH 구문으로 변환 (단어별 구문 검색, 단어 간 AND)"""
+    phrases = []
+    for word in WORD_PATTERN.findall(text or ""):
+        tokens = _word_tokens(word)
+        if len(tokens) == 1 and (
+            len(tokens[0]) == 1 or not CJK_PATTERN.search(tokens[0])
+        ):
+            # 영문, 숫자, 한 글자 검색어는 접두어 검색
+            phrases.append(f'"{tokens[0]}"*')
+        else:
+            phrases.append('"' + " ".join(tokens) + '"')
+    return " ".join(phrases)
+
+
+class SearchTokensField(models.TextField):
+    """FTS5 가상 테이블의 토큰 컬럼"""
+
+
+@SearchTokensField.register_lookup
+class Match(models.Lookup):
+    lookup_name = "match"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", lhs_params + rhs_params
+
+
+class SearchIndex:
+    """FTS5 가상 테이블 동기화 (rowid 기준 삭제 후 삽입)"""
+
+    def __init__(self, table, extra_columns=()):
+        self.table = table
+        self.extra_columns = list(extra_columns)
+
+    def update(self, rows):
+        """rows: (rowid, 본문, *추가 컬럼 값) 목록"""
+        rows = list(rows)
+        if not rows:
+            return
+        columns = ", ".join(["rowid", "tokens", *self.extra_columns])
+        placeholders = ", ".join(["%s"] * (len(self.extra_columns) + 2))
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {self.table} WHERE rowid = %s",
+                [(row[0],) for row in rows],
+            )
+            cursor.executemany(
+                f"INSERT INTO {self.table} ({columns}) VALUES ({placeholders})",
+                [(rowid, tokenize(text), *extra) for rowid, text, *extra in rows],
+            )
+
+    def delete(self, rowids):
+        rowids = list(rowids)
+        if not rowids:
+            return
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {self.table} WHERE rowid = %s",
+                [(rowid,) for rowid in rowids],
+            )
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
@@ -0,0 +1,205 @@
+import sqlite3
+import threading
+import time
+from functools import cache
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils.module_loading import import_string
+from rest_framework.throttling import AnonRateThrottle, ScopedRateThrottle
+
+# 키별 토큰 수를 갱신하고, 토큰이 부족하면 갱신하지 않음 (한 문장으로 원자적 확인 및 차감)
+# 남은 토큰 = min(용량, 이전 토큰 + 경과 시간 * 초당 충전량)
+# full_at: 버킷이 다시 가득 차는 시각 (이후에는 행이 없는 것과 같으므로 정리 대상)
+CONSUME_SQL = """
+INSERT INTO token_buckets (key, tokens, updated_at, full_at)
+VALUES (:key, :capacity - :cost, :now, :now + :cost / :rate)
+ON CONFLICT (key) DO UPDATE SET
+    tokens = min(:capacity, tokens + (:now - updated_at) * :rate) - :cost,
+    updated_at = :now,
+    full_at = :now + (
+        :capacity - min(:capacity, tokens + (:now - updated_at) * :rate) + :cost
+    ) / :rate
+WHERE min(:capacity, tokens + (:now - updated_at) * :rate) >= :cost
+RETURNING tokens
+"""
+
+
+class SQLiteBucketStore:
+    """SQLite 파일 기반 토큰 버킷 저장소 (같은 서버의 모든 워커가 공유)
+
+    키(사용자/IP + 범위) 당 (토큰 수, 갱신 시각) 한 행만 저장하고,
+    요청마다 UPSERT 한 번으로 충전과 차감을 함께 처리합니다.
+    기본 DB 와 쓰기 잠금을 다투지 않도록 별도 파일을 사용합니다.
+    가득 찬 버킷의 행은 prune_interval 초마다 삭제합니다. (IP 별 행이 계속 쌓이지 않도록)
+    """
+
+    def __init__(self, location, timeout=5, prune_interval=60):
+        self.location = str(location)
+        self.timeout = timeout
+        self.prune_interval = prune_interval
+        self._local = threading.local()
+        self._pruned_at = time.monotonic()
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.location, timeout=self.timeout, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            # 제한 상태는 유실되어도 되므로 커밋마다 fsync 하지 않음
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS token_buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL, "
+                "full_at REAL NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            self._local.connection = connection
+        return connection
+
+    def consume(self, key, capacity, rate, cost=1):
+        """토큰을 차감하고 (허용 여부, 다음 토큰까지 대기 시간(초)) 반환"""
+        params = {
+            "key": key,
+            "capacity": capacity,
+            "rate": rate,
+            "cost": cost,
+            "now": time.time(),
+        }
+        if time.monotonic() - self._pruned_at >= self.prune_interval:
+            # 워커별 주기 (동시에 실행되어도 결과는 같음)
+            self._pruned_at = time.monotonic()
+            self.prune(params["now"])
+        connection = self._connection()
+        if connection.execute(CONSUME_SQL, params).fetchall():
+            return True, None
+        row = connection.execute(
+            "SELECT tokens, updated_at FROM token_buckets WHERE key = ?", (key,)
+        ).fetchone()
+        tokens = min(capacity, row[0] + (params["now"] - row[1]) * rate)
+        return False, (cost - tokens) / rate
+
+    def prune(self, now=None):
+        """가득 찬 버킷 삭제 (다음 요청은 용량만큼 다시 시작하므로 제한 결과는 같음)"""
+        self._connection().execute(
+            "DELETE FROM token_buckets WHERE full_at <= ?", (now or time.time(),)
+        )
+
+    def clear(self):
+        self._connection().execute("DELETE FROM token_buckets")
+
+
+class MemoryBucketStore:
+    """프로세스 메모리 기반 토큰 버킷 저장소 (워커별 제한, 개발, 테스트용)"""
+
+    def __init__(self, prune_interval=60):
+        self.prune_interval = prune_interval
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._pruned_at = time.monotonic()
+
+    def consume(self, key, capacity, rate, cost=1):
+        now = time.time()
+        with self._lock:
+            if time.monotonic() - self._pruned_at >= self.prune_interval:
+                self._pruned_at = time.monotonic()
+                self._prune(now)
+            tokens, updated_at, _ = self._buckets.get(key, (capacity, now, now))
+            tokens = min(capacity, tokens + (now - updated_at) * rate)
+            if tokens < cost:
+                return False, (cost - tokens) / rate
+            tokens -= cost
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)
+        return True, None
+
+    def _prune(self, now):
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items() if bucket[2] > now
+        }
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+@cache
+def get_bucket_store():
+    config = getattr(settings, "THROTTLES", {})
+    backend = import_string(
+        config.get("BACKEND", "apps.core.throttling.MemoryBucketStore")
+    )
+    return backend(**config.get("OPTIONS", {}))
+
+
+class TokenBucketMixin:
+    """SimpleRateThrottle 의 기록 목록 대신 토큰 버킷을 사용하는 믹스인
+
+    "N/기간" 요율은 용량 N, 초당 N/기간 만큼 충전되는 버킷이 됩니다.
+    같은 요청에서 다시 확인하면 (async 뷰에서 동기 뷰로 넘어가는 경우) 차감하지 않습니다.
+    """
+
+    def allow_request(self, request, view):
+        checked = self._unchecked(request, view)
+        if checked is None:
+            return True
+        allowed, self._wait = get_bucket_store().consume(
+            self.key, self.num_requests, self.num_requests / self.duration
+        )
+        if allowed:
+            checked.add(self.key)
+        return allowed
+
+    async def aallow_request(self, request, view):
+        """allow_request 의 async 버전 (저장소 쓰기는 스레드에서 실행해 이벤트 루프를 막지 않음)"""
+        checked = self._unchecked(request, view)
+        if checked is None:
+            return True
+        allowed, self._wait = await sync_to_async(
+            get_bucket_store().consume, thread_sensitive=False
+        )(self.key, self.num_requests, self.num_requests / self.duration)
+        if allowed:
+            checked.add(self.key)
+        return allowed
+
+    def _unchecked(self, request, view):
+        # 차감이 필요하면 요청에서 확인한 키 목록, 아니면 None
+        if self.rate is None:
+            return None
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return None
+        # DRF Request 와 HttpRequest 가 공유
+        http_request = getattr(request, "_request", request)
+        checked = getattr(http_request, "_throttle_keys", None)
+        if checked is None:
+            checked = http_request._throttle_keys = set()
+        return None if self.key in checked else checked
+
+    def wait(self):
+        return self._wait
+
+
+class ScopedTokenBucketThrottle(TokenBucketMixin, ScopedRateThrottle):
+    """throttle_scope 별 토큰 버킷 제한 (로그인 사용자는 사용자, 그 외는 IP 기준)"""
+
+    def _unchecked(self, request, view):
+        # 뷰의 범위로 요율 결정 (ScopedRateThrottle 과 동일)
+        self.scope = getattr(view, self.scope_attr, None)
+        if not self.scope:
+            return None
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super()._unchecked(request, view)
+
+
+class AnonReadThrottle(TokenBucketMixin, AnonRateThrottle):
+    """비로그인 사용자의 조회 요청 제한 (IP 기준, 크롤러 차단용)"""
+
+    scope = "anon:read"
+
+    def get_cache_key(self, request, view):
+        if request.method not in ("GET", "HEAD"):
+            return None
+        return super().get_cache_key(request, view)
@@ -0,0 +1,170 @@
+import atexit
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from functools import cache, wraps
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class DirectWriter:
+    """요청 스레드에서 바로 트랜잭션을 실행하는 쓰기 백엔드"""
+
+    def submit(self, func, *args, **kwargs):
+        with transaction.atomic():
+            return func(*args, **kwargs)
+
+    def stop(self):
+        pass
+
+
+class WriteJob:
+    """쓰기 스레드에서 실행할 작업과 결과를 기다리는 Future"""
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future()
+        self.result = None
+        self.error = None
+
+    def run(self):
+        self.result, self.error = None, None
+        try:
+            # 작업마다 세이브포인트를 두어 실패한 작업만 롤백
+            with transaction.atomic():
+                self.result = self.func(*self.args, **self.kwargs)
+        except Exception as error:
+            self.error = error
+
+    def finish(self, error=None):
+        error = error or self.error
+        if error is not None:
+            self.future.set_exception(error)
+        else:
+            self.future.set_result(self.result)
+
+
+class WriteFunnel:
+    """프로세스당 쓰기 스레드 하나로 쓰기를 모아 커밋하는 쓰기 백엔드
+
+    요청 스레드는 작업을 큐에 넣고 결과를 기다리며, 쓰기 스레드는 큐에 쌓인 작업을
+    최대 max_batch 개까지 한 트랜잭션(작업별 세이브포인트) 으로 실행해 한 번에 커밋합니다.
+    SQLite 의 쓰기 잠금을 요청마다 다투지 않고, 커밋(WAL 쓰기) 횟수도 줄어듭니다.
+    결과는 커밋 후에 전달되므로 요청은 커밋된 데이터를 바로 읽을 수 있습니다.
+    timeout 초 안에 실행되지 않은 작업은 취소하고 TimeoutError 를 발생시킵니다.
+    (이미 실행 중인 작업은 커밋 결과까지 기다림)
+    """
+
+    def __init__(self, max_batch=64, timeout=30):
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self._queue = queue.SimpleQueue()
+        self._writer = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def submit(self, func, *args, **kwargs):
+        if (
+            transaction.get_connection().in_atomic_block
+            or threading.current_thread() is self._writer
+        ):
+            # 이미 트랜잭션 안이면 그 트랜잭션에서 실행
+            with transaction.atomic():
+                return func(*args, **kwargs)
+        job = WriteJob(func, args, kwargs)
+        self._start_writer()
+        self._queue.put(job)
+        try:
+            return job.future.result(timeout=self.timeout)
+        except TimeoutError:
+            # 아직 실행 전이면 취소 (쓰기 스레드가 건너뜀), 실행 중이면 커밋 결과까지 대기
+            if job.future.cancel():
+                raise
+            return job.future.result()
+
+    def _start_writer(self):
+        if self._writer:
+            return
+        with self._lock:
+            if self._writer:
+                return
+            self._writer = threading.Thread(
+                target=self._run, name="write-funnel", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.stop)
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            batch = [job]
+            while len(batch) < self.max_batch:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._queue.put(None)
+                    break
+                batch.append(job)
+            # 기다리다 취소된 작업은 실행하지 않음
+            batch = [job for job in batch if job.future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                self._commit(batch)
+            except Exception:
+                logger.exception("쓰기 작업 실행 실패")
+            finally:
+                close_old_connections()
+
+    def _commit(self, batch):
+        try:
+            with transaction.atomic():
+                for job in batch:
+                    job.run()
+        except Exception as error:
+            if len(batch) == 1:
+                batch[0].finish(error)
+                return
+            # 커밋 실패 시 다른 작업에 영향이 없도록 하나씩 다시 실행
+            for job in batch:
+                self._commit([job])
+            return
+        for job in batch:
+            job.finish()
+
+    def stop(self):
+        if self._writer and not self._stopped.is_set():
+            self._stopped.set()
+            self._queue.put(None)
+            self._writer.join()
+
+
+@cache
+def get_writer():
+    config = getattr(settings, "WRITES", {})
+    backend = import_string(config.get("BACKEND", "apps.core.writes.DirectWriter"))
+    return backend(**config.get("OPTIONS", {}))
+
+
+def atomic_write(func):
+    """쓰기 작업 데코레이터 (transaction.atomic 대신 사용)
+
+    settings.WRITES 의 백엔드에 따라 요청 스레드의 트랜잭션, 또는 쓰기 스레드에서 실행합니다.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return get_writer().submit(func, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,194 @@
+import hashlib
+import threading
+import time
+import uuid
+from collections import Counter
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.core.cache import shared_cache
+
+# 비로그인 피드 응답 캐시 유지 시간
+FEED_RESPONSE_TIMEOUT = 60 * 5
+
+# 적중/실패 수를 공유 캐시에 반영하는 주기 (초)
+STATS_FLUSH_INTERVAL = 10
+_stats = Counter()
+_stats_lock = threading.Lock()
+_stats_flushed_at = time.monotonic()
+
+
+def _generation_key(scope):
+    return f"feed:generation:{settings.DJANGO_ENVIRONMENT}:{scope}"
+
+
+def _stats_key(name):
+    # 응답 캐시와 다른 네임스페이스 (집계할 때마다 응답 캐시가 무효화되지 않도록)
+    return f"feed:stats:{settings.DJANGO_ENVIRONMENT}:{name}"
+
+
+def get_generations(scopes):
+    """범위(global, category:<id>, feed:<uuid>)별 세대 값 조회"""
+    keys = [_generation_key(scope) for scope in scopes]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            # 캐시에서 밀려난 경우에도 이전 세대와 겹치지 않도록 현재 시각으로 시작
+            cache.add(key, time.time_ns(), timeout=None)
+            generations[key] = cache.get(key)
+    return [generations[key] for key in keys]
+
+
+async def aget_generations(scopes):
+    keys = [_generation_key(scope) for scope in scopes]
+    generations = await cache.aget_many(keys)
+    for key in keys:
+        if key not in generations:
+            await cache.aadd(key, time.time_ns(), timeout=None)
+            generations[key] = await cache.aget(key)
+    return [generations[key] for key in keys]
+
+
+def bump_generations(scopes):
+    """범위별 세대 값을 올려 해당 범위의 응답 캐시를 무효화"""
+    for scope in scopes:
+        key = _generation_key(scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+
+
+def feed_scopes(feed_uuid, *category_ids):
+    """피드 변경 시 무효화할 범위 (카테고리를 옮긴 경우 이전 카테고리 포함)"""
+    scopes = ["global", f"feed:{feed_uuid}"]
+    for category_id in category_ids:
+        if category_id is not None:
+            scopes.append(f"category:{category_id}")
+    return scopes
+
+
+def activity_scopes(feed_uuid):
+    """좋아요, 댓글, 신고 변경 시 무효화할 범위
+
+    목록 구성은 바뀌지 않으므로 피드 범위만 무효화하고,
+    목록 응답 캐시는 페이지에 포함된 피드의 세대 값으로 확인합니다. (page_scopes)
+    """
+    return [f"feed:{feed_uuid}"]
+
+
+def list_scopes(request):
+    """피드 목록 요청이 의존하는 범위"""
+    categories = request.query_params.get("categories")
+    if categories:
+        ids = sorted({c.strip() for c in categories.split(",") if c.strip()})
+        if ids and all(c.isdigit() for c in ids):
+            return [f"category:{c}" for c in ids]
+    return ["global"]
+
+
+def detail_scopes(pk):
+    """피드 상세 요청이 의존하는 범위"""
+    try:
+        return [f"feed:{uuid.UUID(str(pk))}"]
+    except ValueError:
+        return None
+
+
+def page_scopes(page):
+    """목록 응답 페이지에 포함된 피드의 범위 (모델 객체, values() 행 모두 지원)"""
+    return [
+        f"feed:{row['uuid'] if isinstance(row, dict) else row.pk}" for row in page or ()
+    ]
+
+
+def response_entry(data, scopes):
+    """응답 캐시 값 (응답에 포함된 피드의 세대 값과 함께 저장)"""
+    return {"data": data, "feeds": dict(zip(scopes, get_generations(scopes)))}
+
+
+async def aresponse_entry(data, scopes):
+    return {"data": data, "feeds": dict(zip(scopes, await aget_generations(scopes)))}
+
+
+def is_fresh(entry):
+    """응답에 포함된 피드가 저장 이후 바뀌지 않았는지"""
+    scopes = list(entry["feeds"])
+    return not scopes or get_generations(scopes) == list(entry["feeds"].values())
+
+
+async def ais_fresh(entry):
+    scopes = list(entry["feeds"])
+    return not scopes or await aget_generations(scopes) == list(entry["feeds"].values())
+
+
+def response_key(request, action, scopes):
+    return _response_key(request, action, get_generations(scopes))
+
+
+async def aresponse_key(request, action, scopes):
+    return _response_key(request, action, await aget_generations(scopes))
+
+
+def _response_key(request, action, generations):
+    generations = ".".join(str(g) for g in generations)
+    # 응답의 페이지 링크가 요청 URL 로 만들어지므로 URL 전체를 키로 사용
+    digest = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    return (
+        f"feed:response:{settings.DJANGO_ENVIRONMENT}:{action}:{generations}:{digest}"
+    )
+
+
+def rss_key(request):
+    generation = get_generations(["rss"])[0]
+    return f"feed:rss:{settings.DJANGO_ENVIRONMENT}:{generation}:{request.get_host()}"
+
+
+def record(hit):
+    """응답 캐시 적중/실패 수 집계 (프로세스 메모리에 모았다가 주기적으로 공유 캐시에 반영)"""
+    if _count(hit):
+        flush_stats()
+
+
+async def arecord(hit):
+    if _count(hit):
+        await sync_to_async(flush_stats)()
+
+
+def _count(hit):
+    # 요청마다 공유 캐시에 쓰지 않도록 메모리에서 세고, 반영할 때가 되었는지 반환
+    with _stats_lock:
+        _stats["hit" if hit else "miss"] += 1
+        return time.monotonic() - _stats_flushed_at >= STATS_FLUSH_INTERVAL
+
+
+def flush_stats():
+    global _stats_flushed_at
+    with _stats_lock:
+        stats = dict(_stats)
+        _stats.clear()
+        _stats_flushed_at = time.monotonic()
+    shared = shared_cache()
+    for name, count in stats.items():
+        key = _stats_key(name)
+        try:
+            shared.incr(key, count)
+        except ValueError:
+            if not shared.add(key, count, timeout=None):
+                shared.incr(key, count)
+
+
+def get_stats():
+    """모든 워커의 적중/실패 수 (다른 워커 값은 STATS_FLUSH_INTERVAL 만큼 지연)"""
+    flush_stats()
+    counts = shared_cache().get_many([_stats_key("hit"), _stats_key("miss")])
+    hits = counts.get(_stats_key("hit"), 0)
+    misses = counts.get(_stats_key("miss"), 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+    }
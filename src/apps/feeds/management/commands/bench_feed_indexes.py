@@ -0,0 +1,145 @@
+import itertools
+import random
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.feeds.models import Feed, FeedCategory
+from apps.feeds.v1.filters import FeedFilter
+from apps.feeds.v1.paginations import FeedCursorPagination
+from apps.users.models import User
+
+
+class _Request:
+    """FeedFilter 에 전달할 최소 요청 객체"""
+
+    def __init__(self, user):
+        self.user = user
+
+
+class Command(BaseCommand):
+    """피드 타임라인 쿼리 플랜 회귀 벤치마크
+
+    대량의 피드를 시딩한 뒤 FeedFilter 의 모든 조합에 대해
+    EXPLAIN QUERY PLAN 으로 인덱스 사용 여부를 확인합니다.
+    시딩한 데이터는 종료 시 롤백됩니다.
+    """
+
+    help = "피드 목록 쿼리가 모든 필터 조합에서 인덱스를 사용하는지 확인합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--feeds", type=int, default=100_000)
+        parser.add_argument("--users", type=int, default=1_000)
+        parser.add_argument("--categories", type=int, default=10)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("SQLite 에서만 실행할 수 있습니다.")
+        self.verbosity = options["verbosity"]
+        failures = []
+        with transaction.atomic():
+            user, categories = self._seed(options)
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+            for params in self._filter_combinations(categories):
+                failures += self._check(params, user)
+            transaction.set_rollback(True)
+        if failures:
+            raise CommandError(
+                "인덱스를 사용하지 않는 조합이 있습니다:\n" + "\n".join(failures)
+            )
+        self.stdout.write(self.style.SUCCESS("모든 필터 조합이 인덱스를 사용합니다."))
+
+    def _seed(self, options):
+        started = time.perf_counter()
+        categories = FeedCategory.objects.bulk_create(
+            FeedCategory(key=f"bench-{i}", name=f"bench-{i}", emoji="🦀", color="")
+            for i in range(options["categories"])
+        )
+        users = User.objects.bulk_create(
+            User(email=f"bench-{i}@bench.local") for i in range(options["users"])
+        )
+        now = timezone.now()
+        batch = []
+        for i in range(options["feeds"]):
+            batch.append(
+                Feed(
+                    uuid=uuid.uuid4(),
+                    user=random.choice(users),
+                    category=random.choice(categories),
+                    content=f"bench {i}",
+                    is_displayed=random.random() > 0.05,
+                    # 분 단위 간격으로 생성해 게시 일시가 겹치도록 함
+                    published_at=now - timedelta(minutes=random.randint(0, 525_600)),
+                )
+            )
+            if len(batch) >= options["batch_size"]:
+                Feed.objects.bulk_create(batch)
+                batch = []
+        Feed.objects.bulk_create(batch)
+        self.stdout.write(
+            f"시딩 완료: 피드 {options['feeds']}건 ({time.perf_counter() - started:.1f}s)"
+        )
+        return users[0], categories
+
+    def _filter_combinations(self, categories):
+        now = timezone.now()
+        candidates = {
+            "categories": [
+                str(categories[0].pk),
+                ",".join(str(c.pk) for c in categories[:3]),
+            ],
+            "writer": ["me"],
+            "published_at__gte": [(now - timedelta(days=30)).isoformat()],
+            "published_at__lte": [(now - timedelta(days=7)).isoformat()],
+        }
+        keys = list(candidates)
+        for size in range(len(keys) + 1):
+            for selected in itertools.combinations(keys, size):
+                for values in itertools.product(*(candidates[k] for k in selected)):
+                    yield dict(zip(selected, values))
+
+    def _check(self, params, user):
+        queryset = (
+            Feed.objects.filter(is_displayed=True)
+            .select_related("user__profile", "category")
+            .filter(category__is_displayed=True)
+        )
+        filterset = FeedFilter(data=params, queryset=queryset, request=_Request(user))
+        if not filterset.is_valid():
+            return [f"{params}: {dict(filterset.errors)}"]
+        pagination = FeedCursorPagination()
+        ordering = pagination.ordering
+        queryset = filterset.qs.order_by(*ordering)
+        first_page = list(queryset[: pagination.page_size])
+        failures = self._explain(params, queryset[: pagination.page_size + 1])
+        if len(first_page) == pagination.page_size:
+            # 다음 페이지 (커서 위치 이후 범위 조회)
+            position = pagination._get_position_from_instance(first_page[-1], ordering)
+            seek = queryset.filter(pagination._seek_condition(ordering, position))
+            failures += self._explain(
+                {**params, "cursor": "next"}, seek[: pagination.page_size + 1]
+            )
+        return failures
+
+    def _explain(self, params, queryset):
+        started = time.perf_counter()
+        list(queryset)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        plan = queryset.explain()
+        full_scans = [
+            line
+            for line in plan.splitlines()
+            if f"SCAN {Feed._meta.db_table}" in line and "INDEX" not in line
+        ]
+        label = params or "(필터 없음)"
+        self.stdout.write(f"{elapsed:8.2f}ms  {label}")
+        if self.verbosity > 1:
+            self.stdout.write(plan)
+        return [f"{label}\n{plan}"] if full_scans else []
@@ -0,0 +1,92 @@
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.core.counters import AtomicCounter, BufferedCounter
+from apps.feeds.models import Feed, FeedCategory, FeedLike
+from apps.users.models import User
+
+
+def legacy_increment(model, pk, field, delta=1):
+    """기존 방식 (조회 후 전체 컬럼 저장)"""
+    instance = model.objects.get(pk=pk)
+    setattr(instance, field, getattr(instance, field) + delta)
+    instance.save()
+
+
+class Command(BaseCommand):
+    """단일 피드에 동시에 좋아요가 몰릴 때의 카운터 처리량 벤치마크
+
+    사용자별 좋아요 생성과 좋아요 수 증가를 하나의 트랜잭션으로 실행하고
+    처리량, 실패 건수, 최종 좋아요 수의 정확도를 출력합니다.
+    시딩한 데이터는 종료 시 삭제됩니다.
+    """
+
+    help = "단일 피드 좋아요 처리량을 카운터 방식별로 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--likes", type=int, default=2_000)
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument(
+            "--mode",
+            action="append",
+            choices=["legacy", "atomic", "buffered"],
+            help="측정할 방식 (기본값: 전체)",
+        )
+
+    def handle(self, *args, **options):
+        for mode in options["mode"] or ["legacy", "atomic", "buffered"]:
+            self._run(mode, options["likes"], options["threads"])
+
+    def _run(self, mode, likes, threads):
+        category = FeedCategory.objects.create(
+            key=f"bench-{uuid.uuid4().hex[:8]}", name="bench", emoji="🦀", color=""
+        )
+        users = User.objects.bulk_create(
+            User(email=f"bench-{uuid.uuid4().hex}@bench.local") for _ in range(likes)
+        )
+        feed = Feed.objects.create(
+            uuid=uuid.uuid4(),
+            user=users[0],
+            category=category,
+            content="hot feed",
+            published_at=timezone.now(),
+        )
+        if mode == "legacy":
+            increment = legacy_increment
+        elif mode == "atomic":
+            increment = AtomicCounter().increment
+        else:
+            counter = BufferedCounter(flush_interval=0.1)
+            increment = counter.increment
+
+        def like(user):
+            try:
+                with transaction.atomic():
+                    FeedLike.objects.create(feed=feed, user=user)
+                    increment(Feed, feed.pk, "likes_count")
+                return True
+            except Exception:
+                return False
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            succeeded = sum(executor.map(like, users))
+        elapsed = time.perf_counter() - started
+        if mode == "buffered":
+            counter.stop()
+
+        feed.refresh_from_db()
+        self.stdout.write(
+            f"{mode:>8}: {succeeded / elapsed:8.1f} likes/s  "
+            f"성공 {succeeded}/{likes}  "
+            f"likes_count={feed.likes_count} (유실 {succeeded - feed.likes_count})"
+        )
+        User.objects.filter(pk__in=[user.pk for user in users]).delete()
+        category.delete()
@@ -0,0 +1,129 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.comments.models import Comment
+from apps.comments.v1.views import CommentViewSet
+from apps.feeds.models import Feed, FeedCategory, FeedLike
+from apps.feeds.v1.views import FeedViewSet
+from apps.users.models import User, UserProfile
+
+QUERIES = ["", "?fields=uuid,content,published_at", "?exclude=best_comment"]
+
+
+class Command(BaseCommand):
+    """피드, 댓글 목록의 시리얼라이저 경로와 빠른 읽기 경로 벤치마크
+
+    같은 요청을 두 경로로 처리해 응답 바이트가 같은지 확인하고
+    초당 처리 요청 수를 출력합니다. (로그인 사용자 기준, 응답 캐시 미사용)
+    시딩한 데이터는 트랜잭션을 롤백해 삭제합니다.
+    """
+
+    help = "목록 조회의 시리얼라이저 경로와 빠른 읽기 경로 처리량을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--feeds", type=int, default=200)
+        parser.add_argument("--comments", type=int, default=10)
+        parser.add_argument("--requests", type=int, default=300)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user, feed = self._seed(options["feeds"], options["comments"])
+            targets = [
+                (
+                    f"/api/v1/feeds/{query}",
+                    FeedViewSet.as_view({"get": "list"}),
+                    {},
+                )
+                for query in QUERIES
+            ] + [
+                (
+                    f"/api/v1/feeds/{feed.pk}/comments/{query}",
+                    CommentViewSet.as_view({"get": "list"}),
+                    {"feed_uuid": str(feed.pk)},
+                )
+                for query in ["", "?exclude=replies"]
+            ]
+            for path, view, kwargs in targets:
+                self._run(path, view, kwargs, user, options["requests"])
+            transaction.set_rollback(True)
+
+    def _seed(self, feeds, comments):
+        suffix = uuid.uuid4().hex[:8]
+        category = FeedCategory.objects.create(
+            key=f"bench-{suffix}", name="bench", emoji="🦀", color=""
+        )
+        users = User.objects.bulk_create(
+            User(email=f"bench-{suffix}-{i}@bench.local") for i in range(10)
+        )
+        UserProfile.objects.bulk_create(
+            UserProfile(user=user, nickname=f"bench-{suffix}-{i}")
+            for i, user in enumerate(users)
+        )
+        now = timezone.now()
+        feed_objects = Feed.objects.bulk_create(
+            Feed(
+                uuid=uuid.uuid4(),
+                user=users[i % len(users)],
+                category=category,
+                content=f"벤치마크 피드 {i}",
+                published_at=now - timezone.timedelta(minutes=i),
+            )
+            for i in range(feeds)
+        )
+        parents = Comment.objects.bulk_create(
+            Comment(
+                user=users[j % len(users)],
+                feed=feed,
+                content=f"댓글 {j}",
+                likes_count=j,
+            )
+            for feed in feed_objects
+            for j in range(comments)
+        )
+        Comment.objects.bulk_create(
+            Comment(
+                user=users[j % len(users)],
+                feed=parent.feed,
+                parent=parent,
+                content=f"답글 {j}",
+            )
+            for parent in parents[:comments]
+            for j in range(5)
+        )
+        FeedLike.objects.bulk_create(
+            FeedLike(user=users[0], feed=feed) for feed in feed_objects[::3]
+        )
+        return users[0], feed_objects[0]
+
+    def _request(self, path, view, kwargs, user):
+        request = APIRequestFactory().get(path)
+        force_authenticate(request, user=user)
+        response = view(request, **kwargs)
+        response.render()
+        if response.status_code != 200:
+            raise CommandError(f"{path}: {response.status_code}")
+        return response.content
+
+    def _run(self, path, view, kwargs, user, requests):
+        contents = {}
+        rates = {}
+        for fast in (False, True):
+            with override_settings(FAST_READ_PATH=fast):
+                contents[fast] = self._request(path, view, kwargs, user)
+                started = time.perf_counter()
+                for _ in range(requests):
+                    self._request(path, view, kwargs, user)
+                rates[fast] = requests / (time.perf_counter() - started)
+        identical = "동일" if contents[False] == contents[True] else "불일치"
+        self.stdout.write(
+            f"{path}\n"
+            f"  serializer: {rates[False]:8.1f} req/s\n"
+            f"        fast: {rates[True]:8.1f} req/s "
+            f"(x{rates[True] / rates[False]:.2f}, 응답 {identical})"
+        )
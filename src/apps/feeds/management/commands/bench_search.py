@@ -0,0 +1,97 @@
+import random
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.feeds.models import Feed, FeedCategory
+from apps.feeds.search import index_feeds
+from apps.feeds.v1.filters import FeedFilter
+from apps.feeds.v1.paginations import FeedCursorPagination
+from apps.users.models import User
+
+WORDS = (
+    "러스트 코리아 비동기 프로그래밍 소유권 빌림 검사기 수명 트레이트 제네릭 "
+    "매크로 패턴 매칭 열거형 구조체 모듈 크레이트 카고 테스트 문서 성능 메모리 "
+    "안전성 동시성 스레드 채널 밋업 스터디 발표 강의 뉴스 프로젝트 추천 질문 답변 "
+    "웹 서버 임베디드 게임 컴파일러 에러 tokio axum serde wasm cargo clippy"
+).split()
+
+
+class _Request:
+    """FeedFilter, 페이지네이션에 전달할 최소 요청 객체"""
+
+    def __init__(self, params):
+        self.query_params = params
+
+
+class Command(BaseCommand):
+    """피드 검색(q=) 지연 시간 벤치마크
+
+    한국어 피드를 대량으로 시딩하고 색인한 뒤 목록 API 와 같은 쿼리로
+    검색해 p50, p95 지연 시간을 출력합니다. 시딩한 데이터는 롤백됩니다.
+    """
+
+    help = "피드 검색 지연 시간(p50, p95)을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--feeds", type=int, default=100_000)
+        parser.add_argument("--queries", type=int, default=500)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self._seed(options)
+            latencies = [
+                self._search(" ".join(random.sample(WORDS, random.randint(1, 2))))
+                for _ in range(options["queries"])
+            ]
+            transaction.set_rollback(True)
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        self.stdout.write(
+            f"검색 {len(latencies)}회: "
+            f"p50 {statistics.median(latencies):.2f}ms, "
+            f"p95 {p95:.2f}ms, max {latencies[-1]:.2f}ms"
+        )
+
+    def _seed(self, options):
+        started = time.perf_counter()
+        category = FeedCategory.objects.create(
+            key="bench", name="bench", emoji="🦀", color=""
+        )
+        user = User.objects.create(email="bench@bench.local")
+        now = timezone.now()
+        batch = []
+        for i in range(options["feeds"]):
+            batch.append(
+                Feed(
+                    uuid=uuid.uuid4(),
+                    user=user,
+                    category=category,
+                    content=" ".join(random.choices(WORDS, k=random.randint(5, 40))),
+                    published_at=now - timedelta(minutes=i),
+                )
+            )
+            if len(batch) >= options["batch_size"] or i == options["feeds"] - 1:
+                Feed.objects.bulk_create(batch)
+                index_feeds(batch)
+                batch = []
+        self.stdout.write(
+            f"시딩 완료: 피드 {options['feeds']}건 ({time.perf_counter() - started:.1f}s)"
+        )
+
+    def _search(self, text):
+        request = _Request({"q": text})
+        started = time.perf_counter()
+        queryset = Feed.objects.filter(is_displayed=True).select_related(
+            "user__profile", "category"
+        )
+        queryset = FeedFilter(data={"q": text}, queryset=queryset).qs
+        ordering = FeedCursorPagination().get_ordering(request, queryset, None)
+        list(queryset.order_by(*ordering)[: FeedCursorPagination.page_size + 1])
+        return (time.perf_counter() - started) * 1000
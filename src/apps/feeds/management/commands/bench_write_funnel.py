@@ -0,0 +1,131 @@
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.comments.models import Comment
+from apps.comments.v1.serializers import CommentSerializer
+from apps.core import writes
+from apps.feeds.models import Feed, FeedCategory, FeedLike
+from apps.feeds.v1.serializers import FeedLikeSerializer
+from apps.users.models import User
+
+BACKENDS = {
+    "direct": "apps.core.writes.DirectWriter",
+    "funnel": "apps.core.writes.WriteFunnel",
+}
+
+
+class Command(BaseCommand):
+    """동시 쓰기 처리량 벤치마크 (요청 스레드 트랜잭션 vs 쓰기 스레드 묶음 커밋)
+
+    쓰기 스레드마다 FeedLikeSerializer 로 좋아요를 누르거나 취소하고,
+    CommentSerializer 로 댓글을 작성합니다. (시그널, 카운터 포함 실제 쓰기 경로)
+    처리량, p50/p99 지연 시간, 실패 건수와 최종 좋아요 수의 정확도를 출력합니다.
+    시딩한 데이터는 종료 시 삭제됩니다.
+    """
+
+    help = "동시 쓰기 처리량을 쓰기 백엔드(direct, funnel)별로 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--writers", type=int, default=50)
+        parser.add_argument("--writes", type=int, default=20, help="스레드당 쓰기 수")
+        parser.add_argument("--feeds", type=int, default=20)
+        parser.add_argument(
+            "--backend", action="append", choices=list(BACKENDS), help="기본값: 전체"
+        )
+
+    def handle(self, *args, **options):
+        for backend in options["backend"] or list(BACKENDS):
+            with override_settings(WRITES={"BACKEND": BACKENDS[backend]}):
+                writes.get_writer.cache_clear()
+                try:
+                    self._run(backend, options)
+                finally:
+                    writes.get_writer().stop()
+                    writes.get_writer.cache_clear()
+
+    def _seed(self, writers, feeds):
+        suffix = uuid.uuid4().hex[:8]
+        category = FeedCategory.objects.create(
+            key=f"bench-{suffix}", name="bench", emoji="🦀", color=""
+        )
+        users = User.objects.bulk_create(
+            User(email=f"bench-{suffix}-{i}@bench.local") for i in range(writers)
+        )
+        now = timezone.now()
+        feed_objects = Feed.objects.bulk_create(
+            Feed(
+                uuid=uuid.uuid4(),
+                user=users[i % len(users)],
+                category=category,
+                content=f"벤치마크 피드 {i}",
+                published_at=now - timezone.timedelta(minutes=i),
+            )
+            for i in range(feeds)
+        )
+        return category, users, feed_objects
+
+    def _write(self, user, feeds, count):
+        latencies, errors = [], 0
+        for i in range(count):
+            feed = random.choice(feeds)
+            started = time.perf_counter()
+            try:
+                if i % 4 == 3:
+                    CommentSerializer().create(
+                        {"user": user, "feed": feed, "content": f"댓글 {i}"}
+                    )
+                else:
+                    # 좋아요 뷰와 같이 기존 좋아요가 있으면 취소
+                    serializer = FeedLikeSerializer()
+                    instance = FeedLike.objects.filter(feed=feed, user=user).first()
+                    if instance is None:
+                        serializer.create({"feed": feed, "user": user})
+                    else:
+                        serializer.update(instance, {})
+            except Exception:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - started)
+            finally:
+                # 요청 종료 시 처리
+                close_old_connections()
+        return latencies, errors
+
+    def _run(self, backend, options):
+        category, users, feeds = self._seed(options["writers"], options["feeds"])
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options["writers"]) as executor:
+                results = list(
+                    executor.map(
+                        lambda user: self._write(user, feeds, options["writes"]),
+                        users,
+                    )
+                )
+            elapsed = time.perf_counter() - started
+
+            latencies = sorted(l for result in results for l in result[0])
+            errors = sum(result[1] for result in results)
+            likes = FeedLike.objects.filter(feed__in=feeds).count()
+            counted = sum(
+                Feed.objects.filter(pk__in=[feed.pk for feed in feeds]).values_list(
+                    "likes_count", flat=True
+                )
+            )
+            self.stdout.write(
+                f"{backend:>6}: {len(latencies) / elapsed:8.1f} writes/s  "
+                f"p50 {latencies[len(latencies) // 2] * 1000:7.1f}ms  "
+                f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:7.1f}ms  "
+                f"실패 {errors}  좋아요 {likes} (likes_count {counted})"
+            )
+        finally:
+            Comment.objects.filter(feed__in=feeds).delete()
+            User.objects.filter(pk__in=[user.pk for user in users]).delete()
+            category.delete()
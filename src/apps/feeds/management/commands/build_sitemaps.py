@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.feeds.sitemaps import SITEMAP_SECTION_SIZE, build_sitemaps
+
+
+class Command(BaseCommand):
+    """피드 사이트맵 인덱스와 섹션 파일을 SITEMAP_ROOT 에 생성"""
+
+    help = "피드 사이트맵 파일을 미리 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default=settings.SITEMAP_BASE_URL)
+        parser.add_argument("--section-size", type=int, default=SITEMAP_SECTION_SIZE)
+
+    def handle(self, *args, **options):
+        sections = build_sitemaps(
+            options["base_url"].rstrip("/"), options["section_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"사이트맵 섹션 {sections}개를 생성했습니다.")
+        )
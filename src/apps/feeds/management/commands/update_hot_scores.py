@@ -0,0 +1,51 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.feeds.ranking import HOT_WINDOW, update_hot_scores
+
+
+class Command(BaseCommand):
+    """피드 인기 점수 갱신
+
+    --loop 로 실행하면 --interval 초마다 변경된 피드만 다시 계산하고,
+    --decay-interval 초마다 기간 내 전체 피드의 점수를 감쇠시킵니다.
+    """
+
+    help = "피드 인기 점수(ordering=hot)를 갱신합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true", help="계속 실행")
+        parser.add_argument("--interval", type=float, default=60)
+        parser.add_argument("--decay-interval", type=float, default=60 * 10)
+        parser.add_argument(
+            "--since-minutes",
+            type=float,
+            help="최초 실행 시 변경 피드 조회 기간",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since_minutes"] is not None:
+            since = timezone.now() - timedelta(minutes=options["since_minutes"])
+        last_decay = None
+        while True:
+            started = timezone.now()
+            decay = (
+                last_decay is None
+                or (started - last_decay).total_seconds() >= options["decay_interval"]
+            )
+            updated = update_hot_scores(since=since, decay=decay)
+            if decay:
+                last_decay = started
+            self.stdout.write(
+                f"인기 점수 {updated}건 갱신"
+                + (f" (감쇠, 최근 {HOT_WINDOW.days}일)" if decay else "")
+            )
+            if not options["loop"]:
+                return
+            # 계산 중 변경된 피드도 다음 주기에 포함되도록 시작 시각 기준
+            since = started
+            time.sleep(options["interval"])
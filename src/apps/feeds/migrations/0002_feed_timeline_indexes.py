@@ -0,0 +1,39 @@
+# Generated by Django 5.1.3 on 2026-10-18 11:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("feeds", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                condition=models.Q(("is_displayed", True)),
+                fields=["-published_at"],
+                name="feed_displayed_published_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                condition=models.Q(("is_displayed", True)),
+                fields=["category", "-published_at"],
+                name="feed_category_published_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                condition=models.Q(("is_displayed", True)),
+                fields=["user", "-published_at"],
+                name="feed_user_published_idx",
+            ),
+        ),
+    ]
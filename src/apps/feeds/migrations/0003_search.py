@@ -0,0 +1,31 @@
+# Generated by Django 5.1.3 on 2026-10-18 11:49
+
+import apps.core.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("feeds", "0002_feed_timeline_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FeedSearch",
+            fields=[
+                ("rowid", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("tokens", apps.core.search.SearchTokensField(help_text="검색 토큰")),
+                ("rank", models.FloatField(help_text="검색 순위")),
+            ],
+            options={
+                "db_table": "feed_search",
+                "managed": False,
+            },
+        ),
+        # 한글은 tokenize() 에서 바이그램으로 분리해 저장 (unicode61 토크나이저)
+        migrations.RunSQL(
+            sql="CREATE VIRTUAL TABLE feed_search USING fts5(uuid UNINDEXED, tokens)",
+            reverse_sql="DROP TABLE feed_search",
+        ),
+    ]
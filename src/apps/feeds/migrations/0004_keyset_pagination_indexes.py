@@ -0,0 +1,51 @@
+# Generated by Django 5.1.3 on 2026-10-18 11:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("feeds", "0003_search"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="feed",
+            name="feed_displayed_published_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="feed",
+            name="feed_category_published_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="feed",
+            name="feed_user_published_idx",
+        ),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                condition=models.Q(("is_displayed", True)),
+                fields=["-published_at", "-uuid"],
+                name="feed_displayed_published_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                condition=models.Q(("is_displayed", True)),
+                fields=["category", "-published_at", "-uuid"],
+                name="feed_category_published_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                condition=models.Q(("is_displayed", True)),
+                fields=["user", "-published_at", "-uuid"],
+                name="feed_user_published_idx",
+            ),
+        ),
+    ]
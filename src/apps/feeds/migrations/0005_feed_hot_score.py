@@ -0,0 +1,32 @@
+# Generated by Django 5.1.3 on 2026-10-18 11:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("feeds", "0004_keyset_pagination_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feed",
+            name="hot_score",
+            field=models.FloatField(default=0, help_text="인기 점수"),
+        ),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(
+                condition=models.Q(("is_displayed", True)),
+                fields=["-hot_score", "-uuid"],
+                name="feed_displayed_hot_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feed",
+            index=models.Index(fields=["updated_at"], name="feed_updated_idx"),
+        ),
+    ]
@@ -1,3 +1,4 @@
+from apps.core.search import SearchTokensField
 from apps.users.models import User
 from django.db import models
 
@@ -43,19 +44,67 @@ class Feed(models.Model):
     likes_count = models.IntegerField(default=0, help_text="좋아요 수")
     comments_count = models.IntegerField(default=0, help_text="댓글 수")
     reported_count = models.IntegerField(default=0, help_text="신고 횟수")
+    # 인기 점수 (update_hot_scores 로 주기적으로 갱신)
+    hot_score = models.FloatField(default=0, help_text="인기 점수")
     # 기본 설정
     is_displayed = models.BooleanField(default=True, help_text="표시 여부")
     published_at = models.DateTimeField(help_text="게시 일시")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 카테고리를 옮기면 이전 카테고리의 캐시, 타임라인도 갱신하도록 조회 시점 값 보관
+        instance._loaded_category_id = instance.__dict__.get("category_id")
+        return instance
+
+    @property
+    def previous_category_id(self):
+        """조회 이후 카테고리가 바뀌었으면 이전 카테고리 ID"""
+        previous = getattr(self, "_loaded_category_id", None)
+        return previous if previous != self.category_id else None
+
     def get_absolute_url(self):
         return f"?id={self.uuid}"
 
+    @property
+    def search_rowid(self):
+        # FTS5 rowid 는 64비트 정수이므로 UUID 상위 63비트 사용
+        return self.uuid.int >> 65
+
     class Meta:
         db_table = "feeds"
         verbose_name = "피드"
         verbose_name_plural = "피드들"
+        indexes = [
+            # 전체 타임라인
+            models.Index(
+                fields=["-published_at", "-uuid"],
+                condition=models.Q(is_displayed=True),
+                name="feed_displayed_published_idx",
+            ),
+            # 카테고리별 타임라인
+            models.Index(
+                fields=["category", "-published_at", "-uuid"],
+                condition=models.Q(is_displayed=True),
+                name="feed_category_published_idx",
+            ),
+            # 사용자별 타임라인
+            models.Index(
+                fields=["user", "-published_at", "-uuid"],
+                condition=models.Q(is_displayed=True),
+                name="feed_user_published_idx",
+            ),
+            # 인기순 타임라인
+            models.Index(
+                fields=["-hot_score", "-uuid"],
+                condition=models.Q(is_displayed=True),
+                name="feed_displayed_hot_idx",
+            ),
+            # 인기 점수 증분 갱신 대상 조회
+            models.Index(fields=["updated_at"], name="feed_updated_idx"),
+        ]
 
 
 class FeedReport(models.Model):
@@ -113,3 +162,23 @@ class FeedLike(models.Model):
                 fields=["user", "feed"], name="unique_user_feed_like"
             )
         ]
+
+
+class FeedSearch(models.Model):
+    """피드 검색 인덱스 (FTS5 가상 테이블)"""
+
+    rowid = models.BigIntegerField(primary_key=True)
+    feed = models.ForeignKey(
+        Feed,
+        on_delete=models.DO_NOTHING,
+        db_column="uuid",
+        db_constraint=False,
+        related_name="search",
+        help_text="피드",
+    )
+    tokens = SearchTokensField(help_text="검색 토큰")
+    rank = models.FloatField(help_text="검색 순위")
+
+    class Meta:
+        managed = False
+        db_table = "feed_search"
@@ -0,0 +1,58 @@
+from datetime import timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.feeds.models import Feed
+
+# 인기 점수 = (좋아요 + 댓글 × 2 + 1) / (경과 시간 + 2) ^ 중력
+HOT_GRAVITY = 1.5
+HOT_COMMENT_WEIGHT = 2
+# 이 기간이 지난 피드는 점수를 0 으로 고정
+HOT_WINDOW = timedelta(days=7)
+
+
+def hot_score(likes_count, comments_count, published_at, now):
+    age_hours = max((now - published_at).total_seconds() / 3600, 0)
+    if age_hours * 3600 > HOT_WINDOW.total_seconds():
+        return 0.0
+    points = likes_count + comments_count * HOT_COMMENT_WEIGHT + 1
+    return points / (age_hours + 2) ** HOT_GRAVITY
+
+
+def update_hot_scores(since=None, decay=False, batch_size=1_000):
+    """인기 점수 갱신
+
+    since 이후 변경된 피드(좋아요, 댓글 수 변경 포함)만 다시 계산하고,
+    decay 이면 기간 내 모든 피드의 점수를 시간 경과에 맞게 다시 계산합니다.
+    """
+    now = timezone.now()
+    condition = Q()
+    if since is not None:
+        condition |= Q(updated_at__gte=since)
+    if decay:
+        condition |= Q(published_at__gte=now - HOT_WINDOW)
+        # 기간이 지난 피드는 한 번에 0 으로
+        Feed.objects.filter(published_at__lt=now - HOT_WINDOW, hot_score__gt=0).update(
+            hot_score=0
+        )
+    if not condition:
+        return 0
+
+    updated = 0
+    batch = []
+    rows = (
+        Feed.objects.filter(condition)
+        .only("uuid", "likes_count", "comments_count", "published_at", "hot_score")
+        .iterator(chunk_size=batch_size)
+    )
+    for feed in rows:
+        score = hot_score(feed.likes_count, feed.comments_count, feed.published_at, now)
+        if score != feed.hot_score:
+            feed.hot_score = score
+            batch.append(feed)
+        if len(batch) >= batch_size:
+            updated += Feed.objects.bulk_update(batch, ["hot_score"])
+            batch = []
+    updated += Feed.objects.bulk_update(batch, ["hot_score"])
+    return updated
@@ -0,0 +1,25 @@
+from django.db.models import F, FloatField, Value
+
+from apps.core.search import SearchIndex, to_match_query
+
+feed_index = SearchIndex("feed_search", extra_columns=["uuid"])
+
+
+def index_feeds(feeds):
+    """표시 중인 피드는 인덱스에 반영, 숨김 피드는 인덱스에서 제거"""
+    feed_index.update(
+        (feed.search_rowid, feed.content, feed.uuid.hex)
+        for feed in feeds
+        if feed.is_displayed
+    )
+    feed_index.delete(feed.search_rowid for feed in feeds if not feed.is_displayed)
+
+
+def search_feeds(queryset, text):
+    """검색어와 일치하는 피드를 search_rank(bm25, 낮을수록 관련도 높음)와 함께 반환"""
+    match = to_match_query(text)
+    if not match:
+        return queryset.none().annotate(search_rank=Value(0.0, FloatField()))
+    return queryset.filter(search__tokens__match=match).annotate(
+        search_rank=F("search__rank")
+    )
@@ -1,9 +1,17 @@
+import threading
+
 from django.conf import settings
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.core.cache import cache
 
-from .models import FeedCategory
+from apps.comments.models import Comment, CommentLike, CommentReport
+from apps.feeds.caches import activity_scopes, bump_generations, feed_scopes
+from apps.feeds.search import feed_index, index_feeds
+from apps.feeds.timelines import update_timeline
+
+from .models import Feed, FeedCategory, FeedLike, FeedReport
 
 
 @receiver([post_save, post_delete], sender=FeedCategory)
@@ -11,3 +19,86 @@ def clear_feed_category_cache(sender, **kwargs):
     """피드 카테고리 캐시 삭제 시그널"""
     cache_key = f"feed_category:list:{settings.DJANGO_ENVIRONMENT}"
     cache.delete(cache_key)
+
+
+# 커밋 후 무효화할 범위 (스레드별)
+# 한 트랜잭션에 여러 쓰기가 묶이면 (apps.core.writes.WriteFunnel) 같은 범위를 한 번만 무효화
+# 롤백된 쓰기의 범위가 남아 있으면 다음 커밋에서 함께 무효화 (불필요한 무효화는 안전)
+_pending = threading.local()
+
+
+def _bump_pending():
+    scopes = getattr(_pending, "scopes", None)
+    if scopes:
+        _pending.scopes = set()
+        bump_generations(sorted(scopes))
+
+
+def _bump_on_commit(scopes):
+    if not hasattr(_pending, "scopes"):
+        _pending.scopes = set()
+    _pending.scopes.update(scopes)
+    transaction.on_commit(_bump_pending)
+
+
+@receiver([post_save, post_delete], sender=FeedCategory)
+def bump_feed_category_generation(sender, instance, **kwargs):
+    """피드 카테고리 변경 시 피드 응답 캐시 무효화 시그널"""
+    _bump_on_commit(["global", f"category:{instance.pk}"])
+
+
+@receiver([post_save, post_delete], sender=Feed)
+def bump_feed_generation(sender, instance, **kwargs):
+    """피드 변경 시 피드 응답, RSS 캐시 무효화 시그널"""
+    scopes = feed_scopes(
+        instance.pk, instance.category_id, instance.previous_category_id
+    )
+    _bump_on_commit(scopes + ["rss"])
+
+
+@receiver([post_save, post_delete], sender=Comment)
+@receiver([post_save, post_delete], sender=FeedLike)
+@receiver([post_save, post_delete], sender=FeedReport)
+def bump_feed_activity_generation(sender, instance, **kwargs):
+    """댓글, 좋아요, 신고 변경 시 피드 응답 캐시 무효화 시그널"""
+    _bump_on_commit(activity_scopes(instance.feed_id))
+
+
+@receiver([post_save, post_delete], sender=CommentLike)
+@receiver([post_save, post_delete], sender=CommentReport)
+def bump_comment_activity_generation(sender, instance, **kwargs):
+    """댓글 좋아요, 신고 변경 시 피드 응답 캐시 무효화 시그널"""
+    if sender.comment.is_cached(instance):
+        feed_id = instance.comment.feed_id
+    else:
+        feed_id = (
+            Comment.objects.filter(pk=instance.comment_id)
+            .values_list("feed_id", flat=True)
+            .first()
+        )
+    if feed_id:
+        _bump_on_commit(activity_scopes(feed_id))
+
+
+@receiver(post_save, sender=Feed)
+def index_feed(sender, instance, **kwargs):
+    """피드 검색 인덱스 반영 시그널"""
+    index_feeds([instance])
+
+
+@receiver(post_delete, sender=Feed)
+def unindex_feed(sender, instance, **kwargs):
+    """피드 검색 인덱스 삭제 시그널"""
+    feed_index.delete([instance.search_rowid])
+
+
+@receiver(post_save, sender=Feed)
+def update_feed_timeline(sender, instance, **kwargs):
+    """카테고리 타임라인 반영 시그널"""
+    transaction.on_commit(lambda: update_timeline(instance))
+
+
+@receiver(post_delete, sender=Feed)
+def remove_feed_timeline(sender, instance, **kwargs):
+    """카테고리 타임라인 삭제 시그널"""
+    transaction.on_commit(lambda: update_timeline(instance, deleted=True))
@@ -0,0 +1,141 @@
+import os
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.template.loader import render_to_string
+
+from apps.core.routers import use_primary
+from apps.feeds.caches import get_generations
+from apps.feeds.models import Feed
+
+# 사이트맵 파일당 URL 수 (프로토콜 한도 50,000)
+SITEMAP_SECTION_SIZE = 10_000
+SITEMAP_CHANGEFREQ = "daily"
+SITEMAP_PRIORITY = 0.9
+# 생성 당시 피드 세대 값(rss) 기록 파일
+SITEMAP_GENERATION_FILE = "sitemap.generation"
+# 요청 중 재생성 잠금 유지 시간 (초)
+SITEMAP_LOCK_TIMEOUT = 60 * 5
+
+
+def sitemap_root():
+    return settings.SITEMAP_ROOT
+
+
+def section_filename(section):
+    return f"sitemap-feeds-{section}.xml"
+
+
+def iter_sections(section_size=SITEMAP_SECTION_SIZE):
+    """표시 중인 피드를 (게시 일시, uuid) 키셋 페이지네이션으로 나누어 반환
+
+    게시 순서로 나누므로 새 피드는 마지막 섹션에 추가되고 이전 섹션은 그대로 유지됩니다.
+    """
+    queryset = (
+        Feed.objects.filter(is_displayed=True)
+        .only("uuid", "published_at", "updated_at")
+        .order_by("published_at", "uuid")
+    )
+    last = None
+    while True:
+        page = queryset
+        if last is not None:
+            page = queryset.filter(
+                Q(published_at__gt=last.published_at)
+                | Q(published_at=last.published_at, uuid__gt=last.uuid)
+            )
+        # 생성한 파일을 계속 제공하므로 복제 지연으로 빠지는 피드가 없도록 기본 DB 에서 조회
+        with use_primary():
+            feeds = list(page[:section_size])
+        if not feeds:
+            return
+        yield feeds
+        last = feeds[-1]
+
+
+def _write(path, content):
+    # 서빙 중인 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def build_sitemaps(base_url, section_size=SITEMAP_SECTION_SIZE):
+    """사이트맵 인덱스와 섹션 파일을 SITEMAP_ROOT 에 미리 생성"""
+    root = sitemap_root()
+    os.makedirs(root, exist_ok=True)
+    # 생성 중에 바뀐 피드도 다음 요청에서 반영되도록 조회 전에 세대 값 확인
+    generation = get_generations(["rss"])[0]
+    sections = []
+    for section, feeds in enumerate(iter_sections(section_size), start=1):
+        urlset = [
+            {
+                "location": f"{base_url}/{feed.get_absolute_url()}",
+                "lastmod": feed.updated_at,
+                "changefreq": SITEMAP_CHANGEFREQ,
+                "priority": SITEMAP_PRIORITY,
+            }
+            for feed in feeds
+        ]
+        filename = section_filename(section)
+        _write(
+            os.path.join(root, filename),
+            render_to_string("sitemap.xml", {"urlset": urlset}),
+        )
+        sections.append(
+            {
+                "location": f"{base_url}/{filename}",
+                "last_mod": max(url["lastmod"] for url in urlset),
+            }
+        )
+    _write(
+        os.path.join(root, "sitemap.xml"),
+        render_to_string("sitemap_index.xml", {"sitemaps": sections}),
+    )
+    # 더 이상 사용하지 않는 섹션 파일 정리
+    section = len(sections) + 1
+    while os.path.exists(os.path.join(root, section_filename(section))):
+        os.remove(os.path.join(root, section_filename(section)))
+        section += 1
+    _write(os.path.join(root, SITEMAP_GENERATION_FILE), str(generation))
+    return len(sections)
+
+
+def is_stale():
+    """사이트맵 파일을 다시 생성해야 하는지
+
+    파일이 없거나 SITEMAP_MAX_AGE 초보다 오래되었으면 다시 생성하고,
+    생성 후 피드가 바뀌었으면(rss 세대 값) SITEMAP_MIN_AGE 초가 지난 뒤 다시 생성합니다.
+    """
+    path = os.path.join(sitemap_root(), SITEMAP_GENERATION_FILE)
+    try:
+        age = time.time() - os.path.getmtime(path)
+        with open(path, encoding="utf-8") as f:
+            built_generation = f.read()
+    except OSError:
+        return True
+    if age >= settings.SITEMAP_MAX_AGE:
+        return True
+    return age >= settings.SITEMAP_MIN_AGE and built_generation != str(
+        get_generations(["rss"])[0]
+    )
+
+
+def refresh_sitemaps(base_url):
+    """오래되었거나 피드가 바뀐 사이트맵을 다시 생성 (동시에 한 워커만 생성)"""
+    if not is_stale():
+        return
+    lock_key = f"feed:sitemap:{settings.DJANGO_ENVIRONMENT}:lock"
+    locked = cache.add(lock_key, True, timeout=SITEMAP_LOCK_TIMEOUT)
+    if not locked and os.path.exists(os.path.join(sitemap_root(), "sitemap.xml")):
+        # 다른 워커가 생성 중이면 기존 파일 제공
+        return
+    try:
+        build_sitemaps(base_url)
+    finally:
+        if locked:
+            cache.delete(lock_key)
@@ -0,0 +1,142 @@
+import time
+import uuid
+from bisect import insort
+from datetime import datetime, timedelta, timezone
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.dateparse import parse_datetime
+
+from apps.core.cache import shared_cache
+from apps.core.fieldsets import EXCLUDE_PARAM, FIELDS_PARAM
+from apps.core.routers import use_primary
+from apps.feeds.models import Feed
+
+# 카테고리별로 유지하는 최신 피드 수
+TIMELINE_SIZE = 1_000
+# 타임라인 최대 유지 시간 (갱신이 누락되어도 이 시간이 지나면 DB 에서 다시 생성)
+TIMELINE_TIMEOUT = 60 * 60
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _timeline_key(category_id):
+    return f"feed:timeline:{settings.DJANGO_ENVIRONMENT}:{category_id}"
+
+
+def _version_key(category_id):
+    return f"{_timeline_key(category_id)}:version"
+
+
+def _version(category_id):
+    # 다른 워커의 변경을 바로 확인하도록 공유 캐시에서 조회
+    return shared_cache().get(_version_key(category_id))
+
+
+def _bump_version(category_id):
+    key = _version_key(category_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # 캐시에서 밀려난 경우에도 이전 값과 겹치지 않도록 현재 시각으로 시작
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+def entry(published_at, feed_uuid):
+    """타임라인 항목 ((게시 일시 마이크로초, uuid hex) 오름차순 정렬용)"""
+    return ((published_at - EPOCH) // timedelta(microseconds=1), feed_uuid.hex)
+
+
+def entry_from_position(position):
+    """커서 위치 (게시 일시, uuid) 를 타임라인 항목으로 변환"""
+    return entry(parse_datetime(position[0]), uuid.UUID(position[1]))
+
+
+def category_for_request(request):
+    """타임라인으로 처리할 수 있는 요청이면 카테고리 ID 반환
+
+    단일 카테고리 필터와 커서, 응답 필드 선택 외에 다른 조건이 없는 경우만 해당합니다.
+    """
+    params = request.query_params
+    if set(params) - {"categories", "cursor", FIELDS_PARAM, EXCLUDE_PARAM}:
+        return None
+    category = params.get("categories", "")
+    return int(category) if category.isdigit() else None
+
+
+def get_timeline(category_id):
+    """{"entries": 오름차순 항목 목록, "complete": 이전 피드가 더 없는지}"""
+    timeline = cache.get(_timeline_key(category_id))
+    if timeline is None:
+        timeline = rebuild_timeline(category_id)
+    return timeline
+
+
+async def aget_timeline(category_id):
+    timeline = await cache.aget(_timeline_key(category_id))
+    if timeline is None:
+        timeline = await sync_to_async(rebuild_timeline)(category_id)
+    return timeline
+
+
+def rebuild_timeline(category_id):
+    """DB 에서 타임라인 생성
+
+    조회하는 동안 피드가 바뀌면 (버전 값이 바뀌면) 저장한 타임라인을 지워,
+    변경 전에 조회한 타임라인이 캐시에 남지 않도록 합니다.
+    """
+    key = _timeline_key(category_id)
+    version = _version(category_id)
+    # 만료 전까지 유지되므로 복제 지연이 없는 기본 DB 에서 조회
+    with use_primary():
+        rows = list(
+            Feed.objects.filter(category_id=category_id, is_displayed=True)
+            .order_by("-published_at", "-uuid")
+            .values_list("published_at", "uuid")[:TIMELINE_SIZE]
+        )
+    entries = sorted(entry(published_at, pk) for published_at, pk in rows)
+    timeline = {"entries": entries, "complete": len(entries) < TIMELINE_SIZE}
+    # 그 사이 다른 요청이 생성, 갱신한 타임라인은 덮어쓰지 않음
+    cache.add(key, timeline, timeout=TIMELINE_TIMEOUT)
+    if _version(category_id) != version:
+        cache.delete(key)
+    return timeline
+
+
+def update_timeline(feed, deleted=False):
+    """피드 생성, 수정, 숨김, 삭제를 타임라인에 반영
+
+    카테고리를 옮긴 피드는 이전 카테고리의 타임라인에서 제거합니다.
+    """
+    if feed.previous_category_id is not None:
+        _update_timeline(feed.previous_category_id, feed, deleted=True)
+    _update_timeline(feed.category_id, feed, deleted)
+
+
+def _update_timeline(category_id, feed, deleted):
+    # 진행 중인 rebuild_timeline 이 변경 전 조회 결과를 저장하지 않도록 먼저 버전 변경
+    _bump_version(category_id)
+    key = _timeline_key(category_id)
+    lock_key = f"{key}:lock"
+    if not cache.add(lock_key, 1, timeout=5):
+        # 다른 요청이 갱신 중이면 다음 조회 시 다시 생성
+        cache.delete(key)
+        return
+    try:
+        # 다른 워커의 갱신을 덮어쓰지 않도록 공유 캐시에서 조회
+        timeline = shared_cache().get(key)
+        if timeline is None:
+            return
+        entries = [e for e in timeline["entries"] if e[1] != feed.uuid.hex]
+        if feed.is_displayed and not deleted:
+            insort(entries, entry(feed.published_at, feed.uuid))
+            if len(entries) > TIMELINE_SIZE:
+                del entries[0]
+                timeline["complete"] = False
+            if not timeline["complete"] and entries and entries[0][1] == feed.uuid.hex:
+                # 유지 범위보다 오래된 피드는 타임라인에 넣지 않음
+                del entries[0]
+        timeline["entries"] = entries
+        cache.set(key, timeline, timeout=TIMELINE_TIMEOUT)
+    finally:
+        cache.delete(lock_key)
@@ -1,6 +1,7 @@
 from django_filters import rest_framework as filters
 from django_filters.filters import BaseInFilter, NumberFilter
 from apps.feeds.models import Feed
+from apps.feeds.search import search_feeds
 
 
 class NumberInFilter(BaseInFilter, NumberFilter):
@@ -11,12 +12,16 @@ class FeedFilter(filters.FilterSet):
     categories = NumberInFilter(field_name="category", lookup_expr="in")
     writer = filters.CharFilter(method="filter_writer")
     id = filters.CharFilter(field_name="uuid")
+    q = filters.CharFilter(method="filter_q")
 
     def filter_writer(self, queryset, name, value):
         if value == "me" and self.request.user.is_authenticated:
             return queryset.filter(user=self.request.user)
         return queryset
 
+    def filter_q(self, queryset, name, value):
+        return search_feeds(queryset, value)
+
     class Meta:
         model = Feed
         fields = {
@@ -0,0 +1,55 @@
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from apps.comments.models import Comment
+from apps.feeds.models import FeedLike, FeedReport
+
+# 베스트 댓글 정렬 기준 (좋아요 수가 같으면 먼저 작성된 댓글)
+BEST_COMMENT_ORDERING = [F("likes_count").desc(), F("id").asc()]
+
+
+def load_best_comments(feeds):
+    """피드 목록의 베스트 댓글을 한 번의 쿼리로 조회해 `_best_comment` 에 저장"""
+    feeds_by_uuid = {feed.uuid: feed for feed in feeds}
+    for feed in feeds:
+        feed._best_comment = None
+    if not feeds_by_uuid:
+        return feeds
+    comments = (
+        Comment.objects.filter(feed_id__in=feeds_by_uuid, is_displayed=True)
+        .select_related("user__profile")
+        .annotate(
+            rank=Window(
+                RowNumber(),
+                partition_by=F("feed_id"),
+                order_by=BEST_COMMENT_ORDERING,
+            )
+        )
+        .filter(rank=1)
+    )
+    for comment in comments:
+        # 피드 내용 조회를 위한 추가 쿼리 방지
+        comment.feed = feeds_by_uuid[comment.feed_id]
+        comment.feed._best_comment = comment
+    return feeds
+
+
+def load_feed_viewer_state(feeds, user):
+    """로그인 사용자의 피드 좋아요, 신고 여부를 관계별 한 번의 쿼리로 조회"""
+    if not user.is_authenticated:
+        return feeds
+    uuids = [feed.uuid for feed in feeds]
+    liked = set(
+        FeedLike.objects.filter(user=user, feed_id__in=uuids).values_list(
+            "feed_id", flat=True
+        )
+    )
+    reported = set(
+        FeedReport.objects.filter(user=user, feed_id__in=uuids).values_list(
+            "feed_id", flat=True
+        )
+    )
+    for feed in feeds:
+        feed.is_like = feed.uuid in liked
+        feed.is_reported = feed.uuid in reported
+    return feeds
@@ -1,8 +1,90 @@
-from rest_framework.pagination import CursorPagination
+import uuid
+from bisect import bisect_left, bisect_right
 
+from apps.core.paginations import KeysetCursorPagination
+from apps.core.plans import arun_queries, run_queries
+from apps.feeds import timelines
 
-class FeedCursorPagination(CursorPagination):
+
+class FeedCursorPagination(KeysetCursorPagination):
     """피드 페이지네이션"""
 
-    ordering = "-published_at"
+    ordering = ("-published_at", "-uuid")
     page_size = 10
+
+    def get_ordering(self, request, queryset, view):
+        # 검색 시 관련도 순 정렬
+        if request.query_params.get("q"):
+            return ("search_rank", "uuid")
+        # 인기순 정렬
+        if request.query_params.get("ordering") == "hot":
+            return ("-hot_score", "-uuid")
+        return super().get_ordering(request, queryset, view)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        category_id = timelines.category_for_request(request)
+        if category_id is not None:
+            timeline = timelines.get_timeline(category_id)
+            page = run_queries(self.plan_timeline_page(queryset, request, timeline))
+            if page is not None:
+                return page
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        category_id = timelines.category_for_request(request)
+        if category_id is not None:
+            timeline = await timelines.aget_timeline(category_id)
+            page = await arun_queries(
+                self.plan_timeline_page(queryset, request, timeline)
+            )
+            if page is not None:
+                return page
+        return await super().apaginate_queryset(queryset, request, view)
+
+    def plan_timeline_page(self, queryset, request, timeline):
+        """카테고리 타임라인에서 페이지를 잘라 IN 쿼리 한 번으로 조회하는 계획
+
+        타임라인 범위를 벗어나는 페이지는 None 을 반환해 SQL 로 조회합니다.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.__class__.ordering
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor.reverse if self.cursor else False
+        position = self.cursor.position if self.cursor else None
+
+        entries = timeline["entries"]
+        try:
+            key = timelines.entry_from_position(position) if position else None
+        except (TypeError, ValueError):
+            return None
+        if not reverse:
+            # 최신순이므로 오름차순 목록의 끝에서부터 자름
+            end = len(entries) if key is None else bisect_left(entries, key)
+            start = end - self.page_size - 1
+            if start < 0 and not timeline["complete"]:
+                return None
+            selected = entries[max(start, 0) : end][::-1]
+        else:
+            start = bisect_right(entries, key)
+            selected = entries[start : start + self.page_size + 1]
+
+        page_entries = selected[: self.page_size]
+        # values() 로 조회한 행(dict) 도 지원하도록 in_bulk 대신 IN 조건으로 조회
+        rows = yield queryset.order_by().filter(
+            pk__in=[uuid.UUID(feed_uuid) for _, feed_uuid in page_entries]
+        )
+        feeds = {row["uuid"] if isinstance(row, dict) else row.pk: row for row in rows}
+        self.page = [
+            feeds[uuid.UUID(feed_uuid)]
+            for _, feed_uuid in page_entries
+            if uuid.UUID(feed_uuid) in feeds
+        ]
+        has_more = len(selected) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_previous, self.has_next = has_more, position is not None
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        return self.page
@@ -0,0 +1,157 @@
+from functools import cache
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from apps.comments.models import Comment
+from apps.comments.v1.projections import (
+    comment_field_names,
+    comment_lookups,
+    comment_projection,
+)
+from apps.core.fieldsets import parse_fieldset
+from apps.core.projections import (
+    BOOL,
+    DATETIME,
+    INT,
+    RAW,
+    STR,
+    column,
+    compile_projection,
+    nested,
+    nested_lookups,
+)
+from apps.feeds.models import FeedLike, FeedReport
+from apps.feeds.v1.loaders import BEST_COMMENT_ORDERING
+from apps.feeds.v1.serializers import FeedSerializer
+from apps.users.v1.projections import PROFILE_FIELDS
+
+# FeedCategorySerializer 출력 필드: (출력 키, 컬럼, 변환 함수)
+CATEGORY_FIELDS = [
+    ("id", "id", RAW),
+    ("key", "key", STR),
+    ("name", "name", STR),
+    ("emoji", "emoji", STR),
+    ("color", "color", STR),
+    ("scope", "scope", STR),
+]
+
+# 출력 키: (values() 컬럼, 표현식) - FeedSerializer 와 같은 변환
+FEED_COLUMNS = {
+    "uuid": (["uuid"], column("uuid", STR)),
+    "user_profile": (
+        nested_lookups("user__profile", PROFILE_FIELDS),
+        nested("user__profile", PROFILE_FIELDS),
+    ),
+    "category": (["category_id"], column("category_id")),
+    "category_info": (
+        nested_lookups("category", CATEGORY_FIELDS),
+        nested("category", CATEGORY_FIELDS),
+    ),
+    "content": (["content"], column("content", STR)),
+    "link": (["link"], column("link")),
+    # 베스트 댓글의 feed_content 에 피드 내용 사용
+    "best_comment": (["content"], 'x["best_comment"]'),
+    "likes_count": (["likes_count"], column("likes_count", INT)),
+    "comments_count": (["comments_count"], column("comments_count", INT)),
+    "reported_count": (["reported_count"], column("reported_count", INT)),
+    "is_like": ([], 'x.get("is_like", False)'),
+    "is_reported": ([], 'x.get("is_reported", False)'),
+    "is_displayed": (["is_displayed"], column("is_displayed", BOOL)),
+    "published_at": (["published_at"], column("published_at", DATETIME)),
+}
+# 페이지네이션 위치 계산에 필요한 컬럼 (정렬: 최신순, 인기순)
+KEY_COLUMNS = ["uuid", "published_at", "hot_score"]
+
+
+@cache
+def feed_field_names():
+    """FeedSerializer 의 출력 필드 (순서 유지)"""
+    return tuple(
+        name for name, field in FeedSerializer().fields.items() if not field.write_only
+    )
+
+
+def requested_feed_fields(request):
+    """요청의 ?fields=, ?exclude= 를 반영한 출력 필드"""
+    fields, exclude = parse_fieldset(request)
+    return tuple(
+        name
+        for name in feed_field_names()
+        if (fields is None or name in fields) and name not in exclude
+    )
+
+
+@cache
+def feed_projection(names):
+    return compile_projection(
+        "feed_row", [(name, FEED_COLUMNS[name][1]) for name in names]
+    )
+
+
+def project_feeds(queryset, names):
+    """응답에 필요한 컬럼만 values() 로 조회하는 쿼리셋"""
+    lookups = dict.fromkeys(KEY_COLUMNS)
+    for name in names:
+        lookups.update(dict.fromkeys(FEED_COLUMNS[name][0]))
+    if "search_rank" in queryset.query.annotations:
+        lookups["search_rank"] = None
+    return queryset.values(*lookups)
+
+
+def plan_best_comment_rows(rows):
+    """피드별 베스트 댓글을 한 번의 쿼리로 조회해 CommentSerializer 와 같은 dict 로 변환"""
+    best = {row["uuid"]: None for row in rows}
+    if not best:
+        return best
+    names = comment_field_names()
+    comments = yield (
+        Comment.objects.filter(feed_id__in=best, is_displayed=True)
+        .annotate(
+            rank=Window(
+                RowNumber(),
+                partition_by=F("feed_id"),
+                order_by=BEST_COMMENT_ORDERING,
+            )
+        )
+        .filter(rank=1)
+        .values(*comment_lookups(names))
+    )
+    contents = {row["uuid"]: row["content"] for row in rows}
+    comment_row = comment_projection(names)
+    for comment in comments:
+        # 컨텍스트 없이 직렬화하므로 좋아요/신고 여부는 기본값(False)
+        best[comment["feed_id"]] = comment_row(
+            comment, {"feed_content": contents[comment["feed_id"]]}
+        )
+    return best
+
+
+def plan_viewer_state_rows(uuids, user):
+    """로그인 사용자의 피드별 좋아요, 신고 여부 {uuid: {"is_like", "is_reported"}}"""
+    if not user.is_authenticated or not uuids:
+        return {}
+    liked = yield FeedLike.objects.filter(user=user, feed_id__in=uuids).values_list(
+        "feed_id", flat=True
+    )
+    reported = yield FeedReport.objects.filter(
+        user=user, feed_id__in=uuids
+    ).values_list("feed_id", flat=True)
+    liked, reported = set(liked), set(reported)
+    return {pk: {"is_like": pk in liked, "is_reported": pk in reported} for pk in uuids}
+
+
+def render_feeds(rows, user, names):
+    """values() 행을 FeedSerializer 와 같은 dict 목록으로 변환하는 조회 계획"""
+    rows = list(rows)
+    extras = {row["uuid"]: {} for row in rows}
+    if "best_comment" in names:
+        best = yield from plan_best_comment_rows(rows)
+        for pk, comment in best.items():
+            extras[pk]["best_comment"] = comment
+    if "is_like" in names or "is_reported" in names:
+        states = yield from plan_viewer_state_rows(list(extras), user)
+        for pk, state in states.items():
+            extras[pk].update(state)
+    feed_row = feed_projection(names)
+    return [feed_row(row, extras[row["uuid"]]) for row in rows]
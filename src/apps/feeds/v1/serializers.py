@@ -1,12 +1,21 @@
 import uuid
 from html import escape
 
-from django.db import transaction
+from django.db import models
 from rest_framework import serializers, exceptions
 
 from apps.comments.v1.serializers import CommentSerializer
+from apps.core import counters
+from apps.core.fieldsets import SparseFieldsetMixin
+from apps.core.writes import atomic_write
 from apps.feeds.v1.fields import CurrentFeed
+from apps.feeds.v1.loaders import (
+    load_best_comments,
+    load_feed_viewer_state,
+    BEST_COMMENT_ORDERING,
+)
 from apps.feeds.models import Feed, FeedLike, FeedCategory, FeedReport
+from apps.users.models import ProhibitedWord
 from apps.users.v1.serializers import UserProfileSerializer
 
 
@@ -25,7 +34,24 @@ class FeedCategorySerializer(serializers.ModelSerializer):
         ]
 
 
-class FeedSerializer(serializers.ModelSerializer):
+class FeedListSerializer(serializers.ListSerializer):
+    """피드 리스트 시리얼라이저"""
+
+    def to_representation(self, data):
+        feeds = list(data.all() if isinstance(data, models.Manager) else data)
+        # 페이지 단위로 베스트 댓글, 좋아요/신고 여부 일괄 조회 (요청한 필드만)
+        if self.child.is_field_requested("best_comment"):
+            load_best_comments(feeds)
+        request = self.context.get("request")
+        if request and (
+            self.child.is_field_requested("is_like")
+            or self.child.is_field_requested("is_reported")
+        ):
+            load_feed_viewer_state(feeds, request.user)
+        return super().to_representation(feeds)
+
+
+class FeedSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """피드 시리얼라이저"""
 
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
@@ -42,9 +68,19 @@ class FeedSerializer(serializers.ModelSerializer):
     )
 
     def get_best_comment(self, instance):
-        instance = (
-            instance.comments.filter(is_displayed=True).order_by("-likes_count").first()
-        )
+        if hasattr(instance, "_best_comment"):
+            instance = instance._best_comment
+        else:
+            feed = instance
+            instance = (
+                instance.comments.filter(is_displayed=True)
+                .select_related("user__profile")
+                .order_by(*BEST_COMMENT_ORDERING)
+                .first()
+            )
+            if instance:
+                # feed_content 를 위해 피드를 다시 조회하지 않음
+                instance.feed = feed
         serializer = CommentSerializer(instance=instance) if instance else None
         return serializer.data if instance else None
 
@@ -63,14 +99,19 @@ class FeedSerializer(serializers.ModelSerializer):
         # 내용 확인
         if not attr:
             raise exceptions.ValidationError("내용을 입력해주세요.")
+        # 금지어 필터링
+        if ProhibitedWord.find_word(attr):
+            raise exceptions.ValidationError("내용에 금지어가 포함되어 있습니다.")
         return escape(attr, quote=True)
 
+    @atomic_write
     def create(self, validated_data):
         validated_data["uuid"] = uuid.uuid4()
         return super().create(validated_data)
 
     class Meta:
         model = Feed
+        list_serializer_class = FeedListSerializer
         fields = [
             "uuid",
             "user",
@@ -113,23 +154,20 @@ class FeedLikeSerializer(serializers.ModelSerializer):
         ).first()
         return data
 
-    @transaction.atomic
+    @atomic_write
     def create(self, validated_data):
         # 피드 좋아요
         instance = super().create(validated_data)
         # 피드 좋아요 수 증가
-        instance.feed.likes_count += 1
-        instance.feed.save()
+        counters.increment(Feed, instance.feed_id, "likes_count")
         return instance
 
-    @transaction.atomic
+    @atomic_write
     def update(self, instance, validated_data):
         # 피드 좋아요 취소
         instance.delete()
         # 피드 좋아요 수 감소
-        feed = validated_data.get("feed")
-        feed.likes_count -= 1 if feed.likes_count > 0 else 0
-        feed.save()
+        counters.decrement(Feed, instance.feed_id, "likes_count")
         return {"is_like": False}
 
     class Meta:
@@ -147,12 +185,11 @@ class FeedReportSerializer(serializers.ModelSerializer):
     feed = serializers.HiddenField(default=CurrentFeed())
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
 
-    @transaction.atomic
+    @atomic_write
     def create(self, validated_data):
         instance = super().create(validated_data)
         # 신고 수 증가
-        instance.feed.reported_count += 1
-        instance.feed.save()
+        counters.increment(Feed, instance.feed_id, "reported_count")
         return instance
 
     class Meta:
@@ -1,19 +1,39 @@
+import hashlib
+import os
+
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.contrib.sitemaps import Sitemap
 from django.contrib.syndication.views import Feed as FeedView
 from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.db.models import Exists, OuterRef
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date, parse_http_date_safe
+from django.views import View
 from rest_framework import viewsets, mixins, response
 from rest_framework.permissions import (
     IsAuthenticatedOrReadOnly,
     AllowAny,
     IsAuthenticated,
 )
-from rest_framework.throttling import ScopedRateThrottle
 
+from apps.core.asyncviews import AsyncReadMixin
+from apps.core.fieldsets import field_requested
+from apps.core.identity import IdentityMapMixin
+from apps.core.plans import arun_queries, run_queries
+from apps.core.projections import FastReadPathMixin
+from apps.core.routers import ReplicaReadMixin, use_primary
+from apps.core.throttling import ScopedTokenBucketThrottle
+from apps.feeds import caches, sitemaps
 from apps.feeds.models import Feed, FeedLike, FeedCategory, FeedReport
 from apps.feeds.v1.filters import FeedFilter
 from apps.feeds.v1.paginations import FeedCursorPagination
+from apps.feeds.v1.projections import (
+    project_feeds,
+    render_feeds,
+    requested_feed_fields,
+)
 from apps.feeds.v1.serializers import (
     FeedSerializer,
     FeedLikeSerializer,
@@ -22,24 +42,44 @@ from apps.feeds.v1.serializers import (
 )
 
 
-class FeedCategoryViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
-    """피드 카테고리 뷰셋"""
+class FeedCategoryViewSet(
+    AsyncReadMixin, viewsets.GenericViewSet, mixins.ListModelMixin
+):
+    """피드 카테고리 뷰셋 (변경 시에만 캐시를 지우므로 기본 DB 에서 조회)"""
 
     queryset = FeedCategory.objects.filter(is_displayed=True)
     serializer_class = FeedCategorySerializer
     permission_classes = [AllowAny]
+    cache_timeout = 60 * 60
+
+    def get_cache_key(self):
+        return f"feed_category:list:{settings.DJANGO_ENVIRONMENT}"
 
     def list(self, request, *args, **kwargs):
-        cache_key = f"feed_category:list:{settings.DJANGO_ENVIRONMENT}"
-        cached_data = cache.get(cache_key)
+        cached_data = cache.get(self.get_cache_key())
         if cached_data:
             return response.Response(cached_data)
         resp = super().list(request, *args, **kwargs)
-        cache.set(cache_key, resp.data, timeout=60 * 60)
+        cache.set(self.get_cache_key(), resp.data, timeout=self.cache_timeout)
         return resp
 
+    async def alist(self, request, *args, **kwargs):
+        cached_data = await cache.aget(self.get_cache_key())
+        if cached_data:
+            return response.Response(cached_data)
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer([row async for row in queryset], many=True)
+        await cache.aset(
+            self.get_cache_key(), serializer.data, timeout=self.cache_timeout
+        )
+        return response.Response(serializer.data)
+
 
 class FeedViewSet(
+    AsyncReadMixin,
+    ReplicaReadMixin,
+    IdentityMapMixin,
+    FastReadPathMixin,
     viewsets.GenericViewSet,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
@@ -55,43 +95,178 @@ class FeedViewSet(
     filterset_class = FeedFilter
     throttle_scope = "feed:create"
     pagination_class = FeedCursorPagination
+    identity_map_relations = ("user",)
+    fast_read_actions = ("list", "retrieve")
 
     def get_throttles(self):
         if self.action == "create":
-            return [ScopedRateThrottle()]
+            return [ScopedTokenBucketThrottle()]
         return super().get_throttles()
 
     def get_queryset(self):
         queryset = super().get_queryset()
         if self.action == "list":
-            queryset = queryset.select_related("user__profile", "category").filter(
-                category__is_displayed=True
-            )
+            queryset = queryset.filter(category__is_displayed=True)
+            # 응답에 포함되는 관계만 함께 조회 (?fields=, ?exclude=)
+            related = [
+                lookup
+                for field, lookup in (
+                    ("user_profile", "user__profile"),
+                    ("category_info", "category"),
+                )
+                if field_requested(self.request, field)
+            ]
+            if related:
+                queryset = queryset.select_related(*related)
         elif self.action in ["update", "partial_update", "destroy"]:
             # 직접 작성한 피드만 수정, 삭제 가능
             queryset = queryset.filter(user=self.request.user)
-        if self.action in ["list", "retrieve"] and self.request.user.is_authenticated:
-            # 로그인 사용자의 경우 좋아요 여부
-            queryset = queryset.prefetch_related("likes", "reports").annotate(
-                is_like=Exists(
+        if self.action == "retrieve" and self.request.user.is_authenticated:
+            # 로그인 사용자의 경우 좋아요 여부 (목록은 FeedListSerializer 에서 일괄 조회)
+            annotations = {
+                "is_like": Exists(
                     FeedLike.objects.filter(feed=OuterRef("pk"), user=self.request.user)
                 ),
-                is_reported=Exists(
+                "is_reported": Exists(
                     FeedReport.objects.filter(
                         feed=OuterRef("pk"), user=self.request.user
                     )
                 ),
+            }
+            queryset = queryset.annotate(
+                **{
+                    field: annotation
+                    for field, annotation in annotations.items()
+                    if field_requested(self.request, field)
+                }
             )
         return queryset
 
+    def get_read_fields(self):
+        return requested_feed_fields(self.request)
+
+    def project_rows(self, queryset, names):
+        return project_feeds(queryset, names)
+
+    def render_rows(self, rows, names):
+        return render_feeds(rows, self.request.user, names)
+
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
 
+    def get_page_scopes(self):
+        """목록 응답에 포함된 피드의 범위 (좋아요, 댓글 수 변경 확인용)"""
+        if self.action != "list" or self.paginator is None:
+            return []
+        return caches.page_scopes(getattr(self.paginator, "page", None))
+
+    def get_cached_response(self, scopes, func, request, *args, **kwargs):
+        # 비로그인 사용자만 응답 캐시 사용
+        if request.user.is_authenticated or scopes is None:
+            return func(request, *args, **kwargs)
+        cache_key = caches.response_key(request, self.action, scopes)
+        cached = cache.get(cache_key)
+        if cached is not None and caches.is_fresh(cached):
+            caches.record(hit=True)
+            resp = response.Response(cached["data"])
+            resp["X-Cache"] = "HIT"
+            return resp
+        caches.record(hit=False)
+        # 새 세대 값의 키에 저장하므로 지연된 복제본의 이전 내용이 남지 않도록 기본 DB 에서 조회
+        with use_primary():
+            resp = func(request, *args, **kwargs)
+        if resp.status_code == 200:
+            entry = caches.response_entry(resp.data, self.get_page_scopes())
+            if cached is None:
+                # 세대 값이 키에 포함되어 내용이 바뀌지 않으므로 add (다른 워커의 L1 유지)
+                cache.add(cache_key, entry, timeout=caches.FEED_RESPONSE_TIMEOUT)
+            else:
+                cache.set(cache_key, entry, timeout=caches.FEED_RESPONSE_TIMEOUT)
+        resp["X-Cache"] = "MISS"
+        return resp
+
+    async def aget_cached_response(self, scopes, func, request, *args, **kwargs):
+        if request.user.is_authenticated or scopes is None:
+            return await func(request, *args, **kwargs)
+        cache_key = await caches.aresponse_key(request, self.action, scopes)
+        cached = await cache.aget(cache_key)
+        if cached is not None and await caches.ais_fresh(cached):
+            await caches.arecord(hit=True)
+            resp = response.Response(cached["data"])
+            resp["X-Cache"] = "HIT"
+            return resp
+        with use_primary():
+            resp = await func(request, *args, **kwargs)
+        if resp is None:
+            return None
+        await caches.arecord(hit=False)
+        if resp.status_code == 200:
+            entry = await caches.aresponse_entry(resp.data, self.get_page_scopes())
+            if cached is None:
+                await cache.aadd(cache_key, entry, timeout=caches.FEED_RESPONSE_TIMEOUT)
+            else:
+                await cache.aset(cache_key, entry, timeout=caches.FEED_RESPONSE_TIMEOUT)
+        resp["X-Cache"] = "MISS"
+        return resp
+
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        func = self.fast_list if self.use_fast_read_path() else super().list
+        return self.get_cached_response(
+            caches.list_scopes(request), func, request, *args, **kwargs
+        )
+
+    async def alist(self, request, *args, **kwargs):
+        if self.use_fast_read_path():
+            func = self.afast_list
+        else:
+            func = sync_to_async(super().list)
+        return await self.aget_cached_response(
+            caches.list_scopes(request), func, request, *args, **kwargs
+        )
 
     def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
+        func = self.fast_retrieve if self.use_fast_read_path() else super().retrieve
+        return self.get_cached_response(
+            caches.detail_scopes(kwargs.get("pk")),
+            func,
+            request,
+            *args,
+            **kwargs,
+        )
+
+    async def aretrieve(self, request, *args, **kwargs):
+        if self.use_fast_read_path():
+            func = self.afast_retrieve
+        else:
+            func = sync_to_async(super().retrieve)
+        return await self.aget_cached_response(
+            caches.detail_scopes(kwargs.get("pk")),
+            func,
+            request,
+            *args,
+            **kwargs,
+        )
+
+    def plan_retrieve(self, request, pk):
+        """피드 상세 조회 계획 (없는 피드, 잘못된 UUID 는 get_object() 와 같은 404)"""
+        try:
+            pk = Feed._meta.pk.to_python(pk)
+        except ValidationError:
+            raise Http404
+        names = self.get_read_fields()
+        rows = yield project_feeds(self.queryset.filter(pk=pk), names)
+        if not rows:
+            raise Http404(f"No {Feed._meta.object_name} matches the given query.")
+        data = yield from render_feeds(rows, request.user, names)
+        return data[0]
+
+    def fast_retrieve(self, request, *args, **kwargs):
+        data = run_queries(self.plan_retrieve(request, kwargs["pk"]))
+        return response.Response(data)
+
+    async def afast_retrieve(self, request, *args, **kwargs):
+        data = await arun_queries(self.plan_retrieve(request, kwargs["pk"]))
+        return response.Response(data)
 
     def update(self, request, *args, **kwargs):
         return super().update(request, *args, **kwargs)
@@ -103,23 +278,27 @@ class FeedViewSet(
         return super().destroy(request, *args, **kwargs)
 
 
-class FeedLikeViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
+class FeedLikeViewSet(
+    IdentityMapMixin, viewsets.GenericViewSet, mixins.CreateModelMixin
+):
     """피드 좋아요 뷰셋"""
 
     queryset = FeedLike.objects.all()
     serializer_class = FeedLikeSerializer
     permission_classes = [IsAuthenticated]
     throttle_scope = "feed_like:all"
-    throttle_classes = [ScopedRateThrottle]
+    throttle_classes = [ScopedTokenBucketThrottle]
 
     def get_current_feed(self):
-        return Feed.objects.get(uuid=self.kwargs["feed_uuid"])
+        return self.identity_map.get(Feed, self.kwargs["feed_uuid"])
 
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
 
 
-class FeedReportViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
+class FeedReportViewSet(
+    IdentityMapMixin, viewsets.GenericViewSet, mixins.CreateModelMixin
+):
     """피드 신고 뷰셋"""
 
     queryset = FeedReport.objects.all()
@@ -127,7 +306,7 @@ class FeedReportViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
     permission_classes = [IsAuthenticated]
 
     def get_current_feed(self):
-        return Feed.objects.get(uuid=self.kwargs["feed_uuid"])
+        return self.identity_map.get(Feed, self.kwargs["feed_uuid"])
 
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
@@ -140,6 +319,35 @@ class LatestFeed(FeedView):
     link = "/feeds/"
     description = "Rust Korea 의 최신 피드"
 
+    def __call__(self, request, *args, **kwargs):
+        cache_key = caches.rss_key(request)
+        cached_data = cache.get(cache_key)
+        if cached_data is None:
+            # 다음 피드가 올라올 때까지 유지되므로 복제본이 아닌 기본 DB 에서 조회
+            resp = super().__call__(request, *args, **kwargs)
+            cached_data = {
+                "content": resp.content,
+                "content_type": resp["Content-Type"],
+                "etag": quote_etag(hashlib.md5(resp.content).hexdigest()),
+                # 최신 게시/수정 일시 (item_pubdate, item_updateddate 기준)
+                "last_modified": parse_http_date_safe(resp.get("Last-Modified", "")),
+            }
+            cache.add(cache_key, cached_data, timeout=None)
+        # 변경이 없으면 DB 조회 없이 304 응답
+        resp = get_conditional_response(
+            request,
+            etag=cached_data["etag"],
+            last_modified=cached_data["last_modified"],
+        )
+        if resp is None:
+            resp = HttpResponse(
+                cached_data["content"], content_type=cached_data["content_type"]
+            )
+        resp["ETag"] = cached_data["etag"]
+        if cached_data["last_modified"]:
+            resp["Last-Modified"] = http_date(cached_data["last_modified"])
+        return resp
+
     def items(self):
         return Feed.objects.filter(is_displayed=True).order_by("-published_at")[:10]
 
@@ -152,15 +360,21 @@ class LatestFeed(FeedView):
     def item_link(self, item):
         return item.get_absolute_url()
 
+    def item_pubdate(self, item):
+        return item.published_at
 
-class FeedSitemap(Sitemap):
-    """피드 사이트맵"""
+    def item_updateddate(self, item):
+        return item.updated_at
 
-    changefreq = "daily"
-    priority = 0.9
 
-    def items(self):
-        return Feed.objects.filter(is_displayed=True)
+class FeedSitemapView(View):
+    """피드 사이트맵 (build_sitemaps 로 미리 생성한 파일 제공)"""
 
-    def lastmod(self, obj):
-        return obj.updated_at
+    def get(self, request, section=None):
+        # 파일이 없거나 오래되었으면 생성 (SITEMAP_MAX_AGE, SITEMAP_MIN_AGE 참고)
+        sitemaps.refresh_sitemaps(settings.SITEMAP_BASE_URL)
+        filename = sitemaps.section_filename(section) if section else "sitemap.xml"
+        path = os.path.join(sitemaps.sitemap_root(), filename)
+        if not os.path.exists(path):
+            raise Http404
+        return FileResponse(open(path, "rb"), content_type="application/xml")
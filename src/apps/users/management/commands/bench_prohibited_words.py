@@ -0,0 +1,71 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.core.matcher import AhoCorasick
+
+
+def _hangul(length):
+    return "".join(chr(random.randint(0xAC00, 0xD7A3)) for _ in range(length))
+
+
+class Command(BaseCommand):
+    """금지어 검사 벤치마크
+
+    무작위 한글 금지어 목록과 게시글을 만들어 기존 방식(단어마다 `in` 검사)과
+    Aho-Corasick 오토마톤의 검사 시간을 비교합니다. DB 를 사용하지 않습니다.
+    """
+
+    help = "금지어 검사 시간(기존 방식 vs Aho-Corasick)을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--words", type=int, default=10_000)
+        parser.add_argument("--posts", type=int, default=200)
+        parser.add_argument("--length", type=int, default=1_000)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        words = list({_hangul(random.randint(2, 4)) for _ in range(options["words"])})
+        posts = [_hangul(options["length"]) for _ in range(options["posts"])]
+        # 일부 게시글에는 금지어를 넣어 검출 결과도 비교
+        for i in range(0, len(posts), 10):
+            word = random.choice(words)
+            at = random.randrange(options["length"] - len(word))
+            posts[i] = posts[i][:at] + word + posts[i][at + len(word) :]
+
+        started = time.perf_counter()
+        matcher = AhoCorasick(words)
+        build_ms = (time.perf_counter() - started) * 1000
+        self.stdout.write(
+            f"금지어 {len(words)}개, 노드 {len(matcher)}개 컴파일: {build_ms:.1f}ms"
+        )
+
+        naive = self._measure("기존 방식", posts, lambda post: self._naive(words, post))
+        automaton = self._measure("Aho-Corasick", posts, matcher.search)
+        if [found is None for found in naive] != [found is None for found in automaton]:
+            self.stderr.write("검출 결과가 다릅니다.")
+
+    def _naive(self, words, text):
+        for w in words:
+            if w in text:
+                return w
+        return None
+
+    def _measure(self, label, posts, search):
+        results = []
+        latencies = []
+        for post in posts:
+            started = time.perf_counter()
+            results.append(search(post))
+            latencies.append((time.perf_counter() - started) * 1000)
+        latencies.sort()
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        self.stdout.write(
+            f"{label}: 게시글 {len(posts)}개 ({len(posts[0])}자), "
+            f"p50 {statistics.median(latencies):.3f}ms, p95 {p95:.3f}ms, "
+            f"검출 {sum(found is not None for found in results)}건"
+        )
+        return results
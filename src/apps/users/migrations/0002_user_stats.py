@@ -0,0 +1,104 @@
+# Generated by Django 5.1.3 on 2026-10-18 12:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def create_user_stats(apps, schema_editor):
+    """기존 사용자의 통계 행을 실제 집계 값으로 생성"""
+    User = apps.get_model("users", "User")
+    UserStats = apps.get_model("users", "UserStats")
+    Feed = apps.get_model("feeds", "Feed")
+    FeedLike = apps.get_model("feeds", "FeedLike")
+    Comment = apps.get_model("comments", "Comment")
+    CommentLike = apps.get_model("comments", "CommentLike")
+
+    def count(model, fk, condition=Q()):
+        queryset = (
+            model.objects.filter(condition, **{fk: OuterRef("pk")})
+            .order_by()
+            .values(fk)
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        return Coalesce(Subquery(queryset), 0)
+
+    fields = {
+        "feeds_count": count(Feed, "user"),
+        "comments_count": count(Comment, "user"),
+        "likes_count": count(FeedLike, "user"),
+        "feed_likes_received": count(FeedLike, "feed__user", ~Q(user=F("feed__user"))),
+        "comment_likes_received": count(
+            CommentLike, "comment__user", ~Q(user=F("comment__user"))
+        ),
+        "comments_received": count(Comment, "feed__user", ~Q(user=F("feed__user"))),
+    }
+    rows = User.objects.annotate(**fields).values("pk", *fields)
+    UserStats.objects.bulk_create(
+        (
+            UserStats(user_id=row.pop("pk"), **row)
+            for row in rows.iterator(chunk_size=1_000)
+        ),
+        batch_size=1_000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+        ("feeds", "0005_feed_hot_score"),
+        ("comments", "0003_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "feeds_count",
+                    models.IntegerField(default=0, help_text="작성한 피드 수"),
+                ),
+                (
+                    "comments_count",
+                    models.IntegerField(default=0, help_text="작성한 댓글 수"),
+                ),
+                (
+                    "likes_count",
+                    models.IntegerField(default=0, help_text="좋아요한 피드 수"),
+                ),
+                (
+                    "feed_likes_received",
+                    models.IntegerField(default=0, help_text="받은 피드 좋아요 수"),
+                ),
+                (
+                    "comment_likes_received",
+                    models.IntegerField(default=0, help_text="받은 댓글 좋아요 수"),
+                ),
+                (
+                    "comments_received",
+                    models.IntegerField(default=0, help_text="내 피드에 달린 댓글 수"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "사용자 통계",
+                "verbose_name_plural": "사용자 통계들",
+                "db_table": "user_stats",
+            },
+        ),
+        migrations.RunPython(create_user_stats, migrations.RunPython.noop),
+    ]
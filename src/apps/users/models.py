@@ -1,9 +1,16 @@
+import time
+
 from django.conf import settings
 from django.contrib.auth.base_user import BaseUserManager
 from django.contrib.auth.models import AbstractUser
 from django.core.cache import cache
 from django.db import models
 
+from apps.core.matcher import AhoCorasick
+
+# 워커별로 컴파일한 금지어 오토마톤: (금지어 목록 버전, 오토마톤)
+_prohibited_matcher = (None, None)
+
 
 class UserManager(BaseUserManager):
     def create_user(self, email, password=None, **extra_fields):
@@ -68,23 +75,69 @@ class UserProfile(models.Model):
         verbose_name_plural = "사용자 프로필들"
 
 
+class UserStats(models.Model):
+    """사용자 활동 통계 (작성, 받은 반응 수를 증분 갱신)"""
+
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name="stats"
+    )
+    feeds_count = models.IntegerField(default=0, help_text="작성한 피드 수")
+    comments_count = models.IntegerField(default=0, help_text="작성한 댓글 수")
+    likes_count = models.IntegerField(default=0, help_text="좋아요한 피드 수")
+    feed_likes_received = models.IntegerField(
+        default=0, help_text="받은 피드 좋아요 수"
+    )
+    comment_likes_received = models.IntegerField(
+        default=0, help_text="받은 댓글 좋아요 수"
+    )
+    comments_received = models.IntegerField(
+        default=0, help_text="내 피드에 달린 댓글 수"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "user_stats"
+        verbose_name = "사용자 통계"
+        verbose_name_plural = "사용자 통계들"
+
+
 class ProhibitedWord(models.Model):
     """금지어"""
 
     word = models.CharField(max_length=50, unique=True, help_text="금지어")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    @staticmethod
+    def _version_key():
+        return f"prohibited_words:version:{settings.DJANGO_ENVIRONMENT}"
+
+    @classmethod
+    def get_matcher(cls) -> AhoCorasick:
+        """금지어 오토마톤 (목록 버전이 바뀐 경우에만 다시 컴파일)"""
+        global _prohibited_matcher
+        version = cache.get(cls._version_key())
+        if version is None:
+            cache.add(cls._version_key(), time.time_ns(), timeout=None)
+            version = cache.get(cls._version_key())
+        if _prohibited_matcher[0] != version:
+            words = list(cls.objects.values_list("word", flat=True))
+            _prohibited_matcher = (version, AhoCorasick(words))
+        return _prohibited_matcher[1]
+
+    @classmethod
+    def clear_cache(cls):
+        cache.delete(cls._version_key())
+
+    @classmethod
+    def find_word(cls, text: str) -> str | None:
+        """텍스트에 포함된 금지어 (없으면 None)"""
+        if not text:
+            return None
+        return cls.get_matcher().search(text)
+
     @classmethod
     def validate_word(cls, word: str) -> bool:
-        cache_key = f"prohibited_words:list:{settings.DJANGO_ENVIRONMENT}"
-        cached_data = cache.get(cache_key)
-        if not cached_data:
-            cached_data = cls.objects.values_list("word", flat=True)
-            cache.set(cache_key, cached_data, timeout=60 * 60)
-        for w in cached_data:
-            if w in word:
-                return True
-        return False
+        return cls.find_word(word) is not None
 
     class Meta:
         db_table = "prohibited_words"
@@ -0,0 +1,87 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.comments.models import Comment, CommentLike
+from apps.core import counters
+from apps.feeds.models import Feed, FeedLike
+
+from .models import ProhibitedWord, User, UserStats
+
+
+@receiver([post_save, post_delete], sender=ProhibitedWord)
+def clear_prohibited_word_cache(sender, **kwargs):
+    """금지어 변경 시 모든 워커의 오토마톤 재컴파일"""
+    transaction.on_commit(ProhibitedWord.clear_cache)
+
+
+@receiver(post_save, sender=User)
+def create_user_stats(sender, instance, created, raw=False, **kwargs):
+    """사용자 생성 시 통계 행 생성"""
+    if created and not raw:
+        UserStats.objects.get_or_create(user=instance)
+
+
+def _owner_id(instance, field_name):
+    """좋아요, 댓글 대상(피드, 댓글)의 작성자 ID (이미 로드된 경우 재조회하지 않음)"""
+    field = instance._meta.get_field(field_name)
+    if field.is_cached(instance):
+        return getattr(instance, field_name).user_id
+    return (
+        field.related_model.objects.filter(pk=getattr(instance, field.attname))
+        .values_list("user_id", flat=True)
+        .first()
+    )
+
+
+def _update_stats(instance, delta, own_field=None, received=None):
+    if own_field:
+        counters.increment(UserStats, instance.user_id, own_field, delta)
+    if received:
+        field_name, received_field = received
+        owner_id = _owner_id(instance, field_name)
+        # 자신의 글에 남긴 반응은 받은 수에서 제외
+        if owner_id is not None and owner_id != instance.user_id:
+            counters.increment(UserStats, owner_id, received_field, delta)
+
+
+@receiver([post_save, post_delete], sender=Feed)
+def update_feed_stats(sender, instance, created=False, raw=False, **kwargs):
+    """작성한 피드 수 갱신"""
+    if not raw and (created or kwargs["signal"] is post_delete):
+        _update_stats(instance, 1 if created else -1, "feeds_count")
+
+
+@receiver([post_save, post_delete], sender=Comment)
+def update_comment_stats(sender, instance, created=False, raw=False, **kwargs):
+    """작성한 댓글 수, 피드 작성자가 받은 댓글 수 갱신"""
+    if not raw and (created or kwargs["signal"] is post_delete):
+        _update_stats(
+            instance,
+            1 if created else -1,
+            "comments_count",
+            received=("feed", "comments_received"),
+        )
+
+
+@receiver([post_save, post_delete], sender=FeedLike)
+def update_feed_like_stats(sender, instance, created=False, raw=False, **kwargs):
+    """좋아요한 피드 수, 피드 작성자가 받은 좋아요 수 갱신"""
+    if not raw and (created or kwargs["signal"] is post_delete):
+        _update_stats(
+            instance,
+            1 if created else -1,
+            "likes_count",
+            received=("feed", "feed_likes_received"),
+        )
+
+
+@receiver([post_save, post_delete], sender=CommentLike)
+def update_comment_like_stats(sender, instance, created=False, raw=False, **kwargs):
+    """댓글 작성자가 받은 좋아요 수 갱신"""
+    if not raw and (created or kwargs["signal"] is post_delete):
+        _update_stats(
+            instance,
+            1 if created else -1,
+            received=("comment", "comment_likes_received"),
+        )
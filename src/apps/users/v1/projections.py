@@ -0,0 +1,10 @@
+from apps.core.projections import RAW, STR
+
+# UserProfileSerializer 출력 필드: (출력 키, 컬럼, 변환 함수)
+PROFILE_FIELDS = [
+    ("id", "id", RAW),
+    ("nickname", "nickname", STR),
+    ("introduction", "introduction", STR),
+    ("avatar", "avatar", STR),
+    ("scopes", "scopes", STR),
+]
@@ -2,10 +2,11 @@ from html import escape
 
 from rest_framework import serializers
 
+from apps.core.fieldsets import SparseFieldsetMixin
 from apps.users.models import UserProfile, ProhibitedWord
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """사용자 프로필 시리얼라이저"""
 
     def validate_nickname(self, attr):
@@ -22,6 +23,9 @@ class UserProfileSerializer(serializers.ModelSerializer):
     def validate_introduction(self, attr):
         if not attr:
             return None
+        # 금지어 필터링
+        if ProhibitedWord.find_word(attr):
+            raise serializers.ValidationError("소개에 금지어가 포함되어 있습니다.")
         return escape(attr, quote=True)
 
     class Meta:
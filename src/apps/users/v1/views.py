@@ -1,7 +1,8 @@
 from rest_framework import viewsets, mixins, exceptions, response
 from rest_framework.permissions import IsAuthenticated
 
-from apps.users.models import UserProfile
+from apps.core.asyncviews import AsyncReadMixin
+from apps.users.models import UserProfile, UserStats
 from apps.users.v1.serializers import UserProfileSerializer
 
 
@@ -32,16 +33,25 @@ class UserProfileViewSet(
         return super().partial_update(request, *args, **kwargs)
 
 
-class UserCountAPIView(viewsets.GenericViewSet):
+class UserCountAPIView(AsyncReadMixin, viewsets.GenericViewSet):
     """사용자 카운트 뷰셋"""
 
     permission_classes = [IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
-        return response.Response(
-            {
-                "feeds": request.user.feeds.count(),
-                "comments": request.user.comments.count(),
-                "likes": request.user.feed_likes.count(),
-            }
-        )
+        # 증분 갱신되는 통계 행 하나만 조회
+        stats, _ = UserStats.objects.get_or_create(user=request.user)
+        return response.Response(self.get_counts(stats))
+
+    async def aget(self, request, *args, **kwargs):
+        stats, _ = await UserStats.objects.aget_or_create(user=request.user)
+        return response.Response(self.get_counts(stats))
+
+    def get_counts(self, stats):
+        return {
+            "feeds": stats.feeds_count,
+            "comments": stats.comments_count,
+            "likes": stats.likes_count,
+            "likes_received": stats.feed_likes_received + stats.comment_likes_received,
+            "comments_received": stats.comments_received,
+        }
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "conf.settings")
+# 요청마다 DB 를 쓰는 스레드가 바뀌어 연결이 재사용되지 않고 쌓이므로 영구 연결을 사용하지 않음
+os.environ.setdefault("DATABASE_CONN_MAX_AGE", "0")
 
 application = get_asgi_application()
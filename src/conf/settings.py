@@ -47,6 +47,7 @@ INSTALLED_APPS = [
     "django.contrib.sitemaps",
     "rest_framework",
     "django_filters",
+    "apps.core",
     "apps.feeds",
     "apps.users",
     "apps.comments",
@@ -54,12 +55,12 @@ INSTALLED_APPS = [
     "allauth.account",
     "allauth.socialaccount",
     "allauth.socialaccount.providers.google",
-    "debug_toolbar",
     "django_extensions",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "apps.core.routers.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -67,9 +68,12 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "apps.core.middleware.AsyncWhiteNoiseMiddleware",
 ]
+# 동기 전용 미들웨어는 ASGI 에서 모든 요청을 스레드로 전환시키므로 DEBUG 에서만 사용
+if DEBUG:
+    INSTALLED_APPS.append("debug_toolbar")
+    MIDDLEWARE.insert(-1, "debug_toolbar.middleware.DebugToolbarMiddleware")
 
 ROOT_URLCONF = "conf.urls"
 
@@ -92,19 +96,127 @@ TEMPLATES = [
 WSGI_APPLICATION = "conf.wsgi.application"
 
 # 데이터베이스
+# SQLite 설정 프로필 (SQLITE_PROFILE=tuned|default, 비교: python manage.py bench_sqlite)
+# - WAL: 읽기와 쓰기가 서로 막지 않음, synchronous=NORMAL 은 WAL 에서 커밋마다 fsync 하지 않음
+#   (전원 장애 시 마지막 커밋이 유실될 수 있으나 DB 는 손상되지 않음)
+# - transaction_mode=IMMEDIATE: 트랜잭션 시작 시 쓰기 잠금을 잡아, 읽은 뒤 쓰기로 전환할 때
+#   잠금 대기 없이 바로 "database is locked" 가 발생하는 것을 방지
+# - timeout: 쓰기 잠금 대기 시간(초, busy_timeout)
+# - CONN_MAX_AGE: 연결 재사용 시간(초, DATABASE_CONN_MAX_AGE)
+#   WSGI 는 워커 스레드가 유지되어 연결을 재사용하므로 60 (연결마다 PRAGMA 실행을 줄임)
+#   ASGI(conf.asgi) 는 요청마다 스레드가 바뀌어 재사용되지 않으므로 0 이 기본값
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,  # KiB 단위 (64MiB)
+    "temp_store": "MEMORY",
+}
+SQLITE_PROFILES = {
+    "default": {},
+    "tuned": {
+        "CONN_MAX_AGE": int(os.environ.get("DATABASE_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "init_command": ";".join(
+                f"PRAGMA {name}={value}" for name, value in SQLITE_PRAGMAS.items()
+            ),
+            "transaction_mode": "IMMEDIATE",
+            "timeout": 20,
+        },
+    },
+}
+SQLITE_PROFILE = os.environ.get("SQLITE_PROFILE", "tuned")
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        **SQLITE_PROFILES[SQLITE_PROFILE],
     }
 }
 
+# 읽기 복제본 (apps.core.routers)
+# - DATABASE_REPLICAS: 복제본 SQLite 파일 경로 (쉼표로 구분)
+# - 로컬에서는 python manage.py replicate_databases --interval 1 로 기본 DB 를 복사
+# - 쓰기 후 DATABASE_REPLICA_PIN_SECONDS 동안은 같은 사용자의 조회도 기본 DB 사용
+DATABASE_REPLICAS = [
+    name for name in os.environ.get("DATABASE_REPLICAS", "").split(",") if name
+]
+for i, name in enumerate(DATABASE_REPLICAS):
+    DATABASES[f"replica{i}"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": name,
+        "TEST": {"MIRROR": "default"},
+        **SQLITE_PROFILES[SQLITE_PROFILE],
+    }
+DATABASE_ROUTERS = ["apps.core.routers.ReplicaRouter"]
+DATABASE_REPLICA_PIN_SECONDS = int(os.environ.get("DATABASE_REPLICA_PIN_SECONDS", "5"))
+
 # 캐시
+# - default: 워커별 메모리(L1) + 워커 간 공유 캐시(L2)
+#   set, delete 는 모든 워커의 L1 을 네임스페이스 단위로, incr 는 해당 키만 무효화
+# - shared: L2 (기본값은 SQLite 캐시, CACHE_BACKEND/CACHE_LOCATION 으로 변경)
+#   세대 값 incr, 잠금 add 가 워커 간에 원자적이어야 하므로 파일 캐시(FileBasedCache)는
+#   워커 하나로 실행할 때만 사용
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "BACKEND": "apps.core.cache.TieredCache",
+        "OPTIONS": {
+            "L2": "shared",
+            "L1_MAX_ENTRIES": 1_000,
+            "L1_TIMEOUT": 60,
+            "SYNC_INTERVAL": 1,
+        },
+    },
+    "shared": {
+        "BACKEND": os.environ.get("CACHE_BACKEND", "apps.core.cache.SQLiteCache"),
+        "LOCATION": os.environ.get("CACHE_LOCATION", str(BASE_DIR / "cache.sqlite3")),
+        "OPTIONS": {"MAX_ENTRIES": 10_000},
+    },
+}
+
+# 카운터 (좋아요, 댓글, 답글, 신고 수)
+# - AtomicCounter: 요청 트랜잭션 안에서 바로 반영
+# - BufferedCounter: 증감 값을 모아 FLUSH_INTERVAL 초마다 일괄 반영
+COUNTERS = {
+    "BACKEND": os.environ.get("COUNTER_BACKEND", "apps.core.counters.AtomicCounter"),
+    "OPTIONS": {},
+}
+if COUNTERS["BACKEND"].endswith("BufferedCounter"):
+    COUNTERS["OPTIONS"] = {
+        "buffer": "apps.core.counters.MemoryBuffer",
+        "flush_interval": float(os.environ.get("COUNTER_FLUSH_INTERVAL", "1.0")),
     }
+
+# 쓰기 (피드 작성, 좋아요, 댓글, 신고)
+# - DirectWriter: 요청 스레드에서 바로 트랜잭션 실행
+# - WriteFunnel: 프로세스당 쓰기 스레드 하나가 쓰기를 모아 한 트랜잭션으로 커밋
+#   (SQLite 쓰기 잠금 경합 감소, 비교: python manage.py bench_write_funnel)
+WRITES = {
+    "BACKEND": os.environ.get("WRITE_BACKEND", "apps.core.writes.DirectWriter"),
+    "OPTIONS": {},
 }
+if WRITES["BACKEND"].endswith("WriteFunnel"):
+    WRITES["OPTIONS"] = {
+        "max_batch": int(os.environ.get("WRITE_MAX_BATCH", "64")),
+    }
+
+# 요청 제한 토큰 버킷 저장소 (apps.core.throttling)
+# - SQLiteBucketStore: 같은 서버의 워커가 공유하는 SQLite 파일 (THROTTLE_LOCATION)
+# - MemoryBucketStore: 워커별 메모리
+THROTTLES = {
+    "BACKEND": os.environ.get(
+        "THROTTLE_BACKEND", "apps.core.throttling.SQLiteBucketStore"
+    ),
+    "OPTIONS": {},
+}
+if THROTTLES["BACKEND"].endswith("SQLiteBucketStore"):
+    THROTTLES["OPTIONS"] = {
+        "location": os.environ.get(
+            "THROTTLE_LOCATION", str(BASE_DIR / "throttle.sqlite3")
+        ),
+    }
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -155,7 +267,11 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
+    "DEFAULT_THROTTLE_CLASSES": [
+        "apps.core.throttling.AnonReadThrottle",
+    ],
     "DEFAULT_THROTTLE_RATES": {
+        "anon:read": os.environ.get("ANON_READ_THROTTLE_RATE", "120/minute"),
         "feed:create": "1/minute",
         "feed_like:all": "2/second",
         "comment:create": "1/second",
@@ -168,12 +284,31 @@ if DEBUG:
         "rest_framework.renderers.BrowsableAPIRenderer"
     )
 
+# 피드, 카테고리, 댓글 목록, 피드 상세, 사용자 카운트의 GET 을 async 뷰로 처리 (conf.asgi)
+# WSGI 로 실행하면 요청마다 이벤트 루프를 만들게 되므로 끄세요.
+ASYNC_READ_VIEWS = os.environ.get("ASYNC_READ_VIEWS", "True").lower() == "true"
+
+# 피드, 댓글 목록을 시리얼라이저 없이 values() 행에서 바로 변환 (응답 내용은 동일)
+# 선택 사항: python manage.py bench_read_path 로 비교한 뒤 켜세요.
+FAST_READ_PATH = os.environ.get("FAST_READ_PATH", "False").lower() == "true"
+
 LOGIN_REDIRECT_URL = "/"
 LOGOUT_REDIRECT_URL = "/"
 ACCOUNT_LOGOUT_ON_GET = True
 ACCOUNT_DEFAULT_HTTP_PROTOCOL = "https" if DJANGO_ENVIRONMENT != "local" else "http"
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
+# 사이트맵 (python manage.py build_sitemaps 로 생성)
+# 요청 시 파일이 SITEMAP_MAX_AGE 초보다 오래되었거나, 피드가 바뀐 뒤 파일이
+# SITEMAP_MIN_AGE 초보다 오래되었으면 다시 생성
+# (cron 등으로 build_sitemaps 를 주기적으로 실행하면 요청 중 생성을 피할 수 있음)
+SITEMAP_ROOT = BASE_DIR / "sitemaps"
+SITEMAP_MAX_AGE = int(os.environ.get("SITEMAP_MAX_AGE", "86400"))
+SITEMAP_MIN_AGE = int(os.environ.get("SITEMAP_MIN_AGE", "600"))
+SITEMAP_BASE_URL = (
+    f"{ACCOUNT_DEFAULT_HTTP_PROTOCOL}://{SERVER_DOMAIN or 'localhost:8000'}"
+)
+
 AUTH_USER_MODEL = "users.User"
 ACCOUNT_USER_MODEL_USERNAME_FIELD = None
 ACCOUNT_USERNAME_REQUIRED = False
@@ -1,14 +1,13 @@
 from allauth.account.views import LogoutView
 from django.conf import settings
 from django.contrib import admin
-from django.contrib.sitemaps.views import sitemap
 from django.http import HttpResponse
 from django.urls import path
 from django.urls.conf import include
 
 from django.shortcuts import render
 
-from apps.feeds.v1.views import LatestFeed, FeedSitemap
+from apps.feeds.v1.views import LatestFeed, FeedSitemapView
 
 
 urlpatterns = [
@@ -25,11 +24,11 @@ urlpatterns = [
         ),
     ),
     path("rss", LatestFeed(), name="latest_feed"),
+    path("sitemap.xml", FeedSitemapView.as_view(), name="sitemap"),
     path(
-        "sitemap.xml",
-        sitemap,
-        {"sitemaps": {"feeds": FeedSitemap}},
-        name="sitemap",
+        "sitemap-feeds-<int:section>.xml",
+        FeedSitemapView.as_view(),
+        name="sitemap_section",
     ),
     path("admin/", admin.site.urls),
     path("accounts/", include("allauth.socialaccount.providers.google.urls")),